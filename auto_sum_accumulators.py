@@ -0,0 +1,178 @@
+"""
+Mesin akumulasi untuk penjumlahan angka hasil parse.
+
+Semua mesin punya antarmuka yang sama sehingga parser, format_number_indonesian
+dan kode pemanggil tidak perlu tahu mesin mana yang dipakai:
+
+* ``add(negative, int_digits, frac_digits)`` menambah satu angka. ``int_digits``
+  dan ``frac_digits`` adalah string digit tanpa pemisah ribuan, paling banyak
+  ``MAX_TOKEN_DIGITS`` digit (token lebih panjang dilewati parser).
+* ``total()`` mengembalikan total dalam tipe asli mesin (int, Decimal atau float).
+* ``rounded()`` mengembalikan total yang dibulatkan ke int, dengan aturan yang sama
+  seperti ``round()`` bawaan Python (half-even).
+* ``copy()`` dan ``merge(other)`` untuk menyimpan/menggabungkan hasil parsial.
+
+Mesin yang tersedia:
+
+* ``fixed``   : fixed-point integer eksak (default). Nilai disimpan sebagai int
+                Python dengan skala 10**n, n mengikuti jumlah digit desimal
+                terpanjang yang pernah dilihat.
+* ``decimal`` : ``decimal.Decimal`` dengan presisi maksimum (eksak, lebih lambat).
+* ``kahan``   : float dengan penjumlahan terkompensasi (Neumaier); cepat dan jauh
+                lebih akurat daripada ``total += float`` biasa, tapi tidak eksak.
+"""
+import decimal
+
+DEFAULT_ENGINE = 'fixed'
+
+# Konteks dengan presisi maksimum agar penjumlahan Decimal tidak pernah dibulatkan.
+_DECIMAL_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                                   Emin=decimal.MIN_EMIN)
+
+# Tabel pangkat 10 untuk menghindari perhitungan 10**n berulang di hot path.
+_POW10 = [10 ** i for i in range(40)]
+
+
+def _pow10(n):
+    return _POW10[n] if n < len(_POW10) else 10 ** n
+
+
+class FixedPointAccumulator(object):
+    """Akumulator eksak berbasis int: total = units / 10**scale."""
+
+    name = 'fixed'
+    __slots__ = ('units', 'scale')
+
+    def __init__(self, units=0, scale=0):
+        self.units = units
+        self.scale = scale
+
+    def add(self, negative, int_digits, frac_digits=''):
+        digits = len(frac_digits)
+        if digits:
+            value = int(int_digits + frac_digits)
+        else:
+            value = int(int_digits)
+        if digits > self.scale:
+            self.units *= _pow10(digits - self.scale)
+            self.scale = digits
+        elif digits < self.scale:
+            value *= _pow10(self.scale - digits)
+        if negative:
+            self.units -= value
+        else:
+            self.units += value
+
+    def total(self):
+        if not self.scale:
+            return self.units
+        return decimal.Decimal(self.units).scaleb(-self.scale, _DECIMAL_CONTEXT)
+
+    def rounded(self):
+        if not self.scale:
+            return self.units
+        divisor = _pow10(self.scale)
+        quotient, remainder = divmod(self.units, divisor)
+        half = divisor // 2
+        if remainder > half or (remainder == half and quotient % 2):
+            quotient += 1
+        return quotient
+
+    def copy(self):
+        return FixedPointAccumulator(self.units, self.scale)
+
+    def merge(self, other):
+        if other.scale > self.scale:
+            self.units *= _pow10(other.scale - self.scale)
+            self.scale = other.scale
+        self.units += other.units * _pow10(self.scale - other.scale)
+        return self
+
+
+class DecimalAccumulator(object):
+    """Akumulator eksak berbasis decimal.Decimal (presisi tak terbatas praktis)."""
+
+    name = 'decimal'
+    __slots__ = ('value',)
+
+    def __init__(self, value=None):
+        self.value = decimal.Decimal(0) if value is None else value
+
+    def add(self, negative, int_digits, frac_digits=''):
+        if frac_digits:
+            number = decimal.Decimal(f"{int_digits}.{frac_digits}")
+        else:
+            number = decimal.Decimal(int_digits)
+        if negative:
+            self.value = _DECIMAL_CONTEXT.subtract(self.value, number)
+        else:
+            self.value = _DECIMAL_CONTEXT.add(self.value, number)
+
+    def total(self):
+        return self.value
+
+    def rounded(self):
+        return round(self.value)
+
+    def copy(self):
+        return DecimalAccumulator(self.value)
+
+    def merge(self, other):
+        self.value = _DECIMAL_CONTEXT.add(self.value, other.value)
+        return self
+
+
+class KahanAccumulator(object):
+    """Penjumlahan float terkompensasi (varian Neumaier dari algoritma Kahan)."""
+
+    name = 'kahan'
+    __slots__ = ('value', 'compensation')
+
+    def __init__(self, value=0.0, compensation=0.0):
+        self.value = value
+        self.compensation = compensation
+
+    def add(self, negative, int_digits, frac_digits=''):
+        if frac_digits:
+            number = float(f"{int_digits}.{frac_digits}")
+        else:
+            number = float(int_digits)
+        self.add_float(-number if negative else number)
+
+    def add_float(self, number):
+        total = self.value + number
+        if abs(self.value) >= abs(number):
+            self.compensation += (self.value - total) + number
+        else:
+            self.compensation += (number - total) + self.value
+        self.value = total
+
+    def total(self):
+        return self.value + self.compensation
+
+    def rounded(self):
+        return round(self.total())
+
+    def copy(self):
+        return KahanAccumulator(self.value, self.compensation)
+
+    def merge(self, other):
+        self.add_float(other.value)
+        self.add_float(other.compensation)
+        return self
+
+
+ENGINES = {
+    FixedPointAccumulator.name: FixedPointAccumulator,
+    DecimalAccumulator.name: DecimalAccumulator,
+    KahanAccumulator.name: KahanAccumulator,
+}
+
+
+def make_accumulator(engine=DEFAULT_ENGINE):
+    """Membuat akumulator baru berdasarkan nama mesin ('fixed', 'decimal', 'kahan')."""
+    try:
+        return ENGINES[engine]()
+    except KeyError:
+        raise ValueError(f"Unknown accumulator engine: {engine!r} "
+                         f"(choose from {', '.join(sorted(ENGINES))})")
@@ -0,0 +1,245 @@
+"""
+Sesi osascript persisten untuk menjalankan AppleScript tanpa spawn proses per panggilan.
+
+Satu proses ``osascript -l JavaScript`` dijalankan sekali dengan skrip server
+kecil (JXA) yang membaca request dari stdin dan menjalankan AppleScript lewat
+``NSAppleScript``. Skrip yang sama hanya dikompilasi sekali lalu disimpan
+di cache proses tersebut.
+
+Protokol (satu JSON per baris, UTF-8):
+    request : {"id": 1, "source": "<AppleScript>"}
+    response: {"id": 1, "ok": true, "result": "..."}
+              {"id": 1, "ok": false, "error": "..."}
+
+Transport bisa diganti (lihat ``ProcessTransport``) sehingga protokol, timeout
+dan logika restart bisa diuji di Linux terhadap proses echo palsu.
+"""
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+
+from auto_sum_log import get_logger
+
+# Server JXA: loop baca stdin, jalankan AppleScript (dikompilasi sekali per source).
+JXA_SERVER = r'''
+ObjC.import('Foundation');
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+var compiled = {};
+var buffer = '';
+function reply(obj) {
+    var line = $(JSON.stringify(obj) + '\n');
+    stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+function run(request) {
+    var script = compiled[request.source];
+    if (!script) {
+        script = $.NSAppleScript.alloc.initWithSource($(request.source));
+        var compileError = Ref();
+        if (!script.compileAndReturnError(compileError)) {
+            return {id: request.id, ok: false, error: JSON.stringify(ObjC.deepUnwrap(compileError[0]))};
+        }
+        compiled[request.source] = script;
+    }
+    var error = Ref();
+    var result = script.executeAndReturnError(error);
+    if (result.isNil()) {
+        return {id: request.id, ok: false, error: JSON.stringify(ObjC.deepUnwrap(error[0]))};
+    }
+    var text = result.stringValue;
+    return {id: request.id, ok: true, result: text.isNil() ? '' : text.js};
+}
+while (true) {
+    var data = stdin.availableData;
+    if (data.length === 0) { break; }
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+        var line = buffer.slice(0, newline);
+        buffer = buffer.slice(newline + 1);
+        if (line.length) { reply(run(JSON.parse(line))); }
+    }
+}
+'''
+
+OSASCRIPT_SERVER_ARGV = ['osascript', '-l', 'JavaScript', '-e', JXA_SERVER]
+DEFAULT_TIMEOUT = 5
+
+log = get_logger('applescript')
+
+
+class AppleScriptError(Exception):
+    """AppleScript gagal dikompilasi atau dijalankan."""
+
+
+class AppleScriptTimeout(AppleScriptError):
+    """Request tidak dijawab dalam batas waktu; proses server di-restart."""
+
+
+class AppleScriptServerUnavailable(AppleScriptError):
+    """Sesi server yang baru dimulai berhenti sebelum menjawab satu request pun."""
+
+
+class ProcessTransport(object):
+    """Transport berbasis proses anak: tulis baris ke stdin, baca baris dari stdout."""
+
+    def __init__(self, argv):
+        self._process = subprocess.Popen(
+            argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, encoding='utf-8', bufsize=1,
+        )
+        self._lines = queue.Queue()
+        reader = threading.Thread(target=self._read_lines, name="osascript-reader", daemon=True)
+        reader.start()
+
+    def _read_lines(self):
+        for line in self._process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # EOF: proses berhenti
+
+    @property
+    def alive(self):
+        return self._process.poll() is None
+
+    def write_line(self, line):
+        self._process.stdin.write(line + '\n')
+        self._process.stdin.flush()
+
+    def read_line(self, timeout):
+        """Satu baris respons; None bila proses berhenti. queue.Empty bila timeout."""
+        return self._lines.get(timeout=timeout)
+
+    def close(self):
+        try:
+            self._process.kill()
+            self._process.wait(timeout=1)
+        except Exception:
+            pass
+
+
+class ScriptRunner(object):
+    """Menjalankan AppleScript lewat satu sesi server yang hidup lama.
+
+    Server dimulai saat request pertama, di-restart otomatis bila crash atau
+    timeout. Aman dipanggil dari beberapa thread (request diserialkan).
+    """
+
+    def __init__(self, transport_factory=None):
+        self.transport_factory = transport_factory or (lambda: ProcessTransport(OSASCRIPT_SERVER_ARGV))
+        self._transport = None
+        self._answered = False  # Sesi sekarang sudah pernah menjawab (terbukti berfungsi)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    def _ensure_transport(self):
+        if self._transport is None or not self._transport.alive:
+            if self._transport is not None:
+                self._transport.close()
+                self.restarts += 1
+            self._transport = self.transport_factory()
+            self._answered = False
+        return self._transport
+
+    def _reset_transport(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+            self.restarts += 1
+
+    def run(self, source, timeout=DEFAULT_TIMEOUT):
+        """Menjalankan `source`; mengembalikan stdout skrip (string, sudah di-strip).
+
+        OSError dari transport_factory (mis. osascript tidak ada) diteruskan apa
+        adanya, dan sesi baru yang berhenti sebelum jawaban pertamanya menjadi
+        AppleScriptServerUnavailable, agar pemanggil bisa memakai fallback.
+        """
+        with self._lock:
+            while True:
+                transport = self._ensure_transport()
+                try:
+                    return self._request(transport, source, timeout)
+                except (OSError, EOFError) as e:
+                    fresh = not self._answered
+                    self._reset_transport()
+                    if fresh:
+                        raise AppleScriptServerUnavailable(f"AppleScript server failed to start: {e}")
+                    # Sesi yang sudah berjalan mati di tengah jalan: restart dan coba
+                    # sekali lagi (sesi baru itu gagal -> AppleScriptServerUnavailable)
+
+    def _request(self, transport, source, timeout):
+        request_id = next(self._ids)
+        transport.write_line(json.dumps({'id': request_id, 'source': source}))
+        while True:
+            try:
+                line = transport.read_line(timeout)
+            except queue.Empty:
+                # Status skrip yang menggantung tidak diketahui; mulai sesi baru
+                self._reset_transport()
+                raise AppleScriptTimeout(f"AppleScript timed out after {timeout} s")
+            if line is None:
+                raise EOFError("AppleScript server exited")
+            response = json.loads(line)
+            self._answered = True
+            if response.get('id') != request_id:
+                continue  # Sisa respons request lama
+            if not response.get('ok'):
+                raise AppleScriptError(response.get('error', 'unknown error'))
+            return (response.get('result') or '').strip()
+
+    def close(self):
+        with self._lock:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+
+
+_shared_runner = None
+_shared_runner_lock = threading.Lock()
+_one_shot = False  # True setelah sesi persisten terbukti tidak bisa dipakai di mesin ini
+
+
+def get_script_runner():
+    """ScriptRunner bersama untuk seluruh proses (dibuat saat pertama dipakai)."""
+    global _shared_runner
+    with _shared_runner_lock:
+        if _shared_runner is None:
+            _shared_runner = ScriptRunner()
+        return _shared_runner
+
+
+def run_applescript_once(source, timeout=DEFAULT_TIMEOUT):
+    """Fallback lama: satu proses `osascript -e` per panggilan."""
+    try:
+        process = subprocess.run(
+            ['osascript', '-e', source], capture_output=True, text=True, check=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        raise AppleScriptTimeout(f"AppleScript timed out after {timeout} s")
+    except subprocess.CalledProcessError as e:
+        raise AppleScriptError(e.stderr)
+    return process.stdout.strip()
+
+
+def run_applescript(source, timeout=DEFAULT_TIMEOUT):
+    """Menjalankan AppleScript lewat sesi persisten; fallback ke osascript sekali jalan.
+
+    Melempar AppleScriptError/AppleScriptTimeout bila skrip gagal.
+    """
+    global _one_shot
+    if sys.platform != 'darwin':
+        raise AppleScriptError("AppleScript execution requires macOS.")
+    if not _one_shot:
+        runner = get_script_runner()
+        try:
+            return runner.run(source, timeout)
+        except (AppleScriptServerUnavailable, OSError, ValueError) as e:
+            # Server tidak bisa dijalankan / protokol rusak: seterusnya pakai cara
+            # lama, daripada spawn server yang pasti gagal di setiap panggilan
+            log.warning("Persistent osascript session unavailable (%s); using one-shot osascript.", e)
+            _one_shot = True
+            runner.close()
+    return run_applescript_once(source, timeout)
@@ -0,0 +1,640 @@
+"""
+Benchmark sederhana untuk jalur penjumlahan Auto Sum (tanpa GUI, jalan di Linux).
+
+Pemakaian:
+    python3 auto_sum_bench.py suite [--shape mixed] [--megabytes 1] [--json hasil.json]
+                                    [--baseline lama.json] [--threshold 0.2]
+    python3 auto_sum_bench.py workload [--shape tsv] [--megabytes 1] > payload.txt
+    python3 auto_sum_bench.py accumulators [--values 1000000]
+    python3 auto_sum_bench.py polling [--megabytes 5] [--ticks 200]
+    python3 auto_sum_bench.py incremental [--rows 100000] [--steps 20]
+    python3 auto_sum_bench.py bulk [--sizes 1,10,100]
+    python3 auto_sum_bench.py parallel [--megabytes 20] [--workers 1,2,4,8]
+    python3 auto_sum_bench.py server [--clients 8] [--requests 500] [--depth 4] [--payload-kb 4]
+    python3 auto_sum_bench.py format [--calls 200000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from auto_sum_accumulators import ENGINES, make_accumulator
+from auto_sum_clipboard import ClipboardWatcher, MemoryClipboard
+import auto_sum_numpy
+import auto_sum_parallel
+from auto_sum_parser import NUMBER_PATTERN, IncrementalSummer, SumScanner, parse_token, sum_numbers
+from auto_sum_pipeline import ClipboardProcessor, SumPipeline
+
+WORKLOAD_SHAPES = ('tsv', 'prose', 'negative', 'malformed', 'mixed')
+
+
+def make_tokens(count, seed=42):
+    """Token (negative, int_digits, frac_digits) acak mirip kolom nilai rupiah."""
+    rng = random.Random(seed)
+    tokens = []
+    for _ in range(count):
+        int_digits = str(rng.randint(0, 999_999_999))
+        frac_digits = f"{rng.randint(0, 99):02d}" if rng.random() < 0.7 else ''
+        tokens.append((rng.random() < 0.1, int_digits, frac_digits))
+    return tokens
+
+
+def bench_accumulators(values=1_000_000, repeat=3):
+    """Mengukur biaya tiap mesin akumulasi, dalam detik per satu juta angka."""
+    tokens = make_tokens(values)
+    results = {}
+    for engine in sorted(ENGINES):
+        best = None
+        for _ in range(repeat):
+            accumulator = make_accumulator(engine)
+            add = accumulator.add
+            start = time.perf_counter()
+            for negative, int_digits, frac_digits in tokens:
+                add(negative, int_digits, frac_digits)
+            rounded = accumulator.rounded()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[engine] = (best * 1_000_000 / values, rounded)
+    return results
+
+
+def bench_polling(megabytes=5, ticks=200):
+    """Membandingkan biaya per tick: baca+bandingkan penuh vs probe ClipboardWatcher.
+
+    Clipboard berisi `megabytes` MB teks yang tidak berubah selama `ticks` tick
+    (kondisi idle yang paling umum).
+    """
+    line = "1.234.567,89\t-12.345\tKeterangan\n"
+    text = line * (megabytes * 1024 * 1024 // len(line))
+
+    clipboard = MemoryClipboard(text)
+    previous = clipboard.read()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        current = clipboard.read()
+        if current != previous:
+            previous = current
+    full_read = (time.perf_counter() - start) / ticks
+
+    clipboard = MemoryClipboard(text)
+    watcher = ClipboardWatcher(clipboard)
+    watcher.reset()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        watcher.poll()
+    probe = (time.perf_counter() - start) / ticks
+    return {'full_read': full_read, 'probe': probe}
+
+
+def make_rows(count, rng):
+    """Baris TSV ala Excel: nomor, tanggal, nilai rupiah dengan sen."""
+    rows = []
+    for _ in range(count):
+        value = f"{rng.randint(0, 99_999_999):,}".replace(',', '.')
+        rows.append(f"{rng.randint(1, 9999)}\t{value},{rng.randint(0, 99):02d}\n")
+    return "".join(rows)
+
+
+def bench_incremental(rows=100_000, steps=20, growth=0.01, seed=7):
+    """Seleksi yang terus diperpanjang: scan penuh vs IncrementalSummer.
+
+    Setiap langkah menambah `growth` x `rows` baris. Total kedua cara
+    dibandingkan di setiap langkah dan harus identik.
+    """
+    rng = random.Random(seed)
+    text = make_rows(rows, rng)
+    extensions = [make_rows(max(1, int(rows * growth)), rng) for _ in range(steps)]
+
+    full_time = incremental_time = 0.0
+    summer = IncrementalSummer()
+    summer.sum(text)
+    for extension in extensions:
+        text += extension
+        start = time.perf_counter()
+        expected = sum_numbers(text)
+        full_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = summer.sum(text)
+        incremental_time += time.perf_counter() - start
+
+        if (result.count, result.total, result.minimum, result.maximum) != \
+                (expected.count, expected.total, expected.minimum, expected.maximum):
+            raise AssertionError(f"incremental total {result!r} != full re-parse {expected!r}")
+    return {'full': full_time / steps, 'incremental': incremental_time / steps}
+
+
+def make_payload(megabytes, seed=11):
+    """Teks TSV sintetis sebesar kira-kira `megabytes` MB."""
+    rng = random.Random(seed)
+    block = make_rows(20_000, rng)
+    repeat = max(1, int(megabytes * 1024 * 1024 / len(block)))
+    return block * repeat
+
+
+def bench_bulk(sizes=(1, 10, 100)):
+    """Loop Python murni vs jalur NumPy (auto_sum_numpy) untuk paste besar.
+
+    Hasil kedua jalur dibandingkan dan harus identik (mesin 'fixed').
+    """
+    if not auto_sum_numpy.available():
+        raise SystemExit("NumPy is not installed; the bulk path is disabled.")
+    results = {}
+    for megabytes in sizes:
+        text = make_payload(megabytes)
+        start = time.perf_counter()
+        expected = SumScanner()._scan_python(text, 0, len(text)).result()
+        python_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = auto_sum_numpy.scan_bulk(SumScanner(), text, 0, len(text),
+                                          SumScanner._scan_python).result()
+        numpy_time = time.perf_counter() - start
+        if (result.count, result.total) != (expected.count, expected.total):
+            raise AssertionError(f"bulk total {result!r} != python total {expected!r}")
+        results[megabytes] = (python_time, numpy_time)
+    return results
+
+
+def bench_parallel(megabytes=20, workers=(1, 2, 4, 8), engine='fixed'):
+    """Parse serial vs paralel (auto_sum_parallel) untuk beberapa jumlah worker.
+
+    Total setiap konfigurasi dibandingkan dengan scan serial dan harus identik.
+    Pool worker dipanaskan dulu agar biaya start proses tidak ikut terukur.
+    """
+    text = make_payload(megabytes)
+    start = time.perf_counter()
+    expected = sum_numbers(text, engine=engine)
+    serial_time = time.perf_counter() - start
+
+    results = {}
+    for count in workers:
+        auto_sum_parallel.sum_numbers_parallel("1", engine=engine, workers=count, threshold=0)
+        start = time.perf_counter()
+        result = auto_sum_parallel.sum_numbers_parallel(text, engine=engine, workers=count)
+        elapsed = time.perf_counter() - start
+        if (result.count, result.total) != (expected.count, expected.total):
+            raise AssertionError(f"parallel total {result!r} != serial total {expected!r}")
+        results[count] = elapsed
+    auto_sum_parallel.shutdown()
+    return serial_time, results
+
+
+def _rupiah(rng, high=99_999_999, cents=True):
+    value = f"{rng.randint(0, high):,}".replace(',', '.')
+    return f"{value},{rng.randint(0, 99):02d}" if cents else value
+
+
+_PROSE = ("Total pembayaran bulan ini sebesar {} sudah diterima, sisa tagihan {} "
+          "akan dibayar minggu depan. Diskon {} berlaku sampai tanggal {}.\n")
+_MALFORMED = ("1.2.3,4,5", "12.34", "1,2,3", "..", ",,", "1.234.56", "-", "9.99.999")
+
+
+def make_workload(shape='mixed', megabytes=1.0, seed=3):
+    """Payload clipboard sintetis format Indonesia sebesar kira-kira `megabytes` MB.
+
+    Bentuk (`shape`):
+    * ``tsv``       : baris Excel (nomor, tanggal, keterangan, nilai rupiah).
+    * ``prose``     : kalimat dengan nominal di tengah teks.
+    * ``negative``  : kolom nilai dengan +/- 40% angka negatif.
+    * ``malformed`` : nilai valid bercampur token rusak seperti ``1.2.3,4,5``.
+    * ``mixed``     : campuran semua bentuk di atas.
+    """
+    if shape not in WORKLOAD_SHAPES:
+        raise ValueError(f"Unknown workload shape: {shape!r} (choose from {', '.join(WORKLOAD_SHAPES)})")
+    rng = random.Random(seed)
+    target = int(megabytes * 1024 * 1024)
+    shapes = WORKLOAD_SHAPES[:-1] if shape == 'mixed' else (shape,)
+    parts = []
+    size = 0
+    while size < target:
+        kind = rng.choice(shapes)
+        if kind == 'tsv':
+            line = (f"{rng.randint(1, 9999)}\t{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2024"
+                    f"\tPembayaran\t{_rupiah(rng)}\n")
+        elif kind == 'prose':
+            line = _PROSE.format(f"Rp {_rupiah(rng)}", _rupiah(rng, cents=False),
+                                 f"{rng.randint(1, 50)}%", f"{rng.randint(1, 28)}.")
+        elif kind == 'negative':
+            sign = '-' if rng.random() < 0.4 else ''
+            line = f"{sign}{_rupiah(rng)}\t{sign}{rng.randint(0, 999)}\n"
+        else:
+            line = f"{_rupiah(rng)}\t{rng.choice(_MALFORMED)}\t{_rupiah(rng, cents=False)}\n"
+        parts.append(line)
+        size += len(line)
+    return "".join(parts)
+
+
+def _best_of(repeat, function):
+    """Waktu terbaik (detik) dari `repeat` kali menjalankan `function()`, plus hasil terakhirnya."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def _load_formatter():
+    from auto_sum_format import format_number_indonesian
+    return format_number_indonesian
+
+
+def _legacy_format_indonesian(number, decimal_places=0):
+    # Implementasi lama (tiga str.replace lewat placeholder), hanya untuk pembanding
+    formatted_us = f"{number:,.{max(0, decimal_places)}f}"
+    temp_replace = formatted_us.replace(',', 'TEMP_THOUSANDS')
+    temp_replace = temp_replace.replace('.', ',')
+    final_formatted = temp_replace.replace('TEMP_THOUSANDS', '.')
+    if decimal_places == 0 and final_formatted.endswith(",0"):
+        final_formatted = final_formatted[:-2]
+    return final_formatted
+
+
+def make_format_values(count, seed=5):
+    """Campuran nilai seperti keluaran mesin akumulasi: int (jumlah dibulatkan), float, Decimal."""
+    from decimal import Decimal
+    rng = random.Random(seed)
+    values = []
+    for index in range(count):
+        cents = rng.randint(-10 ** 11, 10 ** 13)
+        kind = index % 3
+        values.append(cents // 100 if kind == 0 else cents / 100 if kind == 1 else Decimal(cents).scaleb(-2))
+    return values
+
+
+def bench_format(calls=200_000, repeat=3, parse_megabytes=1.0):
+    """Formatter lama (placeholder-swap) vs profil lokal, plus throughput parse per profil.
+
+    Keluaran profil 'id' dibandingkan dengan formatter lama dan harus identik.
+    Hasil: {'format': {nama: detik per panggilan}, 'parse': {profil: MB/s}}.
+    """
+    from auto_sum_format import PROFILES
+
+    values = make_format_values(calls)
+    formatters = {'legacy': _legacy_format_indonesian}
+    formatters.update((f"profile:{name}", profile.format) for name, profile in PROFILES.items())
+    timings = {}
+    outputs = {}
+    for name, format_number in formatters.items():
+        for places in (0, 2):
+            elapsed, outputs[name, places] = _best_of(
+                repeat, lambda: [format_number(value, places) for value in values])
+            timings[f"{name} ({places} dp)"] = elapsed / calls
+    for places in (0, 2):
+        if outputs['legacy', places] != outputs['profile:id', places]:
+            raise AssertionError("profile 'id' output differs from the legacy formatter")
+
+    parse = {}
+    rng = random.Random(9)
+    for name, profile in PROFILES.items():
+        lines = []
+        size = 0
+        while size < parse_megabytes * 1024 * 1024:
+            line = '\t'.join(profile.format(rng.randint(-10 ** 9, 10 ** 11) / 100, 2) for _ in range(6)) + '\n'
+            lines.append(line)
+            size += len(line)
+        text = ''.join(lines)
+        elapsed, result = _best_of(repeat, lambda: profile.sum_numbers(text))
+        if result.count != 6 * len(lines):
+            raise AssertionError(f"profile {name!r} parsed {result.count} of {6 * len(lines)} numbers")
+        parse[name] = size / 1024 / 1024 / elapsed
+    return {'format': timings, 'parse': parse}
+
+
+def bench_stages(text, engine='fixed', repeat=3, format_calls=10_000):
+    """Durasi tiap tahap jalur penjumlahan secara terpisah, dalam detik.
+
+    * ``extraction`` : scan regex dan validasi token saja.
+    * ``conversion`` : token valid menjadi float (min/max).
+    * ``summation``  : token valid ke mesin akumulasi `engine`.
+    * ``format``     : satu panggilan format_number_indonesian (rata-rata).
+    * ``total``      : sum_numbers() lengkap untuk perbandingan.
+    """
+    def extract():
+        tokens = []
+        for match in NUMBER_PATTERN.finditer(text):
+            sign, int_part, frac_part = match.groups('')
+            if int_part:
+                tokens.append((sign == '-', int_part.replace('.', ''), frac_part))
+        return tokens
+
+    def convert():
+        return [parse_token(int_digits, frac_digits) for _, int_digits, frac_digits in tokens]
+
+    def accumulate():
+        accumulator = make_accumulator(engine)
+        add = accumulator.add
+        for negative, int_digits, frac_digits in tokens:
+            add(negative, int_digits, frac_digits)
+        return accumulator.rounded()
+
+    extraction, tokens = _best_of(repeat, extract)
+    conversion, _ = _best_of(repeat, convert)
+    summation, rounded = _best_of(repeat, accumulate)
+    total, result = _best_of(repeat, lambda: sum_numbers(text, engine=engine))
+    if result.rounded != rounded or result.count != len(tokens):
+        raise AssertionError(f"stage total {rounded} != sum_numbers total {result.rounded}")
+
+    format_number = _load_formatter()
+    formatting, formatted = _best_of(repeat, lambda: [format_number(rounded) for _ in range(format_calls)])
+    return {
+        'tokens': len(tokens),
+        'extraction': extraction,
+        'conversion': conversion,
+        'summation': summation,
+        'format': formatting / format_calls,
+        'total': total,
+        'formatted': formatted[-1],
+    }
+
+
+def bench_end_to_end(text, events=20, osascript_ms=0.0, engine='fixed'):
+    """Latensi per perubahan clipboard lewat jalur check_clipboard, tanpa GUI.
+
+    Memakai objek yang sama dengan AutoSumApp.check_clipboard (ClipboardWatcher,
+    SumPipeline, ClipboardProcessor) dengan MemoryClipboard dan pengganti
+    osascript yang hanya tidur `osascript_ms` milidetik. Tiap event menyalin
+    payload berbeda (baris tambahan di akhir) lalu menunggu hasil worker.
+    Mengembalikan list latensi dalam detik.
+    """
+    def fake_osascript(*args):
+        if osascript_ms:
+            time.sleep(osascript_ms / 1000)
+        return True
+
+    def front_app():
+        fake_osascript()
+        return "Microsoft Word"
+
+    clipboard = MemoryClipboard()
+    watcher = ClipboardWatcher(clipboard)
+    watcher.reset()
+    format_number = _load_formatter()
+    pipeline = SumPipeline(ClipboardProcessor(
+        get_front_app=front_app,
+        paste_text=fake_osascript,
+        copy_text=clipboard.write,
+        format_number=format_number,
+        target_app_name="Microsoft Word",
+        engine=engine,
+        incremental=False,
+    ))
+    pipeline.start()
+    latencies = []
+    try:
+        for event in range(events):
+            clipboard.write(f"{text}{event},00\n")
+            start = time.perf_counter()
+            current = watcher.poll()
+            if current is None or pipeline.is_own_write(current):
+                raise AssertionError("clipboard change was not detected")
+            pipeline.submit(current)
+            while True:
+                finished = pipeline.drain()
+                if finished:
+                    break
+                time.sleep(0.0005)
+            latencies.append(time.perf_counter() - start)
+            if finished[-1].error is not None:
+                raise finished[-1].error
+            watcher.poll()  # Tulisan jumlah milik worker sendiri; diabaikan seperti di aplikasi
+    finally:
+        pipeline.stop(timeout=1.0)
+    return latencies
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_suite(shapes=WORKLOAD_SHAPES, megabytes=1.0, engine='fixed', repeat=3, events=20,
+              osascript_ms=0.0):
+    """Menjalankan benchmark tahap + end-to-end untuk tiap bentuk workload; hasil siap JSON."""
+    report = {
+        'revision': _git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'engine': engine,
+        'megabytes': megabytes,
+        'metrics': {},
+    }
+    for shape in shapes:
+        text = make_workload(shape, megabytes)
+        stages = bench_stages(text, engine, repeat)
+        latencies = bench_end_to_end(text, events, osascript_ms, engine)
+        report['metrics'][shape] = {
+            'tokens': stages['tokens'],
+            'extraction_s': stages['extraction'],
+            'conversion_s': stages['conversion'],
+            'summation_s': stages['summation'],
+            'format_s': stages['format'],
+            'sum_numbers_s': stages['total'],
+            'e2e_p50_s': _percentile(latencies, 0.50),
+            'e2e_p95_s': _percentile(latencies, 0.95),
+        }
+    return report
+
+
+def compare_reports(report, baseline, threshold=0.2):
+    """Metrik waktu yang lebih lambat dari `baseline` lebih dari `threshold` (0.2 = 20%).
+
+    Mengembalikan list (shape, metrik, lama, baru); list kosong berarti tidak ada regresi.
+    """
+    regressions = []
+    for shape, metrics in report['metrics'].items():
+        old_metrics = baseline.get('metrics', {}).get(shape, {})
+        for name, value in metrics.items():
+            old = old_metrics.get(name)
+            if not name.endswith('_s') or not old:
+                continue
+            if value > old * (1 + threshold):
+                regressions.append((shape, name, old, value))
+    return regressions
+
+
+async def _load_client(path, payload, expected_count, requests, depth, latencies):
+    reader, writer = await asyncio.open_unix_connection(path)
+    request = b"LEN %d\n" % len(payload) + payload
+    try:
+        sent = 0
+        while sent < requests:
+            batch = min(depth, requests - sent)
+            start = time.perf_counter()
+            writer.write(request * batch)  # Pipelining: `batch` request sekaligus
+            await writer.drain()
+            for _ in range(batch):
+                response = json.loads(await reader.readline())
+                if not response.get('ok') or response['count'] != expected_count:
+                    raise AssertionError(f"unexpected server response: {response!r}")
+            latencies.append((time.perf_counter() - start) / batch)
+            sent += batch
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def bench_server(clients=8, requests=500, depth=4, payload_kb=4.0, engine='fixed'):
+    """Load test auto_sum_server: `clients` koneksi paralel, masing-masing `requests` request.
+
+    Server dijalankan sebagai proses terpisah. Setiap klien mengirim `depth`
+    request sekaligus (pipelining) lalu membaca jawabannya; jumlah angka di
+    setiap jawaban dicek. Mengembalikan requests/detik dan latensi per request.
+    """
+    payload = make_workload('mixed', payload_kb / 1024).encode('utf-8')
+    expected_count = sum_numbers(payload.decode('utf-8')).count
+    path = os.path.join(tempfile.mkdtemp(), "auto_sum_bench.sock")
+    server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                            'auto_sum_server.py'),
+                               '--socket', path, '--engine', engine, '--log-level', 'WARNING'])
+    try:
+        deadline = time.monotonic() + 10
+        while not os.path.exists(path):
+            if time.monotonic() > deadline or server.poll() is not None:
+                raise RuntimeError("auto_sum_server did not start")
+            time.sleep(0.02)
+
+        latencies = []
+
+        async def run_clients():
+            await asyncio.gather(*(
+                _load_client(path, payload, expected_count, requests, depth, latencies)
+                for _ in range(clients)
+            ))
+
+        start = time.perf_counter()
+        asyncio.run(run_clients())
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait(timeout=5)
+    total = clients * requests
+    return {
+        'requests': total,
+        'seconds': elapsed,
+        'requests_per_second': total / elapsed,
+        'megabytes_per_second': total * len(payload) / elapsed / 1024 / 1024,
+        'latency_p50_s': _percentile(latencies, 0.50),
+        'latency_p95_s': _percentile(latencies, 0.95),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auto Sum benchmarks")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    acc = subparsers.add_parser('accumulators', help="cost per million values per engine")
+    acc.add_argument('--values', type=int, default=1_000_000)
+    acc.add_argument('--repeat', type=int, default=3)
+    poll = subparsers.add_parser('polling', help="per-tick cost of clipboard change detection")
+    poll.add_argument('--megabytes', type=int, default=5)
+    poll.add_argument('--ticks', type=int, default=200)
+    inc = subparsers.add_parser('incremental', help="growing selection: full re-parse vs delta")
+    inc.add_argument('--rows', type=int, default=100_000)
+    inc.add_argument('--steps', type=int, default=20)
+    bulk = subparsers.add_parser('bulk', help="pure-Python loop vs NumPy bulk parser")
+    bulk.add_argument('--sizes', default='1,10,100', help="payload sizes in MB, comma separated")
+    par = subparsers.add_parser('parallel', help="serial vs multi-core parse per worker count")
+    par.add_argument('--megabytes', type=float, default=20)
+    par.add_argument('--workers', default='1,2,4,8', help="worker counts, comma separated")
+    suite = subparsers.add_parser('suite', help="per-stage + end-to-end timings as JSON")
+    suite.add_argument('--shape', default='all', help=f"{', '.join(WORKLOAD_SHAPES)} or all")
+    suite.add_argument('--megabytes', type=float, default=1.0)
+    suite.add_argument('--engine', default='fixed', choices=sorted(ENGINES))
+    suite.add_argument('--repeat', type=int, default=3)
+    suite.add_argument('--events', type=int, default=20, help="clipboard changes for the end-to-end run")
+    suite.add_argument('--osascript-ms', type=float, default=0.0, help="simulated osascript latency")
+    suite.add_argument('--json', help="write the report to this file (default: stdout)")
+    suite.add_argument('--baseline', help="earlier JSON report to compare against")
+    suite.add_argument('--threshold', type=float, default=0.2,
+                       help="allowed slowdown vs the baseline before failing (0.2 = 20%%)")
+    serve = subparsers.add_parser('server', help="load test the Unix socket server (requests/sec)")
+    serve.add_argument('--clients', type=int, default=8)
+    serve.add_argument('--requests', type=int, default=500, help="requests per client")
+    serve.add_argument('--depth', type=int, default=4, help="pipelined requests in flight per client")
+    serve.add_argument('--payload-kb', type=float, default=4.0)
+    fmt = subparsers.add_parser('format', help="legacy formatter vs locale profiles; parse MB/s per profile")
+    fmt.add_argument('--calls', type=int, default=200_000)
+    fmt.add_argument('--parse-megabytes', type=float, default=1.0)
+    work = subparsers.add_parser('workload', help="write a synthetic clipboard payload to stdout")
+    work.add_argument('--shape', default='mixed', choices=WORKLOAD_SHAPES)
+    work.add_argument('--megabytes', type=float, default=1.0)
+    work.add_argument('--seed', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command == 'accumulators':
+        print(f"{'engine':<10} {'s / 1M values':>14}  rounded total")
+        for engine, (seconds, rounded) in bench_accumulators(args.values, args.repeat).items():
+            print(f"{engine:<10} {seconds:>14.3f}  {rounded}")
+    elif args.command == 'polling':
+        for mode, seconds in bench_polling(args.megabytes, args.ticks).items():
+            print(f"{mode:<10} {seconds * 1e6:>12.1f} us / tick")
+    elif args.command == 'incremental':
+        for mode, seconds in bench_incremental(args.rows, args.steps).items():
+            print(f"{mode:<12} {seconds * 1e3:>10.2f} ms / step (totals identical)")
+    elif args.command == 'bulk':
+        sizes = [float(size) for size in args.sizes.split(',')]
+        print(f"{'MB':>6} {'python s':>10} {'numpy s':>10} {'speedup':>8}")
+        for megabytes, (python_time, numpy_time) in bench_bulk(sizes).items():
+            print(f"{megabytes:>6g} {python_time:>10.3f} {numpy_time:>10.3f} "
+                  f"{python_time / numpy_time:>7.1f}x")
+    elif args.command == 'suite':
+        shapes = WORKLOAD_SHAPES if args.shape == 'all' else tuple(args.shape.split(','))
+        report = run_suite(shapes, args.megabytes, args.engine, args.repeat, args.events,
+                           args.osascript_ms)
+        output = json.dumps(report, indent=2)
+        if args.json:
+            with open(args.json, 'w') as f:
+                f.write(output + '\n')
+        else:
+            print(output)
+        if args.baseline:
+            with open(args.baseline) as f:
+                regressions = compare_reports(report, json.load(f), args.threshold)
+            for shape, name, old, new in regressions:
+                print(f"REGRESSION {shape}.{name}: {old * 1e3:.3f} ms -> {new * 1e3:.3f} ms "
+                      f"(+{new / old - 1:.0%})", file=sys.stderr)
+            if regressions:
+                raise SystemExit(1)
+    elif args.command == 'server':
+        stats = bench_server(args.clients, args.requests, args.depth, args.payload_kb)
+        print(f"{stats['requests']} requests in {stats['seconds']:.2f} s: "
+              f"{stats['requests_per_second']:.0f} req/s, {stats['megabytes_per_second']:.1f} MB/s")
+        print(f"latency per request: p50 {stats['latency_p50_s'] * 1e3:.2f} ms, "
+              f"p95 {stats['latency_p95_s'] * 1e3:.2f} ms")
+    elif args.command == 'format':
+        report = bench_format(args.calls, parse_megabytes=args.parse_megabytes)
+        print(f"{'formatter':<22} {'ns / call':>10}")
+        for name, seconds in report['format'].items():
+            print(f"{name:<22} {seconds * 1e9:>10.0f}")
+        print(f"{'parse profile':<22} {'MB/s':>10}")
+        for name, mb_s in report['parse'].items():
+            print(f"{name:<22} {mb_s:>10.1f}")
+    elif args.command == 'workload':
+        sys.stdout.write(make_workload(args.shape, args.megabytes, args.seed))
+    elif args.command == 'parallel':
+        workers = [int(count) for count in args.workers.split(',')]
+        serial_time, results = bench_parallel(args.megabytes, workers)
+        print(f"CPU cores: {os.cpu_count()}, serial: {serial_time:.3f} s")
+        print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+        for count, seconds in results.items():
+            print(f"{count:>8} {seconds:>10.3f} {serial_time / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Cache LRU hasil penjumlahan per isi clipboard.
+
+Pengguna sering bolak-balik menyalin beberapa range yang sama; dengan cache
+ini parse dan format untuk isi yang sama tidak diulang. Kunci cache adalah
+digest cepat (panjang + hash string Python, yang di-cache di objek string).
+Isi clipboard ikut disimpan agar tabrakan hash tidak mungkin mengembalikan
+jumlah yang salah; karena itu memori dibatasi dengan jumlah entri *dan*
+total ukuran payload.
+
+Set ``AUTO_SUM_CACHE_BYPASS=1`` (atau ``cache.bypass = True``) untuk debug.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
+def _env_flag(name):
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class CachedSum(object):
+    """Satu entri cache: hasil parse dan string jumlah yang sudah diformat.
+
+    Untuk paste tabel, `table` berisi TableResult (lihat auto_sum_table.py)
+    agar pilihan kolom bisa diganti tanpa parse ulang.
+    """
+
+    __slots__ = ('payload', 'result', 'formatted', 'table', 'size')
+
+    def __init__(self, payload, result, formatted, table=None):
+        self.payload = payload
+        self.result = result
+        self.formatted = formatted
+        self.table = table
+        self.size = sys.getsizeof(payload) + sys.getsizeof(formatted)
+
+
+class ResultCache(object):
+    """Cache LRU yang dibatasi `max_entries` entri dan `max_bytes` byte payload."""
+
+    def __init__(self, max_entries=32, max_bytes=16 * 1024 * 1024, bypass=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bypass = _env_flag('AUTO_SUM_CACHE_BYPASS') if bypass is None else bypass
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(text):
+        return (len(text), hash(text))
+
+    def get(self, text):
+        """CachedSum untuk `text`, atau None bila belum ada (atau cache di-bypass)."""
+        if self.bypass:
+            return None
+        key = self.digest(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.payload != text:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, text, result, formatted, table=None):
+        if self.bypass:
+            return
+        entry = CachedSum(text, result, formatted, table)
+        if entry.size > self.max_bytes:
+            return  # Payload lebih besar dari seluruh anggaran cache
+        key = self.digest(text)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._entries[key] = entry
+            self.bytes += entry.size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hit_rate, 3),
+            'bypass': self.bypass,
+        }
+
+    def summary(self):
+        """Ringkasan pendek untuk item menu status bar."""
+        if self.bypass:
+            return "Cache: dimatikan (bypass)"
+        return (f"Cache: {self.hit_rate:.0%} hit, {len(self._entries)} entri, "
+                f"{self.bytes / 1024:.0f} KB")
@@ -0,0 +1,169 @@
+"""
+Backend clipboard dengan probe murah "apakah clipboard berubah?".
+
+Setiap backend punya antarmuka yang sama:
+
+* ``probe()``  : token murah yang berubah setiap kali isi clipboard berubah.
+* ``read()``   : membaca seluruh isi clipboard (mahal untuk isi besar).
+* ``write(text)``: menulis teks ke clipboard.
+* ``has_change_count``: True bila token adalah change counter sungguhan (naik
+  di setiap tulis, juga bila isinya sama), False bila turunan dari isi.
+
+``ClipboardWatcher`` hanya memanggil ``read()`` bila token dari ``probe()``
+berubah, jadi isi clipboard multi-megabyte tidak dibaca dan dibandingkan
+ulang setiap detik.
+
+Backend yang tersedia:
+
+* ``PasteboardClipboard``: NSPasteboard (AppKit, ikut terpasang bersama rumps).
+  Token = ``changeCount``, benar-benar O(1).
+* ``PyperclipClipboard`` : fallback lewat pyperclip. pyperclip tidak punya
+  change counter, jadi probe tetap membaca isi clipboard; hasil baca disimpan
+  agar ``read()`` berikutnya tidak membaca ulang.
+* ``MemoryClipboard``    : pengganti di memori untuk benchmark/uji di Linux,
+  opsional dengan jeda tulis untuk meniru pasteboard yang lambat.
+"""
+import sys
+
+
+class MemoryClipboard(object):
+    """Clipboard di memori dengan change counter, meniru NSPasteboard.
+
+    Isi disimpan sebagai bytes UTF-8 dan di-decode setiap ``read()`` sehingga,
+    seperti clipboard sungguhan, setiap baca menghasilkan string baru.
+
+    Dengan `write_lag` > 0, tulisan baru terlihat setelah sekian panggilan
+    ``probe()``/``read()`` berikutnya, meniru pasteboard yang belum selesai
+    diperbarui saat tulis kembali (untuk menguji konfirmasi tulis di Linux).
+    """
+
+    has_change_count = True
+
+    def __init__(self, text="", write_lag=0):
+        self._data = text.encode('utf-8')
+        self.change_count = 0
+        self.reads = 0
+        self.writes = 0
+        self.write_lag = write_lag
+        self._pending = None  # (data, sisa panggilan sampai terlihat)
+
+    def _settle(self):
+        if self._pending is not None:
+            data, remaining = self._pending
+            if remaining <= 0:
+                self._data = data
+                self.change_count += 1
+                self._pending = None
+            else:
+                self._pending = (data, remaining - 1)
+
+    def probe(self):
+        self._settle()
+        return self.change_count
+
+    def read(self):
+        self._settle()
+        self.reads += 1
+        return self._data.decode('utf-8')
+
+    def write(self, text):
+        self.writes += 1
+        if self.write_lag > 0:
+            self._pending = (text.encode('utf-8'), self.write_lag)
+            return
+        self._data = text.encode('utf-8')
+        self.change_count += 1
+
+
+class PyperclipClipboard(object):
+    """Backend pyperclip. Token = (panjang, hash) dari isi yang dibaca saat probe."""
+
+    has_change_count = False
+
+    def __init__(self):
+        import pyperclip
+        self._pyperclip = pyperclip
+        self._last_text = None
+
+    def probe(self):
+        text = self._pyperclip.paste()
+        self._last_text = text
+        if text is None:
+            return None
+        return (len(text), hash(text))
+
+    def read(self):
+        text = self._last_text
+        if text is None:
+            return self._pyperclip.paste()
+        self._last_text = None  # Hanya dipakai sekali, setelah itu baca ulang
+        return text
+
+    def write(self, text):
+        self._pyperclip.copy(text)
+
+
+class PasteboardClipboard(object):
+    """Backend NSPasteboard; ``changeCount`` sebagai probe O(1)."""
+
+    has_change_count = True
+
+    def __init__(self):
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+        self._pasteboard = NSPasteboard.generalPasteboard()
+        self._type = NSPasteboardTypeString
+
+    def probe(self):
+        return self._pasteboard.changeCount()
+
+    def read(self):
+        text = self._pasteboard.stringForType_(self._type)
+        return "" if text is None else str(text)
+
+    def write(self, text):
+        self._pasteboard.clearContents()
+        self._pasteboard.setString_forType_(text, self._type)
+
+
+def get_default_clipboard():
+    """NSPasteboard di macOS bila AppKit tersedia, selain itu pyperclip."""
+    if sys.platform == 'darwin':
+        try:
+            return PasteboardClipboard()
+        except ImportError:
+            pass
+    return PyperclipClipboard()
+
+
+class ClipboardWatcher(object):
+    """Mendeteksi perubahan clipboard lewat probe; isi penuh hanya dibaca saat berubah.
+
+    `is_own(token)` opsional (mis. PasteCoordinator.is_own_token): perubahan
+    yang ditulis aplikasi sendiri dilewati tanpa membaca isi clipboard.
+    """
+
+    def __init__(self, backend, is_own=None):
+        self.backend = backend
+        self.is_own = is_own
+        self._last_token = None
+        self.probes = 0
+        self.changes = 0
+        self.own_writes = 0
+
+    def reset(self):
+        """Menjadikan isi clipboard saat ini sebagai baseline; mengembalikan isinya."""
+        self._last_token = self.backend.probe()
+        return self.backend.read()
+
+    def poll(self):
+        """Mengembalikan isi clipboard baru bila berubah sejak poll terakhir, selain itu None."""
+        self.probes += 1
+        token = self.backend.probe()
+        if token is None or token == self._last_token:
+            return None
+        self._last_token = token
+        if self.is_own is not None and self.is_own(token):
+            self.own_writes += 1
+            return None
+        self.changes += 1
+        return self.backend.read()
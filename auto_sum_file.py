@@ -0,0 +1,150 @@
+"""
+Penjumlahan angka format Indonesia dari file atau stdin, tanpa clipboard.
+
+    python3 auto_sum_file.py ledger.tsv export-2.csv    # total semua file
+    cat ledger.tsv | python3 auto_sum_file.py           # atau '-' untuk stdin
+    python3 auto_sum_file.py --json ledger.tsv          # hasil sebagai JSON
+
+File dibaca lewat ``mmap`` dan stdin per potongan berukuran tetap; setiap
+potongan diberikan ke StreamingSum (auto_sum_parser.py) sehingga token yang
+terbelah di batas potongan tetap dihitung benar dan memori yang dipakai
+konstan berapa pun besar file-nya (export ledger multi-gigabyte). Halaman
+mmap yang sudah di-scan dilepas lagi bila OS mendukung ``madvise``.
+
+Total yang dibulatkan dicetak ke stdout dalam format Indonesia (sama dengan
+yang di-paste aplikasi); ringkasan dan throughput (MB/s) ke stderr. Exit
+status 2 bila tidak ada angka sama sekali.
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+
+from auto_sum_accumulators import DEFAULT_ENGINE, ENGINES
+from auto_sum_format import format_number_indonesian, json_float
+from auto_sum_log import configure as configure_logging, get_logger
+from auto_sum_parser import StreamingSum
+
+CHUNK_BYTES = 8 * 1024 * 1024  # Cukup besar untuk jalur NumPy (lihat BULK_THRESHOLD_CHARS)
+STDIN_PATH = '-'
+
+log = get_logger('file')
+
+
+def _release(view, start, end):
+    """Melepas halaman mmap yang sudah di-scan agar RSS tidak ikut tumbuh."""
+    if not hasattr(mmap, 'MADV_DONTNEED'):
+        return
+    start -= start % mmap.PAGESIZE
+    if end > start:
+        try:
+            view.madvise(mmap.MADV_DONTNEED, start, end - start)
+        except OSError:
+            pass
+
+
+def feed_file(summer, path, chunk_bytes=CHUNK_BYTES):
+    """Memberikan isi file `path` ke `summer` per potongan lewat mmap; mengembalikan jumlah byte."""
+    with open(path, 'rb') as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size:
+            return 0  # mmap tidak bisa memetakan file kosong
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                view.madvise(mmap.MADV_SEQUENTIAL)
+            for start in range(0, size, chunk_bytes):
+                end = min(start + chunk_bytes, size)
+                summer.feed(view[start:end])
+                _release(view, start, end)
+    return size
+
+
+def feed_stream(summer, stream, chunk_bytes=CHUNK_BYTES):
+    """Memberikan isi stream biner (mis. stdin) ke `summer` per potongan; mengembalikan jumlah byte."""
+    total = 0
+    while True:
+        chunk = stream.read(chunk_bytes)
+        if not chunk:
+            return total
+        summer.feed(chunk)
+        total += len(chunk)
+
+
+def sum_inputs(paths, engine=DEFAULT_ENGINE, chunk_bytes=CHUNK_BYTES, stdin=None):
+    """Menjumlahkan semua angka di `paths` (``'-'`` = stdin) menjadi satu SumResult.
+
+    Mengembalikan (SumResult, total_byte, detik). Tiap input di-scan dengan
+    StreamingSum sendiri lalu digabung, jadi token tidak menyambung antar file.
+    """
+    scanner = None
+    total_bytes = 0
+    start = time.perf_counter()
+    for path in paths:
+        summer = StreamingSum(engine)
+        input_start = time.perf_counter()
+        if path == STDIN_PATH:
+            size = feed_stream(summer, stdin or sys.stdin.buffer, chunk_bytes)
+        else:
+            size = feed_file(summer, path, chunk_bytes)
+        summer.finish()
+        elapsed = time.perf_counter() - input_start
+        log.debug("%s: %d numbers, %d bytes in %.2f s", path, summer.scanner.count, size, elapsed)
+        total_bytes += size
+        if scanner is None:
+            scanner = summer.scanner
+        else:
+            scanner.merge(summer.scanner)
+    return scanner.result(), total_bytes, time.perf_counter() - start
+
+
+def throughput_mb_s(size, seconds):
+    return size / 1024 / 1024 / seconds if seconds > 0 else float('inf')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sum Indonesian-formatted numbers in files or stdin")
+    parser.add_argument('paths', nargs='*', default=[STDIN_PATH],
+                        help="files to sum; '-' or nothing reads stdin")
+    parser.add_argument('--engine', default=DEFAULT_ENGINE, choices=sorted(ENGINES))
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_BYTES / 1024 / 1024,
+                        help="read/scan chunk size in MB")
+    parser.add_argument('--json', action='store_true', help="print the result as JSON")
+    parser.add_argument('--quiet', action='store_true', help="no summary/throughput on stderr")
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+
+    chunk_bytes = max(1, int(args.chunk_mb * 1024 * 1024))
+    try:
+        result, size, seconds = sum_inputs(args.paths, args.engine, chunk_bytes)
+    except OSError as e:
+        print(f"auto_sum_file: {e}", file=sys.stderr)
+        raise SystemExit(1)
+
+    formatted = format_number_indonesian(result.rounded, decimal_places=0) if result else None
+    mb_s = throughput_mb_s(size, seconds)
+    if args.json:
+        print(json.dumps({
+            'count': result.count,
+            'sum': str(result.total),
+            'rounded': result.rounded,
+            'formatted': formatted,
+            'min': json_float(result.minimum),
+            'max': json_float(result.maximum),
+            'bytes': size,
+            'seconds': seconds,
+            'mb_per_s': json_float(mb_s),
+        }, allow_nan=False))
+    elif result:
+        print(formatted)
+    if not args.quiet:
+        print(f"{result.count} numbers, total {result.total}, "
+              f"{size / 1024 / 1024:.1f} MB in {seconds:.2f} s ({mb_s:.1f} MB/s)", file=sys.stderr)
+    if not result:
+        raise SystemExit(2)  # Tidak ada angka, seperti grep tanpa hasil
+
+
+if __name__ == "__main__":
+    main()
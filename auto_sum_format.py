@@ -0,0 +1,132 @@
+"""
+Profil lokal angka: format output dan pola parse input per konvensi pemisah.
+
+Setiap LocaleProfile menggabungkan formatter dan parser dengan konvensi yang
+sama, sehingga format input clipboard dan format jumlah yang di-paste bisa
+diatur terpisah per pengguna:
+
+* ``id`` Indonesia   1.234.567,89
+* ``de`` Jerman      1.234.567,89
+* ``us`` AS          1,234,567.89
+* ``ch`` Swiss       1'234'567.89  (input juga menerima apostrof tipografis ’)
+* ``in`` India       12,34,567.89  (pengelompokan lakh/crore)
+
+Format dikerjakan tanpa placeholder: int dikelompokkan langsung oleh format
+Python (eksak berapa pun besarnya), bagian bulat dan pecahan dipisah sekali,
+lalu hanya pemisah ribuan yang diganti dalam satu ``str.replace`` (untuk
+lakh: pengelompokan digit bagian bulat). ``str.translate`` diukur lebih
+lambat untuk string sependek ini. Modul ini tidak bergantung
+pada rumps/pyperclip, jadi dipakai juga oleh bagian headless (server socket,
+file, benchmark).
+"""
+import math
+
+from auto_sum_accumulators import DEFAULT_ENGINE
+from auto_sum_log import get_logger
+from auto_sum_parser import GROUPING_LAKH, GROUPING_STANDARD, number_pattern, sum_numbers
+
+DEFAULT_LOCALE = 'id'
+
+log = get_logger('format')
+
+
+class LocaleProfile(object):
+    """Konvensi angka satu lokal: ``format()`` untuk output, ``pattern``/``sum_numbers()`` untuk input.
+
+    `parse_thousands` berisi semua karakter yang diterima sebagai pemisah
+    ribuan saat parse (default: `thousands`). Objek ini bisa di-pickle, jadi
+    bisa dikirim ke worker parse paralel (lihat auto_sum_parallel.py).
+    """
+
+    __slots__ = ('name', 'label', 'decimal', 'thousands', 'grouping', 'parse_thousands',
+                 'pattern', 'strip_table', '_replace_thousands')
+
+    def __init__(self, name, label, decimal, thousands, grouping=GROUPING_STANDARD,
+                 parse_thousands=None):
+        self.name = name
+        self.label = label
+        self.decimal = decimal
+        self.thousands = thousands
+        self.grouping = grouping
+        self.parse_thousands = parse_thousands = parse_thousands or thousands
+        self.pattern = number_pattern(decimal, parse_thousands, grouping)
+        self.strip_table = str.maketrans('', '', parse_thousands)  # Buang pemisah ribuan
+        self._replace_thousands = thousands != ','  # Pemisah ribuan format Python adalah ','
+
+    def format(self, number, decimal_places=0):
+        """Format angka (int, float atau Decimal dari mesin akumulasi mana pun)."""
+        try:
+            places = decimal_places if decimal_places > 0 else 0
+            standard = self.grouping != GROUPING_LAKH
+            if isinstance(number, int):
+                # Grouping int langsung: eksak juga di atas 2**53 (format 'f' lewat float)
+                integer = f"{number:,}" if standard else str(number)
+                fraction = '0' * places
+            else:
+                formatted = f"{number:,.{places}f}" if standard else f"{number:.{places}f}"
+                integer, _, fraction = formatted.partition('.')
+            if not standard:
+                integer = self._group_lakh(integer)
+            elif self._replace_thousands:
+                integer = integer.replace(',', self.thousands)
+            return f"{integer}{self.decimal}{fraction}" if fraction else integer
+        except Exception as e:
+            log.error("Error formatting number: %s", e)
+            return str(int(round(number)) if isinstance(number, float) else number)
+
+    def _group_lakh(self, digits):
+        sign = ''
+        if digits.startswith('-'):
+            sign, digits = '-', digits[1:]
+        if len(digits) <= 3:
+            return sign + digits
+        head, tail = digits[:-3], digits[-3:]
+        first = len(head) % 2 or 2
+        groups = [head[:first]]
+        groups.extend(head[i:i + 2] for i in range(first, len(head), 2))
+        groups.append(tail)
+        return sign + self.thousands.join(groups)
+
+    def sum_numbers(self, text, collect_numbers=False, engine=DEFAULT_ENGINE):
+        """Menjumlahkan angka berformat profil ini di `text` (lihat auto_sum_parser.sum_numbers)."""
+        return sum_numbers(text, collect_numbers, engine, locale=self)
+
+    def __repr__(self):
+        return f"LocaleProfile({self.name!r}, decimal={self.decimal!r}, thousands={self.thousands!r})"
+
+    def __reduce__(self):
+        # Dibangun ulang dari definisinya; number_pattern() memberi objek pola yang sama
+        return (LocaleProfile, (self.name, self.label, self.decimal, self.thousands,
+                                self.grouping, self.parse_thousands))
+
+
+PROFILES = {profile.name: profile for profile in (
+    LocaleProfile('id', "Indonesia (1.234,56)", decimal=',', thousands='.'),
+    LocaleProfile('de', "Deutsch (1.234,56)", decimal=',', thousands='.'),
+    LocaleProfile('us', "US (1,234.56)", decimal='.', thousands=','),
+    LocaleProfile('ch', "Schweiz (1'234.56)", decimal='.', thousands="'", parse_thousands="'’"),
+    LocaleProfile('in', "India (12,34,567.89)", decimal='.', thousands=',', grouping=GROUPING_LAKH),
+)}
+
+
+def get_profile(name=DEFAULT_LOCALE):
+    """LocaleProfile berdasarkan nama ('id', 'de', 'us', 'ch', 'in'); profil diteruskan apa adanya."""
+    if isinstance(name, LocaleProfile):
+        return name
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown locale profile: {name!r} "
+                         f"(choose from {', '.join(sorted(PROFILES))})")
+
+
+def format_number_indonesian(number, decimal_places=0):
+    """Format angka (int, float atau Decimal dari mesin akumulasi mana pun) ke 1.234,56."""
+    return PROFILES[DEFAULT_LOCALE].format(number, decimal_places)
+
+
+def json_float(value):
+    """Float untuk output JSON: None untuk inf/NaN, yang tidak valid di JSON (``Infinity``)."""
+    if value is None or math.isfinite(value):
+        return value
+    return None
@@ -0,0 +1,110 @@
+"""
+Cache nama aplikasi terdepan (frontmost) dengan invalidasi berbasis event.
+
+``get_frontmost_app()`` lewat AppleScript adalah langkah paling lambat di hot
+path. ``FrontmostAppTracker`` menyimpan jawabannya:
+
+* Mode push : bila observer NSWorkspace terpasang (lihat
+              ``start_workspace_observer``), setiap aktivasi aplikasi langsung
+              memperbarui cache, jadi cache selalu valid tanpa query.
+* Mode TTL  : tanpa push (mis. CLI tanpa run loop Cocoa), jawaban query
+              dipakai ulang selama ``ttl`` detik, lalu di-query ulang.
+"""
+import threading
+import time
+
+
+class FrontmostAppTracker(object):
+
+    def __init__(self, query, ttl=2.0, clock=time.monotonic):
+        self.query = query  # Fungsi fallback, mis. get_frontmost_app()
+        self.ttl = ttl
+        self.clock = clock
+        self.push_active = False
+        self._lock = threading.Lock()
+        self._name = None
+        self._timestamp = None
+
+        self.hits = 0
+        self.misses = 0
+        self.pushes = 0
+
+    def get(self):
+        """Nama aplikasi terdepan, dari cache bila masih valid."""
+        with self._lock:
+            if self._timestamp is not None and (
+                    self.push_active or self.clock() - self._timestamp < self.ttl):
+                self.hits += 1
+                return self._name
+            self.misses += 1
+        name = self.query()
+        with self._lock:
+            self._name = name
+            self._timestamp = self.clock()
+        return name
+
+    def push(self, name):
+        """Dipanggil sumber event (observer NSWorkspace) saat aplikasi lain aktif."""
+        with self._lock:
+            self._name = name
+            self._timestamp = self.clock()
+            self.pushes += 1
+
+    def invalidate(self):
+        with self._lock:
+            self._timestamp = None
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'pushes': self.pushes,
+            'hit_rate': round(self.hit_rate, 3),
+            'push_active': self.push_active,
+        }
+
+
+_observer_class = None
+_observers = []  # Referensi kuat agar observer tidak di-garbage-collect
+
+
+def start_workspace_observer(tracker):
+    """Memasang observer NSWorkspaceDidActivateApplicationNotification ke `tracker`.
+
+    Mengembalikan True bila berhasil. Butuh AppKit (pyobjc, ikut rumps) dan run
+    loop Cocoa yang berjalan (rumps.App); selain itu tracker tetap pakai TTL.
+    """
+    global _observer_class
+    try:
+        from AppKit import (NSObject, NSWorkspace, NSWorkspaceApplicationKey,
+                            NSWorkspaceDidActivateApplicationNotification)
+    except ImportError:
+        return False
+
+    if _observer_class is None:
+        class AutoSumFrontmostObserver(NSObject):
+            def applicationActivated_(self, notification):
+                app = notification.userInfo()[NSWorkspaceApplicationKey]
+                self.tracker.push(str(app.localizedName() or ""))
+
+        _observer_class = AutoSumFrontmostObserver
+
+    observer = _observer_class.alloc().init()
+    observer.tracker = tracker
+    workspace = NSWorkspace.sharedWorkspace()
+    workspace.notificationCenter().addObserver_selector_name_object_(
+        observer, 'applicationActivated:', NSWorkspaceDidActivateApplicationNotification, None
+    )
+    _observers.append(observer)
+
+    # Isi awal agar cache langsung valid tanpa menunggu aktivasi berikutnya
+    front = workspace.frontmostApplication()
+    if front is not None:
+        tracker.push(str(front.localizedName() or ""))
+    tracker.push_active = True
+    return True
@@ -0,0 +1,88 @@
+"""
+Lapisan logging bersama untuk Auto Sum (di atas modul ``logging`` bawaan).
+
+* Level default tenang untuk produksi; ubah lewat ``configure(level)`` atau
+  variabel lingkungan ``AUTO_SUM_LOG_LEVEL`` (DEBUG, INFO, WARNING, ...).
+* Pesan dibangun malas: pakai argumen ``%s`` (``log.debug("x = %s", x)``),
+  bukan f-string, agar tidak ada formatting bila level tersebut mati.
+* ``preview(items)`` hanya menampilkan N item pertama plus jumlahnya, jadi
+  list 500 ribu angka tidak pernah diformat utuh.
+* ``timed(log, stage, timings)`` mencatat durasi satu tahap di level DEBUG,
+  dan bila `timings` (dict) diberikan, juga menyimpannya di ``timings[stage]``.
+"""
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+LOGGER_NAME = 'auto_sum'
+PREVIEW_ITEMS = 10
+PREVIEW_CHARS = 80
+
+
+def get_logger(name=None):
+    """Logger anak 'auto_sum.<name>' (atau logger akar 'auto_sum')."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def configure(level='WARNING', stream=None, fmt="%(asctime)s %(levelname)s %(name)s: %(message)s"):
+    """Memasang satu handler untuk logger 'auto_sum'. AUTO_SUM_LOG_LEVEL menang atas `level`."""
+    level = os.environ.get('AUTO_SUM_LOG_LEVEL', '').strip().upper() or level
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+class preview(object):
+    """Representasi pendek list/teks yang baru dibangun saat benar-benar di-log."""
+
+    __slots__ = ('value', 'limit')
+
+    def __init__(self, value, limit=None):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        value = self.value
+        if value is None:
+            return 'None'
+        if isinstance(value, str):
+            limit = self.limit or PREVIEW_CHARS
+            if len(value) <= limit:
+                return repr(value)
+            return f"{value[:limit]!r}... ({len(value)} chars)"
+        limit = self.limit or PREVIEW_ITEMS
+        items = list(value[:limit])
+        if len(value) <= limit:
+            return repr(items)
+        return f"{repr(items)[:-1]}, ...] ({len(value)} items)"
+
+    __repr__ = __str__
+
+
+@contextmanager
+def timed(logger, stage, timings=None):
+    """Mencatat durasi blok `stage` di level DEBUG dan/atau ke dict `timings`.
+
+    Tanpa `timings` dan dengan DEBUG mati, blok dijalankan tanpa pengukuran.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if not debug and timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if timings is not None:
+            timings[stage] = elapsed
+        if debug:
+            logger.debug("%s took %.2f ms", stage, elapsed * 1e3)
@@ -0,0 +1,151 @@
+"""
+Jalur cepat opsional berbasis NumPy untuk paste yang sangat besar.
+
+Dipakai otomatis oleh ``SumScanner.scan`` (jadi juga oleh ``sum_numbers`` dan
+``IncrementalSummer``) untuk potongan teks di atas ``BULK_THRESHOLD_CHARS``
+(lihat auto_sum_parser.py).
+Bila NumPy tidak terpasang, ``available()`` False dan parser diam-diam tetap
+memakai loop Python murni.
+
+Cara kerja per potongan (dipotong di batas aman, maks. ``CHUNK_CHARS``):
+
+1. Teks di-encode ke bytes ASCII lalu di-tokenize dengan satu ``findall``
+   (satu grup tangkap, jadi tanpa tuple per token). Token tidak valid
+   menghasilkan ``b''`` - aturan validasinya identik dengan NUMBER_PATTERN.
+2. List token menjadi array ``S`` NumPy selebar ``MAX_DIGITS`` byte, dilihat
+   sebagai matriks uint8. Panjang token diukur lebih dulu; token yang lebih
+   panjang (mis. nomor referensi 25 digit) tidak ikut array tapi di-scan satu
+   per satu dengan loop Python, jadi tidak memperlebar matriks untuk semua.
+3. Titik ribuan diabaikan, koma menjadi pemisah desimal; bagian bulat dan
+   pecahan dihitung dengan Horner per kolom, vektor int64 atas semua token.
+4. Semua nilai diskalakan ke jumlah digit desimal terpanjang lalu dijumlahkan
+   eksak sebagai integer (sen), dipecah hi/lo agar int64 tidak overflow.
+
+Potongan non-ASCII dikembalikan utuh ke loop Python.
+"""
+import re
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional
+    np = None
+
+CHUNK_CHARS = 4 * 1024 * 1024
+MAX_DIGITS = 18  # Maksimum digit per token yang aman untuk int64
+
+# Sama dengan NUMBER_PATTERN di auto_sum_parser, versi bytes dengan satu grup:
+# token valid -> seluruh token, token tidak valid -> b''.
+BULK_TOKEN_PATTERN = re.compile(
+    rb"([-+]?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?)(?!\d|[.,]\d)"
+    rb"|[-+]?[\d.,]+"
+)
+
+_SPLIT = 10 ** 9  # Pemecah hi/lo untuk penjumlahan int64 tanpa overflow
+
+
+def available():
+    return np is not None
+
+
+def _sum_tokens(tokens):
+    """Menjumlahkan array token valid (dtype S). Mengembalikan None bila terlalu panjang.
+
+    Hasil: (units, scale, count, minimum, maximum) dengan total = units / 10**scale.
+    """
+    count = len(tokens)
+    width = tokens.dtype.itemsize
+    matrix = tokens.view(np.uint8).reshape(count, width)
+
+    negative = matrix[:, 0] == ord('-')
+    int_value = np.zeros(count, dtype=np.int64)
+    frac_value = np.zeros(count, dtype=np.int64)
+    frac_len = np.zeros(count, dtype=np.int64)
+    int_len = np.zeros(count, dtype=np.int64)
+    in_frac = np.zeros(count, dtype=bool)
+
+    # Horner per kolom (lebar token kecil), vektor atas semua token sekaligus.
+    # Titik ribuan dan tanda dilewati; kolom sesudah koma adalah pecahan.
+    for column in range(width):
+        byte = matrix[:, column]
+        in_frac |= byte == ord(',')
+        digit = (byte >= 48) & (byte <= 57)
+        value = byte.astype(np.int64) - 48
+        int_digit = digit & ~in_frac
+        frac_digit = digit & in_frac
+        int_value = np.where(int_digit, int_value * 10 + value, int_value)
+        int_len += int_digit
+        frac_value = np.where(frac_digit, frac_value * 10 + value, frac_value)
+        frac_len += frac_digit
+
+    # Skala bersama = pecahan terpanjang; nilai terbesar harus muat di int64
+    scale = int(frac_len.max())
+    if int(int_len.max()) + scale > MAX_DIGITS:
+        return None
+    powers = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+    units = int_value * powers[scale] + frac_value * powers[scale - frac_len]
+    units[negative] *= -1
+
+    # Penjumlahan eksak: pecah tiap nilai jadi hi * 1e9 + lo, jumlahkan terpisah
+    high, low = np.divmod(units, _SPLIT)
+    total = int(high.sum()) * _SPLIT + int(low.sum())
+    # Pembagian int Python dibulatkan benar, sama seperti float("1234.56")
+    divisor = 10 ** scale
+    minimum = int(units.min()) / divisor
+    maximum = int(units.max()) / divisor
+    return total, scale, count, minimum, maximum
+
+
+def scan_bulk(scanner, text, start, end, scan_python):
+    """Memindai text[start:end] ke `scanner` dengan NumPy, per potongan.
+
+    `scan_python(scanner, text, start, end)` dipakai untuk potongan yang tidak
+    bisa diproses jalur NumPy.
+    """
+    from auto_sum_parser import find_safe_boundary
+
+    pos = start
+    while pos < end:
+        cut = end
+        if end - pos > CHUNK_CHARS:
+            cut = find_safe_boundary(text, pos + CHUNK_CHARS, pos)
+            if cut <= pos:
+                cut = end
+        chunk = text[pos:cut]
+        if not chunk.isascii() or not _scan_chunk(scanner, chunk.encode('ascii'), scan_python):
+            scan_python(scanner, text, pos, cut)
+        pos = cut
+    return scanner
+
+
+def _scan_chunk(scanner, data, scan_python):
+    found = BULK_TOKEN_PATTERN.findall(data)
+    if not found:
+        return True
+    lengths = np.fromiter(map(len, found), dtype=np.int64, count=len(found))
+    # Lebar array tetap MAX_DIGITS: token yang lebih panjang terpotong di sini,
+    # jadi dibuang dari array dan di-scan ulang lewat loop Python di bawah
+    tokens = np.array(found, dtype=f'S{MAX_DIGITS}')
+    tokens = tokens[(lengths > 0) & (lengths <= MAX_DIGITS)]
+    if tokens.size:
+        summed = _sum_tokens(tokens)
+        if summed is None:
+            return False
+        _add_summed(scanner, summed)
+    for index in np.flatnonzero(lengths > MAX_DIGITS):
+        token = found[index].decode('ascii')
+        scan_python(scanner, token, 0, len(token))  # Token valid utuh, konteksnya tidak berpengaruh
+    return True
+
+
+def _add_summed(scanner, summed):
+    units, scale, count, minimum, maximum = summed
+
+    # Masukkan total eksak ke mesin akumulasi lewat antarmuka add() biasa
+    digits = str(abs(units)).rjust(scale + 1, '0')
+    if scale:
+        scanner.accumulator.add(units < 0, digits[:-scale], digits[-scale:])
+    else:
+        scanner.accumulator.add(units < 0, digits, '')
+    scanner.count += count
+    scanner.minimum = min(scanner.minimum, minimum)
+    scanner.maximum = max(scanner.maximum, maximum)
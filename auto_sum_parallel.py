@@ -0,0 +1,146 @@
+"""
+Parse paralel multi-core untuk paste yang sangat besar.
+
+Teks dipotong hanya di batas aman (lihat ``find_safe_boundary``), jadi token
+seperti ``1.234,56`` tidak pernah terbelah. Tiap potongan di-scan di worker
+sendiri menjadi ``SumScanner`` parsial, lalu hasil parsial digabung berurutan
+dengan ``SumScanner.merge``. Untuk mesin 'fixed' dan 'decimal' hasilnya
+identik dengan scan serial; mesin 'kahan' bisa berbeda di digit float terakhir.
+
+Worker berupa proses (``ProcessPoolExecutor``, dibuat sekali lalu dipakai
+ulang). Pada build Python free-threaded (GIL mati) thread dipakai sebagai
+gantinya, tanpa biaya menyalin teks ke proses lain. Di bawah
+``PARALLEL_THRESHOLD_CHARS`` atau dengan satu worker, scan tetap serial.
+
+Catatan: dengan start method 'spawn' (default macOS) proses worker mengimpor
+ulang modul utama, jadi skrip pemanggil harus dilindungi
+``if __name__ == "__main__":``.
+"""
+import concurrent.futures
+import os
+import sys
+import threading
+
+from auto_sum_accumulators import DEFAULT_ENGINE
+from auto_sum_log import get_logger
+from auto_sum_parser import SumScanner, find_safe_boundary, sum_numbers
+
+# Teks sependek ini di-scan serial; biaya kirim ke worker lebih besar dari untungnya
+PARALLEL_THRESHOLD_CHARS = 2_000_000
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+_disabled = False  # True setelah pool gagal dibuat/crash; selanjutnya selalu serial
+
+log = get_logger('parallel')
+
+
+def gil_disabled():
+    """True pada build free-threaded yang berjalan tanpa GIL (Python 3.13t+)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def resolve_workers(workers=None):
+    """Jumlah worker efektif: None berarti satu per core CPU."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def _get_executor(workers):
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            if gil_disabled():
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    workers, thread_name_prefix="auto-sum-parse")
+            else:
+                _executor = concurrent.futures.ProcessPoolExecutor(workers)
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown():
+    """Menghentikan pool worker bersama (dibuat ulang otomatis bila dipakai lagi)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+def _scan_range(text, start, end, engine, locale=None):
+    # Fungsi level modul agar bisa di-pickle untuk ProcessPoolExecutor
+    return SumScanner(engine, locale=locale).scan(text, start, end)
+
+
+def split_text(text, parts, start=0, end=None):
+    """Posisi potong aman yang membagi text[start:end] menjadi +/- `parts` potongan.
+
+    Mengembalikan list posisi akhir tiap potongan, urut naik, dengan `end`
+    sebagai elemen terakhir.
+    """
+    if end is None:
+        end = len(text)
+    size = max(1, (end - start) // max(1, parts))
+    cuts = []
+    pos = start
+    while pos < end:
+        cut = end if pos + size >= end else find_safe_boundary(text, pos + size, pos)
+        if cut <= pos:
+            cut = end  # Tidak ada batas aman sampai akhir (token sangat panjang)
+        cuts.append(cut)
+        pos = cut
+    return cuts
+
+
+def scan_ranges(text, start, cuts, engine=DEFAULT_ENGINE, workers=None, locale=None):
+    """Scan potongan [start, cuts[0]), [cuts[0], cuts[1]), ... secara paralel.
+
+    Mengembalikan list SumScanner parsial sesuai urutan potongan, atau None
+    bila pool worker tidak bisa dipakai (pemanggil lalu scan serial).
+    """
+    global _disabled
+    workers = resolve_workers(workers)
+    if _disabled or workers < 2 or len(cuts) < 2:
+        return None
+    try:
+        executor = _get_executor(workers)
+        threads = isinstance(executor, concurrent.futures.ThreadPoolExecutor)
+        futures = []
+        for cut in cuts:
+            if threads:
+                futures.append(executor.submit(_scan_range, text, start, cut, engine, locale))
+            else:
+                chunk = text[start:cut]  # Hanya potongan ini yang di-pickle ke proses worker
+                futures.append(executor.submit(_scan_range, chunk, 0, len(chunk), engine, locale))
+            start = cut
+        return [future.result() for future in futures]
+    except (OSError, concurrent.futures.BrokenExecutor) as e:
+        log.warning("Parallel parsing unavailable, falling back to a single core: %s", e)
+        _disabled = True
+        shutdown()
+        return None
+
+
+def sum_numbers_parallel(text, collect_numbers=False, engine=DEFAULT_ENGINE, workers=None,
+                         threshold=PARALLEL_THRESHOLD_CHARS, locale=None):
+    """Seperti sum_numbers(), tapi teks besar di-scan paralel di `workers` worker.
+
+    Tetap serial bila teks lebih pendek dari `threshold`, bila hanya ada satu
+    worker, atau bila `collect_numbers` True (list angka mahal dikirim balik).
+    """
+    workers = resolve_workers(workers)
+    if collect_numbers or workers < 2 or len(text) < threshold:
+        return sum_numbers(text, collect_numbers=collect_numbers, engine=engine, locale=locale)
+    partials = scan_ranges(text, 0, split_text(text, workers), engine, workers, locale)
+    if partials is None:
+        return sum_numbers(text, engine=engine, locale=locale)
+    scanner = partials[0]
+    for partial in partials[1:]:
+        scanner.merge(partial)
+    return scanner.result()
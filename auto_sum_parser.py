@@ -0,0 +1,455 @@
+"""
+Mesin ekstraksi angka bersama untuk auto_sum_statusbar.py dan auto_sum_paste_word.py.
+
+Teks di-scan sekali dengan satu regex yang sudah dikompilasi. Setiap token
+angka format Indonesia (mis. ``1.234.567,89`` atau ``-123,45``) langsung
+dijumlahkan, tanpa membangun list angka perantara kecuali diminta untuk debug.
+"""
+import codecs
+import re
+
+from auto_sum_accumulators import DEFAULT_ENGINE, make_accumulator
+from auto_sum_log import get_logger
+
+# Potongan teks sebesar ini atau lebih dipindai dengan NumPy bila tersedia
+BULK_THRESHOLD_CHARS = 1_000_000
+# Token dengan digit lebih banyak bukan nominal (mis. deretan digit hasil
+# export yang rusak); dilewati dengan peringatan agar total tetap bisa
+# diformat (batas konversi int/str Python 3.11+ adalah 4300 digit) dan
+# min/max serta mesin 'kahan' tetap berhingga (float maks. ~1,8e308)
+MAX_TOKEN_DIGITS = 300
+# Ekor tanpa batas aman yang disimpan StreamingSum; jauh di atas token
+# terpanjang yang masih dihitung (MAX_TOKEN_DIGITS digit plus pemisah)
+CARRY_LIMIT_CHARS = 64 * 1024
+
+log = get_logger('parser')
+
+# Pengelompokan ribuan yang dikenal number_pattern()
+GROUPING_STANDARD = 'standard'  # 1.234.567 (grup 3 digit)
+GROUPING_LAKH = 'lakh'          # 12,34,567 (3 digit terakhir, lalu grup 2 digit)
+
+_PATTERNS = {}
+
+
+def integer_pattern(thousands='.', grouping=GROUPING_STANDARD):
+    """Regex (string) bagian bulat: berkelompok valid dengan pemisah `thousands`, atau digit polos.
+
+    `thousands` boleh berisi beberapa karakter yang setara (mis. "'’").
+    """
+    sep = f"[{re.escape(thousands)}]" if len(thousands) > 1 else re.escape(thousands)
+    if grouping == GROUPING_LAKH:
+        return rf"\d{{1,2}}(?:{sep}\d{{2}})*{sep}\d{{3}}|\d+"
+    return rf"\d{{1,3}}(?:{sep}\d{{3}})+|\d+"
+
+
+def number_pattern(decimal=',', thousands='.', grouping=GROUPING_STANDARD):
+    """Regex token angka untuk satu konvensi pemisah (di-cache; objek sama untuk argumen sama).
+
+    Satu token kandidat adalah deretan digit/pemisah (dengan tanda opsional).
+    Cabang pertama hanya cocok bila pengelompokan ribuan valid dan token
+    tidak berlanjut ke digit lain. Pemisah tunggal di akhir (tanda baca
+    kalimat) tidak ikut dikonsumsi. Semua deretan lain jatuh ke cabang kedua
+    dan diabaikan sebagai token tidak valid, misalnya "1.2.3,4,5" atau
+    "12.34" untuk format Indonesia.
+    """
+    key = (decimal, thousands, grouping)
+    pattern = _PATTERNS.get(key)
+    if pattern is None:
+        separators = re.escape(decimal + thousands)
+        pattern = _PATTERNS[key] = re.compile(
+            r"([-+]?)"
+            rf"(?:({integer_pattern(thousands, grouping)})(?:{re.escape(decimal)}(\d+))?(?!\d|[{separators}]\d)"
+            rf"|[\d{separators}]+)"
+        )
+    return pattern
+
+
+# Format Indonesia (juga Jerman): titik ribuan, koma desimal. Profil lain
+# (lihat auto_sum_format.py) membangun pola yang setara dengan pemisahnya sendiri.
+NUMBER_PATTERN = number_pattern(',', '.')
+
+
+class SumResult(object):
+    """Ringkasan hasil scan: jumlah token valid, total, minimum dan maksimum.
+
+    `total` bertipe sesuai mesin akumulasi (int/Decimal untuk 'fixed' dan
+    'decimal', float untuk 'kahan'); `rounded` adalah total yang sudah
+    dibulatkan ke int, siap untuk format_number_indonesian.
+    """
+
+    __slots__ = ('count', 'total', 'rounded', 'minimum', 'maximum', 'numbers')
+
+    def __init__(self, count=0, total=0, rounded=0, minimum=None, maximum=None, numbers=None):
+        self.count = count
+        self.total = total
+        self.rounded = rounded
+        self.minimum = minimum
+        self.maximum = maximum
+        self.numbers = numbers  # Hanya diisi bila collect_numbers=True
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __repr__(self):
+        return (f"SumResult(count={self.count}, total={self.total!r}, "
+                f"minimum={self.minimum!r}, maximum={self.maximum!r})")
+
+
+def parse_token(int_digits, frac_digits):
+    """Mengubah digit bagian bulat (tanpa titik) dan pecahan menjadi float."""
+    if frac_digits:
+        return float(f"{int_digits}.{frac_digits}")
+    return float(int_digits)
+
+
+def is_token_char(char):
+    """True bila `char` bisa menjadi bagian token angka profil mana pun (digit, pemisah, tanda)."""
+    return char in ".,+-'\u2019" or char.isdecimal()
+
+
+# Deretan karakter is_token_char (\d di regex str = isdecimal)
+_TOKEN_RUN = re.compile(r"[\d.,+\-'\u2019]*")
+
+
+def find_safe_boundary(text, pos, lower=0):
+    """Posisi <= `pos` tempat teks boleh dipotong tanpa mengubah hasil scan.
+
+    Posisi p aman bila karakter sebelumnya (text[p-1]) bukan karakter token:
+    tidak ada token yang melintasi p, dan lookahead regex dari token sebelum p
+    tidak pernah melihat melewati p. Scan text[:p] lalu text[p:] dengan
+    akumulator yang sama memberi hasil yang persis sama dengan scan penuh.
+    Mengembalikan `lower` bila tidak ada posisi aman di antara `lower` dan `pos`.
+    """
+    stop = max(lower, pos - 64)
+    while pos > stop and is_token_char(text[pos - 1]):
+        pos -= 1
+    if pos == stop and pos > lower and is_token_char(text[pos - 1]):
+        # Deretan token panjang (teks tanpa spasi/baris): ukur dengan regex atas
+        # potongan terbalik, bukan loop Python per karakter
+        pos -= _TOKEN_RUN.match(text[lower:pos][::-1]).end()
+    return pos
+
+
+class SumScanner(object):
+    """State penjumlahan yang bisa diteruskan lintas potongan teks.
+
+    ``scan(text, start, end)`` boleh dipanggil berkali-kali selama batas
+    potongan berada di posisi aman (lihat find_safe_boundary). `locale`
+    (LocaleProfile dari auto_sum_format.py) memilih konvensi pemisah input;
+    None berarti format Indonesia (NUMBER_PATTERN).
+    """
+
+    __slots__ = ('accumulator', 'count', 'minimum', 'maximum', 'numbers', 'locale')
+
+    def __init__(self, engine=DEFAULT_ENGINE, collect_numbers=False, locale=None):
+        self.accumulator = make_accumulator(engine)
+        self.count = 0
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.numbers = [] if collect_numbers else None
+        if locale is not None and locale.pattern is NUMBER_PATTERN:
+            locale = None  # Pemisah sama dengan default: pakai jalur tercepat
+        self.locale = locale
+
+    def scan(self, text, start=0, end=None):
+        if end is None:
+            end = len(text)
+        if end - start >= BULK_THRESHOLD_CHARS and self.numbers is None and self.locale is None:
+            # Paste sangat besar: jalur NumPy bila terpasang (lihat auto_sum_numpy.py)
+            import auto_sum_numpy
+            if auto_sum_numpy.available():
+                return auto_sum_numpy.scan_bulk(self, text, start, end, SumScanner._scan_python)
+        return self._scan_python(text, start, end)
+
+    def _scan_python(self, text, start, end):
+        add = self.accumulator.add
+        count = self.count
+        minimum = self.minimum
+        maximum = self.maximum
+        numbers = self.numbers
+        skipped = 0
+        if self.locale is None:
+            pattern, strip = NUMBER_PATTERN, None
+        else:
+            pattern, strip = self.locale.pattern, self.locale.strip_table
+
+        for match in pattern.finditer(text, start, end):
+            sign, int_part, frac_part = match.groups('')
+            if not int_part:
+                continue  # Token tidak valid (pengelompokan salah, hanya tanda baca, dll.)
+            if strip is not None:
+                int_part = int_part.translate(strip)
+            elif '.' in int_part:
+                int_part = int_part.replace('.', '')
+            if len(int_part) + len(frac_part) > MAX_TOKEN_DIGITS:
+                skipped += 1
+                continue
+            negative = sign == '-'
+            add(negative, int_part, frac_part)
+            number = parse_token(int_part, frac_part)
+            if negative:
+                number = -number
+
+            count += 1
+            if number < minimum:
+                minimum = number
+            if number > maximum:
+                maximum = number
+            if numbers is not None:
+                numbers.append(number)
+
+        self.count = count
+        self.minimum = minimum
+        self.maximum = maximum
+        if skipped:
+            log.warning("Skipped %d tokens longer than %d digits", skipped, MAX_TOKEN_DIGITS)
+        return self
+
+    def copy(self):
+        clone = SumScanner.__new__(SumScanner)
+        clone.accumulator = self.accumulator.copy()
+        clone.count = self.count
+        clone.minimum = self.minimum
+        clone.maximum = self.maximum
+        clone.numbers = None if self.numbers is None else list(self.numbers)
+        clone.locale = self.locale
+        return clone
+
+    def merge(self, other):
+        """Menggabungkan hasil scan potongan teks *sesudah* potongan milik self."""
+        self.accumulator.merge(other.accumulator)
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        if self.numbers is not None and other.numbers is not None:
+            self.numbers.extend(other.numbers)
+        return self
+
+    def result(self):
+        if not self.count:
+            return SumResult(numbers=self.numbers)
+        return SumResult(self.count, self.accumulator.total(), self.accumulator.rounded(),
+                         self.minimum, self.maximum, self.numbers)
+
+
+def sum_numbers(text, collect_numbers=False, engine=DEFAULT_ENGINE, locale=None):
+    """Menjumlahkan semua angka format Indonesia di dalam `text` dalam satu kali scan.
+
+    `engine` memilih mesin akumulasi (lihat auto_sum_accumulators.py). Bila
+    `collect_numbers` True, angka yang berhasil di-parse juga disimpan di
+    `SumResult.numbers` (untuk output debug). `locale` memilih format input
+    lain (lihat SumScanner).
+    """
+    return SumScanner(engine, collect_numbers, locale).scan(text).result()
+
+
+class StreamingSum(object):
+    """SumScanner yang diberi potongan bytes: decode UTF-8 bertahap, scan di batas aman.
+
+    Dipakai untuk input yang tidak ditampung utuh (body socket, file, stdin).
+    Hanya ekor potongan yang mungkin masih bagian dari token (mis. ``1.234,``)
+    yang disimpan sampai potongan berikutnya datang, jadi token yang terbelah
+    di batas potongan tetap dihitung dengan benar.
+
+    Ekor itu dibatasi ``CARRY_LIMIT_CHARS``, juga untuk input tanpa pemisah
+    baris/spasi (mis. ``12,13,14,...`` satu baris): ekor yang lebih panjang
+    dipotong sebelum tanda/karakter token terakhir yang bukan bagian badan
+    angka. Dari deretan digit/pemisah yang tetap lebih panjang dari batas itu
+    hanya token di awalnya yang mungkin dihitung (lihat MAX_TOKEN_DIGITS); token
+    itu di-scan, sisanya dilewati sampai deretannya berakhir. Hasilnya tetap
+    identik dengan satu kali scan atas seluruh input.
+    """
+
+    def __init__(self, engine=DEFAULT_ENGINE, locale=None):
+        self.scanner = scanner = SumScanner(engine, locale=locale)
+        if scanner.locale is None:
+            separators, self._pattern = ',.', NUMBER_PATTERN
+        else:
+            separators = scanner.locale.decimal + scanner.locale.parse_thousands
+            self._pattern = scanner.locale.pattern
+        self._body_run = _body_run_pattern(separators)
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self._pending = ''
+        self._skipping = False  # Di tengah deretan digit/pemisah yang terlalu panjang
+
+    def feed(self, data):
+        text = self._skip(self._decoder.decode(data))
+        if not text:
+            return
+        text = self._pending + text
+        cut = find_safe_boundary(text, len(text))
+        if cut:
+            self.scanner.scan(text, 0, cut)
+        self._pending = text[cut:]
+        if len(self._pending) > CARRY_LIMIT_CHARS:
+            self._bound_pending()
+
+    def finish(self):
+        text = self._pending + self._skip(self._decoder.decode(b'', final=True))
+        self._pending = ''
+        if text:
+            self.scanner.scan(text)
+        return self.scanner.result()
+
+    def _skip(self, text):
+        # Buang lanjutan deretan yang sedang dilewati; scan berlanjut di akhir deretan
+        if self._skipping:
+            end = self._body_run.match(text).end()
+            if end == len(text):
+                return ''
+            self._skipping = False
+            text = text[end:]
+        return text
+
+    def _bound_pending(self):
+        pending = self._pending
+        # Ekor berisi karakter token saja. Karakter yang bukan badan angka (tanda,
+        # apostrof untuk format Indonesia) tidak pernah dikonsumsi token sebelumnya,
+        # jadi posisinya batas aman juga: scan semua sebelum yang terakhir.
+        run = self._body_run.match(pending[::-1]).end()
+        cut = len(pending) - run - 1
+        if cut > 0:
+            self.scanner.scan(pending, 0, cut)
+            pending = pending[cut:]
+        if run > CARRY_LIMIT_CHARS:
+            # Sisa: paling banyak satu karakter lalu deretan digit/pemisah yang
+            # lebih panjang dari token mana pun yang masih dihitung. Hanya match
+            # pertamanya yang bisa valid, bila diikuti pemisah ganda ("12,,333...");
+            # match berikutnya diawali pemisah dan menelan sisa deretan.
+            match = self._pattern.search(pending)
+            if match is not None and match.end() < len(pending):
+                self.scanner.scan(pending, 0, match.end())
+            log.warning("Skipped a run of more than %d number characters", CARRY_LIMIT_CHARS)
+            pending = ''
+            self._skipping = True
+        self._pending = pending
+
+
+def _bulk_available():
+    """True bila jalur NumPy (auto_sum_numpy.py) bisa dipakai SumScanner.scan."""
+    import auto_sum_numpy
+    return auto_sum_numpy.available()
+
+
+def _body_run_pattern(separators):
+    """Regex deretan karakter badan angka (digit dan pemisah `separators`)."""
+    return re.compile(rf"[\d{re.escape(separators)}]*")
+
+
+class IncrementalSummer(object):
+    """Penjumlahan inkremental untuk seleksi clipboard yang terus bertambah.
+
+    Setiap teks di-scan per potongan; di setiap batas potongan yang aman state
+    scanner disimpan sebagai checkpoint, termasuk satu di dekat akhir teks.
+    Bila teks berikutnya diawali teks sebelumnya (atau berbagi prefix panjang
+    dengannya), scan dilanjutkan dari checkpoint terjauh yang masih berlaku
+    sehingga hanya bagian baru (delta) yang di-parse. Hasilnya identik dengan
+    sum_numbers() untuk teks yang sama.
+
+    Riwayat dibatasi `max_checkpoints` checkpoint dan satu teks terakhir
+    sepanjang maksimal `max_text_chars` karakter.
+
+    Dengan `workers` > 1, bagian baru yang panjang (lihat auto_sum_parallel.py)
+    di-scan paralel per potongan; checkpoint dibangun dari hasil parsialnya.
+    Bila NumPy tersedia, potongan untuk teks besar tidak lebih kecil dari
+    ``BULK_THRESHOLD_CHARS`` agar tetap di-scan lewat jalur NumPy.
+    """
+
+    def __init__(self, engine=DEFAULT_ENGINE, min_checkpoint_interval=4096,
+                 max_checkpoints=32, max_text_chars=32 * 1024 * 1024, workers=1, locale=None):
+        self.engine = engine
+        self.locale = locale
+        self.workers = workers  # None: satu worker per core CPU
+        self.min_checkpoint_interval = min_checkpoint_interval
+        self.max_checkpoints = max_checkpoints
+        self.max_text_chars = max_text_chars
+        self._text = None
+        self._checkpoints = []  # (posisi, SumScanner), urut naik
+        self.reused_chars = 0   # Panjang prefix yang tidak di-parse ulang pada sum() terakhir
+
+    def reset(self):
+        self._text = None
+        self._checkpoints = []
+
+    def _find_checkpoint(self, text):
+        """Checkpoint terjauh yang prefix-nya sama dengan awal `text`."""
+        previous = self._text
+        checkpoints = self._checkpoints
+        if previous is None or not checkpoints:
+            return 0
+        if text.startswith(previous):
+            return len(checkpoints)  # Seleksi diperpanjang: semua checkpoint berlaku
+        # Prefix bersama sebagian: cari biner (checkpoint urut naik, validitas monoton)
+        low, high = 0, len(checkpoints)
+        while low < high:
+            mid = (low + high) // 2
+            pos = checkpoints[mid][0]
+            if pos <= len(text) and text.startswith(previous[:pos]):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def sum(self, text, collect_numbers=False):
+        if collect_numbers:
+            # Checkpoint dengan list angka terlalu mahal disalin; scan penuh saja
+            self.reset()
+            return sum_numbers(text, collect_numbers=True, engine=self.engine, locale=self.locale)
+
+        valid = self._find_checkpoint(text)
+        checkpoints = self._checkpoints[:valid]
+        if checkpoints:
+            pos, scanner = checkpoints[-1]
+            scanner = scanner.copy()
+        else:
+            pos, scanner = 0, SumScanner(self.engine, locale=self.locale)
+        self.reused_chars = pos
+
+        # Potong hanya di batas aman; checkpoint terakhir di batas aman paling
+        # akhir agar teks yang diperpanjang bisa melanjutkan dari sana.
+        length = len(text)
+        interval = max(self.min_checkpoint_interval, length // self.max_checkpoints)
+        tail = find_safe_boundary(text, length, pos)
+        if tail - pos >= BULK_THRESHOLD_CHARS and self.locale is None and _bulk_available():
+            # Potongan di bawah BULK_THRESHOLD_CHARS tidak pernah masuk jalur NumPy;
+            # dua kali lipat agar mundur ke batas aman tidak membuatnya jatuh di bawah.
+            interval = max(interval, 2 * BULK_THRESHOLD_CHARS)
+        cuts = []
+        cut = pos
+        while cut < tail:
+            previous_cut = cut
+            # Sisa yang lebih pendek dari dua interval jadi satu potongan terakhir
+            target = tail if tail - cut < 2 * interval else cut + interval
+            cut = find_safe_boundary(text, target, cut)
+            if cut <= previous_cut:
+                cut = tail  # Tidak ada batas aman dalam interval ini (token sangat panjang)
+            cuts.append(cut)
+
+        partials = None
+        if self.workers != 1 and cuts:
+            import auto_sum_parallel
+            if tail - pos >= auto_sum_parallel.PARALLEL_THRESHOLD_CHARS:
+                partials = auto_sum_parallel.scan_ranges(text, pos, cuts, self.engine, self.workers,
+                                                         self.locale)
+        if partials is not None:
+            for cut, partial in zip(cuts, partials):
+                scanner.merge(partial)
+                checkpoints.append((cut, scanner.copy()))
+            pos = tail
+        else:
+            for cut in cuts:
+                scanner.scan(text, pos, cut)
+                pos = cut
+                checkpoints.append((pos, scanner.copy()))
+        if pos < length:
+            scanner.scan(text, pos, length)
+
+        if len(checkpoints) > self.max_checkpoints:
+            # Jarangkan: buang setiap checkpoint kedua, checkpoint terakhir tetap disimpan
+            checkpoints = checkpoints[::-2][::-1]
+        if length <= self.max_text_chars:
+            self._text = text
+            self._checkpoints = checkpoints
+        else:
+            self.reset()
+        return scanner.result()
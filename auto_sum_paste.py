@@ -0,0 +1,226 @@
+"""
+Paste jumlah ke aplikasi target dengan tulis clipboard yang dikonfirmasi.
+
+Sebelumnya setiap paste menulis clipboard lalu tidur tetap (0,1-0,2 detik)
+"agar clipboard sempat diperbarui" sebelum Cmd+V dikirim: terlalu lama bila
+pasteboard sudah siap dalam mikrodetik, dan tetap bisa terlalu cepat bila
+sistem sedang sibuk. PasteCoordinator menggantinya dengan konfirmasi:
+
+1. Catat token clipboard (``probe()``) sebelum menulis, lalu tulis jumlahnya.
+2. Spin singkat dan terbatas (`confirm_timeout`) sampai token berubah dan isi
+   yang dibaca kembali sama dengan yang ditulis; beberapa putaran pertama
+   tanpa tidur, setelah itu tidur `spin_interval` per putaran.
+3. Begitu terkonfirmasi, keystroke paste langsung dikirim. Tidak
+   terkonfirmasi sampai batas waktu: paste dibatalkan (kembali False) daripada
+   mem-paste isi clipboard yang lama.
+
+Token hasil tulisan sendiri dicatat, sehingga ClipboardWatcher (parameter
+``is_own``) melewatinya tanpa membaca isi clipboard dan jumlah yang kita
+tulis tidak pernah memicu penjumlahan ulang. Token yang diturunkan dari isi
+(backend tanpa change counter, mis. pyperclip) sama dengan token isi yang sama
+yang disalin pengguna nanti, jadi tidak diingat permanen: setiap tulisan
+hanya melewatkan satu perubahan berikutnya. Opsional (`restore`), isi teks
+clipboard pengguna dikembalikan setelah paste, kecuali clipboard sudah
+diubah lagi oleh pengguna sebelum waktunya.
+
+Modul ini tidak bergantung pada Cocoa: backend clipboard (lihat
+auto_sum_clipboard.py; MemoryClipboard dengan `write_lag` di Linux) dan
+pengirim keystroke dimasukkan sebagai objek/callable.
+"""
+import collections
+import threading
+import time
+
+from auto_sum_log import get_logger
+
+CONFIRM_TIMEOUT_SECONDS = 0.25  # Batas tunggu konfirmasi tulis sebelum paste dibatalkan
+SPIN_INTERVAL_SECONDS = 0.002   # Tidur per putaran setelah BUSY_SPINS putaran pertama
+BUSY_SPINS = 50                 # Putaran tanpa tidur (tulis biasanya langsung terlihat)
+RESTORE_DELAY_SECONDS = 0.3     # Jeda agar aplikasi target selesai membaca clipboard
+OWN_TOKENS = 16                 # Token tulisan sendiri yang diingat
+
+log = get_logger('paste')
+
+
+class PasteCoordinator(object):
+    """Menulis clipboard, menunggu konfirmasi, lalu mengirim keystroke paste.
+
+    `clipboard` adalah backend dengan ``probe()``, ``read()``, ``write(text)``
+    dan ``has_change_count``; `send_paste()` mengirim Cmd+V ke aplikasi
+    terdepan. Dipakai dari thread worker dan thread utama sekaligus; semua
+    tulisan dan cek token dikunci, jadi ``is_own_token`` dari thread utama
+    menunggu tulisan yang sedang dikonfirmasi selesai (tapi tidak menunggu
+    keystroke paste, yang dikirim setelah lock dilepas).
+    """
+
+    def __init__(self, clipboard, send_paste, confirm_timeout=CONFIRM_TIMEOUT_SECONDS,
+                 spin_interval=SPIN_INTERVAL_SECONDS, busy_spins=BUSY_SPINS, restore=False,
+                 restore_delay=RESTORE_DELAY_SECONDS, clock=time.monotonic, sleep=time.sleep):
+        self.clipboard = clipboard
+        self.send_paste = send_paste
+        self.confirm_timeout = confirm_timeout
+        self.spin_interval = spin_interval
+        self.busy_spins = busy_spins
+        self.restore = restore
+        self.restore_delay = restore_delay
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.RLock()
+        self._own_tokens = collections.deque(maxlen=OWN_TOKENS)
+        self._unseen_tokens = collections.deque(maxlen=OWN_TOKENS)  # Token isi, sekali pakai
+        self._restore_timer = None
+        self._restore_state = None  # (isi asli, token tulisan kita)
+        self.pastes = 0
+        self.confirm_failures = 0
+        self.restores = 0
+        self.spins = 0
+
+    def copy(self, text):
+        """Menulis `text` ke clipboard dan menunggu konfirmasi; True bila terkonfirmasi."""
+        with self._lock:
+            self._cancel_restore()
+            return self._write_confirmed(text) is not None
+
+    def paste(self, text):
+        """Menulis `text`, lalu mengirim keystroke paste begitu tulisan terkonfirmasi.
+
+        Mengembalikan False bila tulisan tidak terkonfirmasi dalam
+        `confirm_timeout` atau keystroke gagal dikirim.
+        """
+        with self._lock:
+            # Restore yang tertunda dibatalkan, tapi isi aslinya tetap yang dikembalikan nanti
+            original = self._cancel_restore()
+            if self.restore and original is None:
+                try:
+                    original = self.clipboard.read()
+                except Exception as e:
+                    log.warning("Could not read clipboard to restore later: %s", e)
+            try:
+                token = self._write_confirmed(text)
+            except Exception as e:
+                log.error("Error during paste process: %s", e)
+                return False
+            if token is None:
+                return False
+            # Isi asli dicatat sebelum lock dilepas: paste lain yang masuk selagi
+            # keystroke dikirim mengambil alih isi asli ini lewat _cancel_restore.
+            state = (original, token) if original is not None and original != text else None
+            self._restore_state = state
+
+        # Keystroke (osascript, bisa sampai hitungan detik) dikirim tanpa lock, agar
+        # is_own_token dari thread utama tidak ikut menunggu.
+        try:
+            self.send_paste()
+            pasted = True
+        except Exception as e:
+            log.error("Error during paste process: %s", e)
+            pasted = False
+
+        with self._lock:
+            if pasted:
+                self.pastes += 1
+                log.debug("Pasted %r (clipboard token %r).", text, token)
+            if state is not None and self._restore_state is state:
+                if pasted:
+                    self._schedule_restore()
+                else:
+                    self._restore_state = None
+        return pasted
+
+    def is_own_token(self, token):
+        """True bila token clipboard berasal dari tulisan koordinator ini.
+
+        Dipanggil sekali per perubahan clipboard (lihat ClipboardWatcher). Token
+        turunan isi hanya cocok untuk satu perubahan: perubahan lain berarti
+        tulisan kita yang belum terlihat sudah ditimpa pengguna.
+        """
+        with self._lock:
+            if token in self._own_tokens:
+                return True
+            unseen = self._unseen_tokens
+            if token in unseen:
+                while unseen.popleft() != token:
+                    pass
+                return True
+            unseen.clear()
+            return False
+
+    def flush(self):
+        """Menjalankan restore yang masih tertunda sekarang (mis. saat monitoring dihentikan)."""
+        with self._lock:
+            if self._restore_timer is None:
+                return
+            self._restore_timer.cancel()
+            self._restore_timer = None
+            self._restore()
+
+    def stats(self):
+        return {'pastes': self.pastes, 'confirm_failures': self.confirm_failures,
+                'restores': self.restores, 'spins': self.spins}
+
+    # --- Internal ---
+
+    def _write_confirmed(self, text):
+        # Dipanggil dengan _lock dipegang. Mengembalikan token setelah tulis, atau None.
+        clipboard = self.clipboard
+        counter = getattr(clipboard, 'has_change_count', False)
+        before = clipboard.probe() if counter else None
+        clipboard.write(text)
+        deadline = self.clock() + self.confirm_timeout
+        spins = 0
+        while True:
+            token = clipboard.probe()
+            # Tanpa change counter token diturunkan dari isi, jadi cukup baca kembali
+            if token is not None and (not counter or token != before) and clipboard.read() == text:
+                (self._own_tokens if counter else self._unseen_tokens).append(token)
+                self.spins += spins
+                return token
+            if self.clock() >= deadline:
+                break
+            spins += 1
+            if spins > self.busy_spins:
+                self.sleep(self.spin_interval)
+        self.spins += spins
+        self.confirm_failures += 1
+        log.warning("Clipboard write not confirmed within %.3f s.", self.confirm_timeout)
+        return None
+
+    def _schedule_restore(self):
+        # Dipanggil dengan _lock dipegang dan _restore_state sudah diisi
+        if self.restore_delay <= 0:
+            self._restore()
+            return
+        timer = threading.Timer(self.restore_delay, lambda: self._restore_later(timer))
+        timer.daemon = True
+        self._restore_timer = timer
+        timer.start()
+
+    def _restore_later(self, timer):
+        with self._lock:
+            if self._restore_timer is not timer:
+                return  # Sudah dibatalkan atau digantikan selagi menunggu lock
+            self._restore_timer = None
+            self._restore()
+
+    def _restore(self):
+        # Dipanggil dengan _lock dipegang
+        state, self._restore_state = self._restore_state, None
+        if state is None:
+            return
+        original, token = state
+        try:
+            if self.clipboard.probe() != token:
+                log.debug("Clipboard changed since paste; not restoring.")
+                return
+            if self._write_confirmed(original) is not None:
+                self.restores += 1
+        except Exception as e:
+            log.warning("Could not restore clipboard: %s", e)
+
+    def _cancel_restore(self):
+        # Dipanggil dengan _lock dipegang; mengembalikan isi asli restore yang dibatalkan
+        if self._restore_timer is not None:
+            self._restore_timer.cancel()
+            self._restore_timer = None
+        state, self._restore_state = self._restore_state, None
+        return state[0] if state is not None else None
@@ -1,45 +1,68 @@
-import pyperclip
 import time
-import re
-import subprocess
 import sys # To check platform
 
+import auto_sum_applescript as applescript
+from auto_sum_cache import ResultCache
+from auto_sum_clipboard import ClipboardWatcher, get_default_clipboard
+from auto_sum_format import get_profile
+from auto_sum_frontmost import FrontmostAppTracker
+from auto_sum_log import configure as configure_logging, get_logger, preview, timed
+from auto_sum_paste import PasteCoordinator
+from auto_sum_pipeline import ClipboardProcessor
+from auto_sum_scheduler import AdaptiveScheduler
+from auto_sum_stats import StatsCollector
+
 # --- Configuration ---
-CHECK_INTERVAL_SECONDS = 1.0 # How often to check clipboard
+CHECK_INTERVAL_SECONDS = 1.0 # Base clipboard check interval (adapted at runtime)
+BURST_INTERVAL_SECONDS = 0.1 # Interval right after the clipboard changed
+MAX_IDLE_INTERVAL_SECONDS = 5.0 # Upper bound for the idle backoff
 WORD_APP_NAME = "Microsoft Word" # Check this in Activity Monitor if unsure
+FRONTMOST_APP_TTL_SECONDS = 2.0 # Reuse the frontmost app answer for this long
 #DECIMAL_PLACES = 2 # How many decimal places for the sum string
-OUTPUT_DECIMAL_SEPARATOR = ',' # Use comma for the final output string
-OUTPUT_THOUSANDS_SEPARATOR = '.' # Use dot for the final output string
+INPUT_LOCALE = 'id' # Number format of copied text: 'id' (1.234,56), 'de', 'us' (1,234.56), 'ch' (1'234.56), 'in' (12,34,567.89)
+OUTPUT_LOCALE = 'id' # Number format of the pasted sum (same choices, see auto_sum_format.py)
+DEBUG_OUTPUT = False # Print every parsed number (slow for very large pastes)
+ACCUMULATOR_ENGINE = 'fixed' # 'fixed' (exact, default), 'decimal' (exact) or 'kahan' (float)
+INCREMENTAL_SUM = True # Extended selections: only parse the newly added part
+PARSE_WORKERS = None # Parse very large pastes in parallel; None = one worker per core, 1 = serial
+RESTORE_CLIPBOARD = False # Put the original clipboard text back after pasting the sum into Word
+TABLE_MODE = True # Sum spreadsheet/Word table pastes per column instead of one grand total
+TABLE_COLUMN = None # Column total to paste: header label (e.g. "Total") or 0-based index; None = all numeric columns
+CACHE_MAX_ENTRIES = 32 # Result cache for clipboard payloads copied again
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+STATS_CAPACITY = 500 # Per-event stage timings kept for the p50/p95/p99 report on exit
+STATS_EXPORT_PATH = None # e.g. "auto_sum_stats.json" or ".csv": dump the timings on exit
+PROFILE_EVENTS = 0 # Run cProfile for the first N clipboard changes (written to auto_sum_profile.prof)
+LOG_LEVEL = 'INFO' # 'DEBUG' adds per-stage timings; 'WARNING' only reports problems (or AUTO_SUM_LOG_LEVEL)
+
+log = get_logger('cli')
 
 
 # --- Helper Functions ---
 
 def run_applescript(script):
-    """Executes an AppleScript command and returns its output."""
+    """Executes an AppleScript command and returns its output.
+
+    Scripts are sent to one long-lived osascript session (see
+    auto_sum_applescript.py) instead of spawning a process per call.
+    """
     if sys.platform != 'darwin':
-        print("AppleScript execution requires macOS.")
+        log.warning("AppleScript execution requires macOS.")
         return None
     try:
-        process = subprocess.run(
-            ['osascript', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True, # Raise exception on non-zero exit code
-            timeout=5 # Prevent hanging indefinitely
-        )
-        return process.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript Error: {e.stderr}")
-        # Might need permission in Privacy & Security > Automation
+        return applescript.run_applescript(script)
+    except applescript.AppleScriptTimeout:
+        log.warning("AppleScript command timed out.")
         return None
-    except subprocess.TimeoutExpired:
-        print("AppleScript command timed out.")
+    except applescript.AppleScriptError as e:
+        log.warning("AppleScript Error: %s", e)
+        # Might need permission in Privacy & Security > Automation
         return None
     except FileNotFoundError:
-        print("Error: 'osascript' command not found. Is this macOS?")
+        log.error("'osascript' command not found. Is this macOS?")
         return None
     except Exception as e:
-        print(f"An unexpected error occurred running AppleScript: {e}")
+        log.exception("An unexpected error occurred running AppleScript: %s", e)
         return None
 
 def get_frontmost_app():
@@ -57,196 +80,213 @@ def get_frontmost_app():
     '''
     return run_applescript(script)
 
-def paste_string_via_applescript(text_to_paste):
-    """ Puts text on clipboard and tells System Events to paste (Cmd+V).
-        Assumes the target application (Word) is already frontmost.
+def send_paste_keystroke():
+    """ Tells System Events to paste (Cmd+V).
+        Assumes the target application (Word) is already frontmost and the
+        PasteCoordinator has confirmed the sum is on the clipboard.
     """
-    try:
-        # 1. Put the desired sum onto the clipboard
-        pyperclip.copy(text_to_paste)
-        print(f"Copied '{text_to_paste}' to clipboard for pasting.")
-        time.sleep(0.1) # Small delay to ensure clipboard is updated
-
-        # 2. Tell System Events to simulate Cmd+V
-        script = '''
-            tell application "System Events"
-                keystroke "v" using command down
-            end tell
-        '''
-        run_applescript(script) # We don't need the output here
-        print("Sent paste command (Cmd+V).")
-        return True
-    except Exception as e:
-        # Catch potential pyperclip errors too
-        print(f"Error during paste process: {e}")
-        return False
+    script = '''
+        tell application "System Events"
+            keystroke "v" using command down
+        end tell
+    '''
+    run_applescript(script) # We don't need the output here
+    log.debug("Sent paste command (Cmd+V).")
 
 def show_notification(title, text):
      """Uses osascript to show a macOS notification (Fallback)."""
      if sys.platform != 'darwin':
-        print(f"Notification (non-macOS): {title} - {text}")
+        log.info("Notification (non-macOS): %s - %s", title, text)
         return
      try:
          safe_text = text.replace('"', '\\"')
          safe_title = title.replace('"', '\\"')
          script = f'display notification "{safe_text}" with title "{safe_title}"'
-         subprocess.run(['osascript', '-e', script], check=True, timeout=5)
+         applescript.run_applescript(script)
      except Exception as e:
-         print(f"Error showing notification: {e}")
-         print(f"NOTIFICATION: {title} - {text}")
+         log.error("Error showing notification: %s", e)
+         log.warning("NOTIFICATION: %s - %s", title, text)
 
-def format_number_indonesian(number, decimal_places=0):
-    """Formats a number into Indonesian string format (e.g., 1.234,56)."""
+
+# --- Main Monitoring Logic ---
+
+def main():
+    print("--- Automatic Sum (Indonesian Format) & Paste to Word Monitor ---")
+    print(f"Monitoring clipboard. Will paste sum into '{WORD_APP_NAME}' if active.")
+    print("Press Ctrl+C to stop.")
+    configure_logging(LOG_LEVEL, stream=sys.stdout, fmt="%(message)s")
+
+    # Locale profiles: parse pattern for the copied text, formatter for the sum
+    input_locale = get_profile(INPUT_LOCALE)
+    format_number = get_profile(OUTPUT_LOCALE).format
+
+    # Clipboard backend with a cheap change probe (NSPasteboard changeCount on
+    # macOS); the full content is only read when the probe reports a change.
+    clipboard = get_default_clipboard()
+    # Confirms each clipboard write before sending Cmd+V (no fixed sleep) and
+    # remembers its own writes so the watcher never re-sums them
+    paster = PasteCoordinator(clipboard, send_paste_keystroke, restore=RESTORE_CLIPBOARD)
+    clipboard_watcher = ClipboardWatcher(clipboard, is_own=paster.is_own_token)
+
+    # LRU cache of results for recently seen clipboard payloads
+    # (set AUTO_SUM_CACHE_BYPASS=1 to disable while debugging)
+    result_cache = ResultCache(max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES)
+
+    # Frontmost app cache. This loop has no Cocoa run loop, so NSWorkspace push
+    # notifications never arrive here; answers are reused for a short TTL instead.
+    frontmost_app = FrontmostAppTracker(get_frontmost_app, ttl=FRONTMOST_APP_TTL_SECONDS)
+
+    # Same summing logic as the menu bar app (see auto_sum_pipeline.py): result
+    # cache, per-column table sums, incremental and parallel parsing. This loop
+    # calls summarize() synchronously instead of running a worker thread.
+    processor = ClipboardProcessor(
+        frontmost_app.get, paster.paste, paster.copy, format_number, WORD_APP_NAME,
+        engine=ACCUMULATOR_ENGINE, collect_numbers=DEBUG_OUTPUT, incremental=INCREMENTAL_SUM,
+        cache=result_cache, workers=PARSE_WORKERS, table_mode=TABLE_MODE, column=TABLE_COLUMN,
+        locale=input_locale,
+    )
+
+    # Adaptive polling: ~100 ms right after a change, slower while idle
+    scheduler = AdaptiveScheduler(
+        base_interval=CHECK_INTERVAL_SECONDS,
+        burst_interval=BURST_INTERVAL_SECONDS,
+        max_interval=MAX_IDLE_INTERVAL_SECONDS,
+    )
+
+    # Per-event stage timings (read, parse, frontmost, paste, notify)
+    stats = StatsCollector(STATS_CAPACITY)
+    if PROFILE_EVENTS:
+        stats.profile_next(PROFILE_EVENTS, "auto_sum_profile.prof")
+
+    previous_clipboard_content = ""
     try:
-        # Format with standard US locale first to handle decimals correctly
-        # Using f-string formatting for precision control
-        formatted_us = f"{number:,.{decimal_places}f}"
-
-        # Standard f-string formatting uses ',' for thousands and '.' for decimal.
-        # We need to swap them.
-        # Replace comma with a temporary placeholder
-        temp_replace = formatted_us.replace(',', 'TEMP_THOUSANDS')
-        # Replace dot with the desired decimal separator (comma)
-        temp_replace = temp_replace.replace('.', OUTPUT_DECIMAL_SEPARATOR)
-        # Replace the placeholder with the desired thousands separator (dot)
-        final_formatted = temp_replace.replace('TEMP_THOUSANDS', OUTPUT_THOUSANDS_SEPARATOR)
-
-        # If decimal_places was 0, the formatted_us string might end with ".0"
-        # or ",0" after our swaps. We need to remove that specific ending.
-        if decimal_places == 0:
-           if final_formatted.endswith(f"{OUTPUT_DECIMAL_SEPARATOR}0"):
-              final_formatted = final_formatted[:-2] # Remove the last 2 chars (e.g., ",0")
-
-        # Handle potential negative sign placement if needed (usually correct)
-        return final_formatted
+        # Get initial clipboard content to avoid immediate trigger on start
+        previous_clipboard_content = clipboard_watcher.reset()
     except Exception as e:
-        print(f"Error formatting number: {e}")
-        return str(number) # Fallback to simple string conversion
+        log.warning("Could not read initial clipboard content. %s", e)
 
 
-# --- Main Monitoring Logic ---
+    try:
+        while True:
+            current_clipboard_content = None
+            try:
+                read_start = time.perf_counter()
+                current_clipboard_content = clipboard_watcher.poll()
+                timings = {'read': time.perf_counter() - read_start}
+            except Exception as e:
+                # Handle potential errors accessing clipboard (e.g., if copied by some protected apps)
+                log.warning("Error reading clipboard: %s. Skipping this check.", e)
+                # If clipboard is inaccessible, back off (exponentially, with jitter)
+                # until a read succeeds again
+                time.sleep(scheduler.record_error())
+                continue # Skip the rest of this loop iteration
+
+            # Proceed only if clipboard content was read successfully and changed
+            if current_clipboard_content is not None and current_clipboard_content != previous_clipboard_content:
+                log.info("\nClipboard changed (%d chars).", len(current_clipboard_content))
+                profile = stats.profile_start()
+                next_interval = scheduler.record_hit() # Burst mode: check more often for a while
+                # Store the *new* content as the "previous" for the *next* check *before* modification
+                previous_clipboard_content = current_clipboard_content # Update tracking
+
+                parse_start = time.perf_counter()
+                # Single-pass scan and sum (see auto_sum_parser.py), or per-column sums
+                # for tab-separated grids (see auto_sum_table.py); the exact total is
+                # rounded half-even and formatted with 0 decimal places
+                result, sum_string_formatted, table = processor.summarize(current_clipboard_content, TABLE_COLUMN)
+                if table is not None:
+                    # Pasting the configured column total (all numeric columns by default)
+                    column = table.pick(TABLE_COLUMN)
+                    log.info("Table: %d rows, %d header rows; pasting %r", table.rows, table.header_rows, column.name)
+                    for other in table.columns:
+                        if other.result:
+                            log.info("  %s = %s%s", other.name,
+                                     format_number(other.result.rounded, decimal_places=0),
+                                     f" (skipped: {other.kind})" if other.skipped else "")
+                timings['parse'] = time.perf_counter() - parse_start
+                log.debug("parse took %.2f ms", timings['parse'] * 1e3)
+                total_sum = result.total
+
+                if result:
+                    num_count = result.count
+                    rounded_total_sum = result.rounded
+
+                    if DEBUG_OUTPUT:
+                        log.debug("Angka yang berhasil di-parse (setelah dibersihkan): %s", preview(result.numbers))
+                    log.info("Jumlah angka = %s, Min = %s, Max = %s", num_count, result.minimum, result.maximum)
+                    log.info("JUMLAH ASLI = %s", total_sum) # Show original sum for comparison
+                    log.info("JUMLAH DIBULATKAN = %s (String diformat: %s)", rounded_total_sum, sum_string_formatted)
+
+                    # Check the frontmost application
+                    with timed(log, 'frontmost', timings):
+                        front_app = frontmost_app.get()
+                    log.info("Frontmost application: %r", front_app)
+
+                    if front_app == WORD_APP_NAME:
+                        log.info("%r is active. Attempting to paste sum...", WORD_APP_NAME)
+                        # --- PASTE ACTION ---
+                        with timed(log, 'paste', timings):
+                            pasted = paster.paste(sum_string_formatted)
+                        if pasted:
+                           log.info("Successfully pasted %r into Word.", sum_string_formatted)
+                           # IMPORTANT: The clipboard now holds sum_string. Update
+                           # previous_clipboard_content again to prevent the script
+                           # immediately re-calculating the sum from the pasted value.
+                           previous_clipboard_content = sum_string_formatted
+                        else:
+                           log.warning("Paste attempt failed. Showing notification instead.")
+                           # Fallback to notification if paste fails
+                           with timed(log, 'notify', timings):
+                               show_notification("Clipboard Sum (Paste Failed)", f"Sum = {sum_string_formatted}")
+                           # Decide if clipboard should contain the sum or original content after failed paste
+                           # Let's leave the sum on the clipboard for now.
+                           paster.copy(sum_string_formatted)
+                           previous_clipboard_content = sum_string_formatted # Track clipboard holds sum
 
-print("--- Automatic Sum (Indonesian Format) & Paste to Word Monitor ---")
-print(f"Monitoring clipboard. Will paste sum into '{WORD_APP_NAME}' if active.")
-print("Press Ctrl+C to stop.")
-
-previous_clipboard_content = ""
-try:
-    # Get initial clipboard content to avoid immediate trigger on start
-    previous_clipboard_content = pyperclip.paste()
-except Exception as e:
-    print(f"Warning: Could not read initial clipboard content. {e}")
-
-
-try:
-    while True:
-        current_clipboard_content = None
-        try:
-            current_clipboard_content = pyperclip.paste()
-        except Exception as e:
-            # Handle potential errors accessing clipboard (e.g., if copied by some protected apps)
-            print(f"Error reading clipboard: {e}. Skipping this check.")
-            # If clipboard is inaccessible, wait and try again
-            time.sleep(CHECK_INTERVAL_SECONDS * 2) # Wait a bit longer
-            continue # Skip the rest of this loop iteration
-
-        # Proceed only if clipboard content was read successfully and changed
-        if current_clipboard_content is not None and current_clipboard_content != previous_clipboard_content:
-            print("\nClipboard changed.")
-            # Store the *new* content as the "previous" for the *next* check *before* modification
-            original_new_content = current_clipboard_content
-            previous_clipboard_content = current_clipboard_content # Update tracking
-
-            # Regex to find potential numbers (including ., and sign)
-            # It's broad, we will clean and validate later
-            # Regex to find sequences potentially representing numbers (digits, dots, commas)
-            potential_numbers_str = re.findall(r"[-+]?[\d.,]+", current_clipboard_content)
-            print(f"Menemukan string angka potensial: {potential_numbers_str}")
-            total_sum = 0.0
-            valid_numbers = []
-
-            for num_str in potential_numbers_str:
-                # *** START INDONESIAN FORMAT CLEANING ***
-                # 1. Remove thousands separators (dots)
-                cleaned_str = num_str.replace('.', '').replace(',', '.')
-                # *** END INDONESIAN FORMAT CLEANING ***
-
-                try:
-                    # Attempt conversion *after* cleaning
-                    number = float(cleaned_str)
-                    # Check if the original string actually contained digits
-                    # (prevents converting just "." or "," which become "" or ".")
-                    if any(char.isdigit() for char in num_str):
-                         total_sum += number
-                         valid_numbers.append(number)
-                         # print(f"  Berhasil konversi '{num_str}' -> '{cleaned_str}' -> {number}") # Debug
-                    # else: # Debug
-                    #    print(f"  (Mengabaikan '{num_str}' -> '{cleaned_str}' - tidak ada digit)")
-
-                except ValueError:
-                    # This string wasn't a valid number even after cleaning
-                    # (e.g., "1.2.3,4,5" or "..." or ",,")
-                    # print(f"  (Mengabaikan '{num_str}' -> '{cleaned_str}' - ValueError)") # Debug
-                    pass # Silently ignore invalid conversions
-
-            if valid_numbers:
-                num_count = len(valid_numbers)
-
-                # --- ROUNDING STEP ---
-                rounded_total_sum = round(total_sum)
-                # --- END ROUNDING STEP ---
-
-                # Format the ROUNDED integer sum into Indonesian string format
-                # Pass the rounded integer and explicitly request 0 decimal places for formatting
-
-                sum_string_formatted = format_number_indonesian(rounded_total_sum, decimal_places=0)
-
-                print(f"Angka yang berhasil di-parse (setelah dibersihkan): {valid_numbers}")
-                print(f"JUMLAH ASLI = {total_sum}") # Show original sum for comparison
-                print(f"JUMLAH DIBULATKAN = {rounded_total_sum} (String diformat: {sum_string_formatted})")
-
-                # Check the frontmost application
-                front_app = get_frontmost_app()
-                print(f"Frontmost application: '{front_app}'")
-
-                if front_app == WORD_APP_NAME:
-                    print(f"'{WORD_APP_NAME}' is active. Attempting to paste sum...")
-                    # --- PASTE ACTION ---
-                    if paste_string_via_applescript(sum_string_formatted):
-                       print(f"Successfully pasted '{sum_string_formatted}' into Word.")
-                       # IMPORTANT: The clipboard now holds sum_string. Update
-                       # previous_clipboard_content again to prevent the script
-                       # immediately re-calculating the sum from the pasted value.
-                       previous_clipboard_content = sum_string_formatted
                     else:
-                       print("Paste attempt failed. Showing notification instead.")
-                       # Fallback to notification if paste fails
-                       show_notification("Clipboard Sum (Paste Failed)", f"Sum = {sum_string_formatted}")
-                       # Decide if clipboard should contain the sum or original content after failed paste
-                       # Let's leave the sum on the clipboard for now.
-                       pyperclip.copy(sum_string_formatted)
-                       previous_clipboard_content = sum_string_formatted # Track clipboard holds sum
+                        log.info("%r is not active. Putting sum on clipboard and notifying.", WORD_APP_NAME)
+                        # --- NOTIFICATION ACTION (Word not active) ---
+                        # Put the sum on the clipboard anyway, user might want it
+                        paster.copy(sum_string_formatted)
+                        # Update tracking since we modified the clipboard
+                        previous_clipboard_content = sum_string_formatted
+                        with timed(log, 'notify', timings):
+                            show_notification("Clipboard Sum Calculated", f"Sum = {sum_string_formatted} (Copied to clipboard)")
 
                 else:
-                    print(f"'{WORD_APP_NAME}' is not active. Putting sum on clipboard and notifying.")
-                    # --- NOTIFICATION ACTION (Word not active) ---
-                    # Put the sum on the clipboard anyway, user might want it
-                    pyperclip.copy(sum_string_formatted)
-                    # Update tracking since we modified the clipboard
-                    previous_clipboard_content = sum_string_formatted
-                    show_notification("Clipboard Sum Calculated", f"Sum = {sum_string_formatted} (Copied to clipboard)")
+                     log.info("No valid numbers found in new clipboard content.")
+                     # Do nothing further if no numbers found
+                stats.profile_stop(profile)
+                stats.add(timings)
+            else:
+                next_interval = scheduler.record_miss() # Idle: back off gradually
+
+            # Wait before the next check
+            time.sleep(next_interval)
 
+    except KeyboardInterrupt:
+        print("\n--- Monitor stopped by user ---")
+    except Exception as e:
+        # Catch any other unexpected errors in the main loop
+        log.exception("An critical error occurred in the main loop: %s", e)
+    finally:
+        paster.flush() # Pending clipboard restore, if any
+        log.info("Scheduler stats: %s", scheduler.stats())
+        log.info("Frontmost app cache stats: %s", frontmost_app.stats())
+        log.info("Paste stats: %s", paster.stats())
+        log.info("Result cache stats: %s", result_cache.stats())
+        for line in stats.summary_lines():
+            log.info("Timing %s", line)
+        if STATS_EXPORT_PATH and len(stats):
+            if STATS_EXPORT_PATH.endswith('.csv'):
+                stats.export_csv(STATS_EXPORT_PATH)
             else:
-                 print("No valid numbers found in new clipboard content.")
-                 # Do nothing further if no numbers found
-
-        # Wait before the next check
-        time.sleep(CHECK_INTERVAL_SECONDS)
-
-except KeyboardInterrupt:
-    print("\n--- Monitor stopped by user ---")
-except Exception as e:
-    # Catch any other unexpected errors in the main loop
-    print(f"\nAn critical error occurred in the main loop: {e}")
-finally:
-    print("Exiting.")
\ No newline at end of file
+                stats.export_json(STATS_EXPORT_PATH)
+            log.info("Timings written to %s", STATS_EXPORT_PATH)
+        print("Exiting.")
+
+
+if __name__ == "__main__":
+    # Guard required: parallel parse workers (auto_sum_parallel.py) re-import
+    # this module when they start
+    main()
@@ -0,0 +1,318 @@
+"""
+Pipeline pekerja (worker) untuk memproses perubahan clipboard di luar thread UI.
+
+Thread utama (timer rumps) hanya membaca clipboard lalu memanggil
+``SumPipeline.submit(text)``. Satu thread latar belakang menjalankan parse,
+query aplikasi terdepan (osascript) dan paste. Hasilnya diambil kembali oleh
+thread utama lewat ``SumPipeline.drain()`` untuk notifikasi dan update menu.
+
+Modul ini sengaja tidak bergantung pada Cocoa/rumps: semua aksi ke luar
+(clipboard, AppleScript) dimasukkan sebagai callable, sehingga pipeline bisa
+dijalankan headless di Linux dengan clipboard dan script runner palsu.
+"""
+import queue
+import threading
+
+from auto_sum_log import get_logger, timed
+from auto_sum_parallel import sum_numbers_parallel
+from auto_sum_parser import IncrementalSummer
+from auto_sum_table import looks_tabular, sum_table
+
+# Aksi yang diambil untuk satu job
+ACTION_NONE = 'none'              # Tidak ada angka valid
+ACTION_PASTED = 'pasted'          # Jumlah di-paste ke aplikasi target
+ACTION_PASTE_FAILED = 'paste_failed'  # Paste gagal, jumlah disalin ke clipboard
+ACTION_COPIED = 'copied'          # Aplikasi target tidak aktif, jumlah disalin
+ACTION_ERROR = 'error'            # Exception tak terduga di worker
+
+log = get_logger('pipeline')
+
+
+class JobResult(object):
+    """Hasil satu job yang dikembalikan ke thread utama."""
+
+    __slots__ = ('generation', 'result', 'formatted', 'front_app', 'action', 'error', 'timings',
+                 'table', 'column')
+
+    def __init__(self, generation, result=None, formatted=None, front_app=None,
+                 action=ACTION_NONE, error=None, timings=None, table=None, column=None):
+        self.generation = generation
+        self.result = result          # SumResult
+        self.formatted = formatted    # Jumlah dalam format Indonesia
+        self.front_app = front_app
+        self.action = action
+        self.error = error
+        self.timings = timings if timings is not None else {}  # Durasi per tahap (detik)
+        self.table = table            # TableResult bila clipboard berisi tabel
+        self.column = column          # ColumnTotal yang dipakai untuk `result`
+
+    def __repr__(self):
+        return (f"JobResult(generation={self.generation}, action={self.action!r}, "
+                f"formatted={self.formatted!r}, front_app={self.front_app!r})")
+
+
+class StaleJob(Exception):
+    """Dilempar di worker bila job sudah digantikan perubahan clipboard yang lebih baru."""
+
+
+class ClipboardProcessor(object):
+    """Logika inti satu perubahan clipboard: parse, cek aplikasi terdepan, paste/salin.
+
+    Semua efek samping lewat callable yang diberikan:
+    ``get_front_app()``, ``paste_text(text) -> bool`` dan ``copy_text(text)``.
+    Durasi tahap parse, frontmost dan paste dicatat di ``JobResult.timings``;
+    bila `stats` (StatsCollector) diberikan, job bisa diprofil dengan cProfile.
+
+    Dengan `table_mode`, clipboard berbentuk tabel (sel dipisah tab) dijumlah
+    per kolom (lihat auto_sum_table.py); yang di-paste adalah total kolom
+    pilihan ``column`` (indeks atau label header, diubah lewat select_column)
+    atau, secara default, gabungan semua kolom angka.
+
+    `locale` (LocaleProfile, lihat auto_sum_format.py) memilih format angka
+    input; format output ditentukan oleh callable `format_number`.
+    """
+
+    def __init__(self, get_front_app, paste_text, copy_text, format_number,
+                 target_app_name, engine='fixed', collect_numbers=False, incremental=False,
+                 cache=None, workers=1, stats=None, table_mode=False, column=None, locale=None):
+        self.get_front_app = get_front_app
+        self.paste_text = paste_text
+        self.copy_text = copy_text
+        self.format_number = format_number
+        self.target_app_name = target_app_name
+        self.engine = engine
+        self.collect_numbers = collect_numbers
+        self.workers = workers  # Worker parse paralel untuk paste besar (None: per core CPU)
+        self.locale = locale
+        # Hanya dipakai dari satu thread worker, jadi state-nya tidak perlu dikunci
+        self.summer = IncrementalSummer(engine, workers=workers, locale=locale) if incremental else None
+        self.cache = cache  # ResultCache opsional (lihat auto_sum_cache.py)
+        self.stats = stats  # StatsCollector opsional (lihat auto_sum_stats.py)
+        self.table_mode = table_mode
+        self.column = column  # Dibaca worker, diganti thread utama (assignment atomik)
+
+    def select_column(self, column):
+        """Memilih kolom tabel yang di-paste berikutnya (None: semua kolom angka)."""
+        self.column = column
+
+    def summarize(self, text, column=None):
+        """(SumResult, string terformat atau None, TableResult atau None) untuk `text`.
+
+        Hasil diambil dari cache bila ada. Untuk tabel, SumResult adalah total
+        kolom `column` (lihat TableResult.pick).
+        """
+        cached = self.cache.get(text) if self.cache is not None else None
+        if cached is not None:
+            log.debug("Result cache hit (%d chars)", len(text))
+            result, formatted, table = cached.result, cached.formatted, cached.table
+        else:
+            table = None
+            if self.table_mode and looks_tabular(text):
+                table = sum_table(text, self.engine, locale=self.locale)
+                if table.pick() is None:
+                    table = None  # Tidak ada kolom angka: jumlah biasa saja
+            if table is not None:
+                result = formatted = None
+            else:
+                if self.summer is not None:
+                    result = self.summer.sum(text, collect_numbers=self.collect_numbers)
+                else:
+                    result = sum_numbers_parallel(text, collect_numbers=self.collect_numbers,
+                                                  engine=self.engine, workers=self.workers,
+                                                  locale=self.locale)
+                formatted = self.format_number(result.rounded, decimal_places=0) if result else None
+            if self.cache is not None:
+                self.cache.put(text, result, formatted, table)
+        if table is not None:
+            result = table.pick(column).result
+            formatted = self.format_number(result.rounded, decimal_places=0)
+        return result, formatted, table
+
+    def __call__(self, generation, text, is_stale, mark_own_write):
+        if self.stats is None:
+            return self._process(generation, text, is_stale, mark_own_write)
+        with self.stats.profiled():
+            return self._process(generation, text, is_stale, mark_own_write)
+
+    def _process(self, generation, text, is_stale, mark_own_write):
+        timings = {}
+        log.debug("Processing %d chars", len(text))
+        choice = self.column  # Satu kali baca: pilihan bisa diganti thread utama kapan saja
+        with timed(log, 'parse', timings):
+            result, formatted, table = self.summarize(text, choice)
+        if not result:
+            return JobResult(generation, result, timings=timings)
+        column = table.pick(choice) if table is not None else None
+        return self._deliver(generation, result, formatted, is_stale, mark_own_write, timings,
+                             table, column)
+
+    def deliver_column(self, generation, column, is_stale, mark_own_write):
+        """Paste/salin total kolom `column` (ColumnTotal) yang dipilih dari menu.
+
+        Dijalankan di thread worker lewat SumPipeline.submit_column, sebab cek
+        aplikasi terdepan dan keystroke paste memanggil osascript.
+        """
+        timings = {}
+        formatted = self.format_number(column.result.rounded, decimal_places=0)
+        return self._deliver(generation, column.result, formatted, is_stale, mark_own_write,
+                             timings, None, column)
+
+    def _deliver(self, generation, result, formatted, is_stale, mark_own_write, timings,
+                 table, column):
+        if is_stale():
+            raise StaleJob()
+        with timed(log, 'frontmost', timings):
+            front_app = self.get_front_app()
+        if is_stale():
+            raise StaleJob()
+
+        # Catat tulisan ke clipboard *sebelum* menulis, agar thread utama tidak
+        # memperlakukan jumlah yang kita salin sebagai perubahan baru.
+        mark_own_write(formatted)
+        if front_app == self.target_app_name:
+            with timed(log, 'paste', timings):
+                pasted = self.paste_text(formatted)
+            if pasted:
+                action = ACTION_PASTED
+            else:
+                self.copy_text(formatted)
+                action = ACTION_PASTE_FAILED
+        else:
+            self.copy_text(formatted)
+            action = ACTION_COPIED
+        return JobResult(generation, result, formatted, front_app, action, timings=timings,
+                         table=table, column=column)
+
+
+class SumPipeline(object):
+    """Antrian terbatas + satu thread worker untuk ClipboardProcessor.
+
+    Setiap ``submit`` menaikkan nomor generasi. Job (dan hasil) dengan generasi
+    lebih lama dari yang terbaru dianggap basi dan dibuang.
+    """
+
+    def __init__(self, processor, max_pending=2):
+        self.processor = processor
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._own_write = None
+        self._pending = 0
+        self._thread = None
+        self.dropped_jobs = 0
+
+    # --- Dipanggil dari thread utama ---
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="auto-sum-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """Menghentikan worker; job yang belum diproses dibuang."""
+        if self._thread is None:
+            return
+        with self._lock:
+            self._generation += 1  # Semua job yang tersisa jadi basi
+        self._put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, text):
+        """Menjadwalkan teks clipboard baru; mengembalikan nomor generasinya."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._pending += 1
+        self._put((generation, self.processor, text))
+        return generation
+
+    def submit_column(self, column):
+        """Menjadwalkan paste/salin total kolom tabel `column`; mengembalikan generasinya.
+
+        Seperti ``submit``, job ini menggantikan job yang masih tertunda.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._pending += 1
+        self._put((generation, self.processor.deliver_column, column))
+        return generation
+
+    def drain(self):
+        """Mengambil semua hasil yang sudah selesai dan masih terkini."""
+        finished = []
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if item.generation == self._generation:
+                finished.append(item)
+        return finished
+
+    @property
+    def busy(self):
+        """True selama masih ada job yang menunggu atau sedang diproses."""
+        with self._lock:
+            return self._pending > 0 or not self._results.empty()
+
+    def is_own_write(self, text):
+        """True bila `text` adalah jumlah yang baru saja ditulis worker ke clipboard."""
+        with self._lock:
+            return self._own_write is not None and text == self._own_write
+
+    # --- Internal ---
+
+    def _put(self, item):
+        # Antrian penuh: buang job tertua (pasti basi) lalu coba lagi.
+        while True:
+            try:
+                self._jobs.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._jobs.get_nowait()
+                except queue.Empty:
+                    continue
+                if dropped is not None:
+                    self._job_done()
+                    self.dropped_jobs += 1
+
+    def _job_done(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _is_stale(self, generation):
+        return generation != self._generation
+
+    def _mark_own_write(self, text):
+        with self._lock:
+            self._own_write = text
+
+    def _run(self):
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            generation, handler, payload = item
+            try:
+                if self._is_stale(generation):
+                    self.dropped_jobs += 1
+                    continue
+                try:
+                    job_result = handler(
+                        generation, payload,
+                        lambda: self._is_stale(generation),
+                        self._mark_own_write,
+                    )
+                except StaleJob:
+                    self.dropped_jobs += 1
+                    continue
+                except Exception as e:
+                    log.exception("Unexpected error processing clipboard")
+                    job_result = JobResult(generation, action=ACTION_ERROR, error=e)
+                self._results.put(job_result)
+            finally:
+                self._job_done()
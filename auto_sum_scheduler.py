@@ -0,0 +1,115 @@
+"""
+Penjadwal polling clipboard yang adaptif.
+
+Menggantikan interval tetap CHECK_INTERVAL_SECONDS:
+
+* Burst : setelah ada perubahan clipboard, interval dipersempit ke
+          ``burst_interval`` (±100 ms) selama ``burst_window`` detik, karena
+          pengguna biasanya menyalin beberapa sel berturut-turut.
+* Idle  : setelah jendela burst lewat, interval kembali ke ``base_interval``
+          lalu dikalikan ``idle_backoff`` setiap tick tanpa perubahan, sampai
+          batas ``max_interval``.
+* Error : bila membaca clipboard gagal berulang kali, interval naik
+          eksponensial (``base_interval * 2**n``, maksimal ``error_max_interval``)
+          dengan jitter, dan baru kembali normal setelah baca berhasil.
+
+Setiap ``record_*`` mengembalikan interval (detik) sampai tick berikutnya.
+"""
+import random
+import time
+
+
+class AdaptiveScheduler(object):
+
+    def __init__(self, base_interval=1.0, burst_interval=0.1, burst_window=10.0,
+                 max_interval=5.0, idle_backoff=1.25, error_max_interval=30.0,
+                 jitter=0.2, clock=time.monotonic, rng=random.random):
+        self.base_interval = base_interval
+        self.burst_interval = burst_interval
+        self.burst_window = burst_window
+        self.max_interval = max_interval
+        self.idle_backoff = idle_backoff
+        self.error_max_interval = error_max_interval
+        self.jitter = jitter
+        self.clock = clock
+        self.rng = rng
+
+        self.interval = base_interval
+        self.consecutive_errors = 0
+        self._last_activity = None
+        self._last_tick = None
+
+        # Counter untuk tuning
+        self.ticks = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._latency_total = 0.0
+        self._latency_samples = 0
+
+    def reset(self):
+        """Kembali ke interval dasar (mis. saat monitoring dimulai ulang)."""
+        self.interval = self.base_interval
+        self.consecutive_errors = 0
+        self._last_activity = None
+        self._last_tick = None
+
+    def _tick(self):
+        now = self.clock()
+        since_last = None if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        self.ticks += 1
+        return now, since_last
+
+    def record_hit(self):
+        """Tick yang menemukan perubahan clipboard."""
+        now, since_last = self._tick()
+        self.hits += 1
+        self.consecutive_errors = 0
+        if since_last is not None:
+            # Perubahan terjadi di suatu titik antara dua tick; rata-rata
+            # keterlambatan deteksinya setengah jarak antar tick.
+            self._latency_total += since_last / 2
+            self._latency_samples += 1
+        self._last_activity = now
+        self.interval = self.burst_interval
+        return self.interval
+
+    def record_miss(self):
+        """Tick tanpa perubahan clipboard."""
+        now, _ = self._tick()
+        self.misses += 1
+        self.consecutive_errors = 0
+        if self._last_activity is not None and now - self._last_activity < self.burst_window:
+            self.interval = self.burst_interval
+        elif self.interval < self.base_interval:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.interval * self.idle_backoff, self.max_interval)
+        return self.interval
+
+    def record_error(self):
+        """Tick yang gagal membaca clipboard; backoff bertahan sampai baca berhasil."""
+        self._tick()
+        self.errors += 1
+        self.consecutive_errors += 1
+        backoff = min(self.base_interval * 2 ** self.consecutive_errors, self.error_max_interval)
+        self.interval = backoff * (1 + self.jitter * (2 * self.rng() - 1))
+        return self.interval
+
+    @property
+    def avg_detection_latency(self):
+        """Perkiraan rata-rata keterlambatan deteksi perubahan (detik)."""
+        if not self._latency_samples:
+            return 0.0
+        return self._latency_total / self._latency_samples
+
+    def stats(self):
+        return {
+            'ticks': self.ticks,
+            'hits': self.hits,
+            'misses': self.misses,
+            'errors': self.errors,
+            'interval': round(self.interval, 3),
+            'avg_detection_latency': round(self.avg_detection_latency, 3),
+        }
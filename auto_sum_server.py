@@ -0,0 +1,216 @@
+"""
+Server penjumlahan headless lewat Unix domain socket (asyncio).
+
+Penjumlahan format Indonesia yang sama dengan AutoSumApp, tapi bisa dipanggil
+dari skrip dan tool lain tanpa lewat clipboard:
+
+    python3 auto_sum_server.py [--socket /tmp/auto_sum-501.sock] [--engine fixed]
+
+Protokol (per koneksi, request boleh dikirim beruntun tanpa menunggu jawaban
+/ pipelining; jawaban selalu dikirim sesuai urutan request):
+
+* Satu baris teks = satu payload (diakhiri ``\\n``), maks. ``MAX_LINE_BYTES``.
+* ``LEN <n>\\n`` diikuti tepat `n` byte UTF-8 = satu payload berapa pun
+  isinya (boleh multi-baris). Body dibaca dan di-scan per potongan, jadi
+  payload besar tidak pernah ditampung utuh di memori.
+
+Jawaban: satu objek JSON per baris, misalnya::
+
+    {"id": 1, "ok": true, "count": 3, "sum": "1234.5", "rounded": 1234,
+     "formatted": "1.234", "min": -5.0, "max": 1000.0}
+    {"id": 2, "ok": false, "error": "payload too large (...)"}
+
+`sum` adalah total eksak dalam bentuk string (Decimal/int untuk mesin 'fixed'
+dan 'decimal'), `formatted` adalah total yang dibulatkan dalam format
+Indonesia (null bila tidak ada angka).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import tempfile
+
+from auto_sum_accumulators import DEFAULT_ENGINE, ENGINES
+from auto_sum_format import format_number_indonesian, json_float
+from auto_sum_log import configure as configure_logging, get_logger
+from auto_sum_parser import StreamingSum
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), f"auto_sum-{os.getuid()}.sock")
+MAX_PAYLOAD_BYTES = 64 * 1024 * 1024  # Batas satu payload LEN
+MAX_LINE_BYTES = 1024 * 1024          # Batas satu payload baris; lebih besar pakai LEN
+READ_CHUNK_BYTES = 64 * 1024
+LENGTH_HEADER = b'LEN '
+
+log = get_logger('server')
+
+
+def make_response(request_id, result):
+    return {
+        'id': request_id,
+        'ok': True,
+        'count': result.count,
+        'sum': str(result.total),
+        'rounded': result.rounded,
+        'formatted': format_number_indonesian(result.rounded, decimal_places=0) if result else None,
+        'min': json_float(result.minimum),
+        'max': json_float(result.maximum),
+    }
+
+
+class SumServer(object):
+    """Server asyncio; satu task per klien, request tiap koneksi diproses berurutan."""
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH, engine=DEFAULT_ENGINE,
+                 max_payload=MAX_PAYLOAD_BYTES, max_line=MAX_LINE_BYTES):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown accumulator engine: {engine!r}")
+        self.path = path
+        self.engine = engine
+        self.max_payload = max_payload
+        self.max_line = min(max_line, max_payload)
+        self._server = None
+        self.clients = 0
+        self.requests = 0
+        self.errors = 0
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # Sisa server lama yang tidak berhenti dengan bersih
+        self._server = await asyncio.start_unix_server(self.handle_client, self.path,
+                                                       limit=self.max_line + 1)
+        os.chmod(self.path, 0o600)  # Hanya user yang sama
+        log.info("Listening on %s (engine %s)", self.path, self.engine)
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def stats(self):
+        return {'clients': self.clients, 'requests': self.requests, 'errors': self.errors}
+
+    async def handle_client(self, reader, writer):
+        self.clients += 1
+        request_id = 0
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as e:
+                    if not e.partial:
+                        break  # Klien menutup koneksi
+                    line = e.partial  # Payload terakhir tanpa newline
+                except asyncio.LimitOverrunError:
+                    request_id += 1
+                    await self._send_error(writer, request_id,
+                                           f"line longer than {self.max_line} bytes; use a LEN header")
+                    break  # Sisa baris tidak bisa disinkronkan lagi
+                request_id += 1
+
+                if line.startswith(LENGTH_HEADER):
+                    try:
+                        length = int(line[len(LENGTH_HEADER):])
+                    except ValueError:
+                        length = -1
+                    if length < 0:
+                        # reader.read(-1) akan membaca sampai EOF dan menelan request berikutnya
+                        await self._send_error(writer, request_id, "invalid LEN header")
+                        break
+                    if length > self.max_payload:
+                        await self._send_error(writer, request_id,
+                                               f"payload too large ({length} > {self.max_payload} bytes)")
+                        if not await self._discard(reader, length):
+                            break
+                        continue
+                    result = await self._read_body(reader, length)
+                    if result is None:
+                        break  # Koneksi putus di tengah body
+                else:
+                    summer = StreamingSum(self.engine)
+                    summer.feed(line.rstrip(b'\r\n'))
+                    result = summer.finish()
+
+                self.requests += 1
+                writer.write(json.dumps(make_response(request_id, result), allow_nan=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, BrokenPipeError):
+                pass
+
+    async def _read_body(self, reader, length):
+        summer = StreamingSum(self.engine)
+        remaining = length
+        while remaining:
+            chunk = await reader.read(min(READ_CHUNK_BYTES, remaining))
+            if not chunk:
+                return None
+            summer.feed(chunk)
+            remaining -= len(chunk)
+        return summer.finish()
+
+    async def _discard(self, reader, length):
+        while length:
+            chunk = await reader.read(min(READ_CHUNK_BYTES, length))
+            if not chunk:
+                return False
+            length -= len(chunk)
+        return True
+
+    async def _send_error(self, writer, request_id, message):
+        self.errors += 1
+        log.warning("Request %d rejected: %s", request_id, message)
+        writer.write(json.dumps({'id': request_id, 'ok': False, 'error': message}).encode('utf-8') + b'\n')
+        await writer.drain()
+
+
+def request_sum(text, path=DEFAULT_SOCKET_PATH, timeout=30.0):
+    """Klien sinkron sederhana untuk skrip: kirim `text` (LEN), kembalikan dict jawaban."""
+    data = text.encode('utf-8')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(LENGTH_HEADER + str(len(data)).encode('ascii') + b'\n')
+        sock.sendall(data)
+        with sock.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+async def _serve(args):
+    server = await SumServer(args.socket, args.engine, int(args.max_payload_mb * 1024 * 1024)).start()
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        log.info("Server stats: %s", server.stats())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auto Sum headless server (Unix socket, JSON lines)")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    parser.add_argument('--engine', default=DEFAULT_ENGINE, choices=sorted(ENGINES))
+    parser.add_argument('--max-payload-mb', type=float, default=MAX_PAYLOAD_BYTES / 1024 / 1024)
+    parser.add_argument('--log-level', default='INFO')
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Laporan waktu impor (gaya ``python -X importtime``) untuk bagian non-GUI Auto Sum.
+
+Setiap modul diimpor di proses Python baru dengan ``-X importtime``; hasilnya
+diringkas menjadi waktu impor kumulatif per modul dan daftar impor paling
+lambat. Bisa dijalankan di CI (Linux, tanpa rumps/AppKit) dengan batas waktu:
+
+    python3 auto_sum_startup.py                      # modul yang diimpor saat launch
+    python3 auto_sum_startup.py --group monitoring   # modul yang diimpor saat Mulai Monitoring
+    python3 auto_sum_startup.py --max-ms 50 --json   # gagal (exit 1) bila lebih lambat
+
+Waktu sampai ikon tampil diukur oleh aplikasinya sendiri:
+``python3 auto_sum_statusbar.py --startup-timing`` (atau AUTO_SUM_STARTUP_TIMING=1).
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# Modul yang diimpor auto_sum_statusbar.py saat launch (selain rumps)
+LAUNCH_MODULES = ('auto_sum_log', 'auto_sum_stats')
+# Modul yang baru diimpor saat monitoring pertama kali dimulai
+MONITORING_MODULES = ('auto_sum_cache', 'auto_sum_clipboard', 'auto_sum_format', 'auto_sum_frontmost',
+                      'auto_sum_paste', 'auto_sum_pipeline', 'auto_sum_scheduler', 'auto_sum_applescript')
+GROUPS = {'launch': LAUNCH_MODULES, 'monitoring': MONITORING_MODULES}
+
+
+def parse_importtime(stderr):
+    """Baris ``import time: self | cumulative | name`` -> list (nama, self_us, cumulative_us).
+
+    Indentasi nama dipertahankan: nama tanpa spasi di depan adalah impor tingkat atas.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            entries.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return entries
+
+
+def measure(modules, python=sys.executable):
+    """Mengimpor `modules` di proses baru; mengembalikan (total_us, {modul: us}, entries)."""
+    statement = '; '.join(f"import {module}" for module in modules)
+    process = subprocess.run([python, '-X', 'importtime', '-c', statement],
+                             capture_output=True, text=True, check=True)
+    entries = parse_importtime(process.stderr)
+    # Impor tingkat atas = modul yang diminta plus dependensi yang belum pernah diimpor
+    total = sum(cumulative for name, _, cumulative in entries if not name.startswith(' '))
+    requested = {name: cumulative for name, _, cumulative in entries if name in modules}
+    return total, requested, entries
+
+
+def report(group='launch', top=10, python=sys.executable):
+    modules = GROUPS[group]
+    total, requested, entries = measure(modules, python)
+    slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]
+    slowest = [(name.strip(), self_us, cumulative) for name, self_us, cumulative in slowest]
+    return {
+        'group': group,
+        'python': sys.version.split()[0],
+        'total_ms': total / 1e3,
+        'modules_ms': {name: us / 1e3 for name, us in requested.items()},
+        'slowest_self_ms': [(name, us / 1e3) for name, us, _ in slowest],
+        'imported': len(entries),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auto Sum import-time report (non-GUI modules)")
+    parser.add_argument('--group', choices=sorted(GROUPS), default='launch')
+    parser.add_argument('--top', type=int, default=10, help="number of slowest imports to list")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--max-ms', type=float, help="exit with status 1 if total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    result = report(args.group, args.top)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{args.group}: {result['total_ms']:.1f} ms total, {result['imported']} modules imported")
+        for name, ms in result['modules_ms'].items():
+            print(f"  {name:<24} {ms:>8.1f} ms cumulative")
+        print("Slowest imports (self time):")
+        for name, ms in result['slowest_self_ms']:
+            print(f"  {name:<24} {ms:>8.1f} ms")
+    if args.max_ms is not None and result['total_ms'] > args.max_ms:
+        print(f"Import time {result['total_ms']:.1f} ms exceeds {args.max_ms} ms", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Statistik durasi per event clipboard (ringan, aman dibiarkan aktif di produksi).
+
+Setiap perubahan clipboard menghasilkan satu dict ``{tahap: detik}`` untuk
+tahap-tahap di ``STAGES`` (baca clipboard, parse, query aplikasi terdepan,
+paste, notifikasi). ``StatsCollector`` menyimpan event terakhir dalam ring
+buffer berukuran tetap; persentil (p50/p95/p99) baru dihitung saat diminta,
+mis. saat menu Statistik diperbarui atau diekspor ke JSON/CSV.
+
+``profile_next(n)`` mengaktifkan cProfile untuk `n` event berikutnya (lewat
+``with collector.profiled():`` atau ``profile_start``/``profile_stop`` di
+sekitar pekerjaan satu event); hasilnya
+ditulis ke file .prof yang bisa dibuka dengan ``python -m pstats``.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from auto_sum_log import get_logger
+
+# cProfile, csv dan json baru diimpor saat dipakai agar start aplikasi tetap ringan
+
+STAGES = ('read', 'parse', 'frontmost', 'paste', 'notify', 'total')
+PERCENTILES = (50, 95, 99)
+
+log = get_logger('stats')
+
+
+def percentile(ordered, pct):
+    """Persentil (nearest-rank) dari list yang sudah diurutkan."""
+    if not ordered:
+        return None
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class StatsCollector(object):
+    """Ring buffer `capacity` event terakhir beserta agregasi persentilnya."""
+
+    def __init__(self, capacity=500, clock=time.time):
+        self.capacity = capacity
+        self.clock = clock
+        self._events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.total_events = 0
+
+        self._profiler = None
+        self._profile_remaining = 0
+        self._profile_path = None
+
+    def add(self, timings):
+        """Mencatat satu event. `timings` berisi durasi per tahap dalam detik."""
+        timings = dict(timings)
+        if 'total' not in timings:
+            timings['total'] = sum(timings.values())
+        with self._lock:
+            self._events.append((self.clock(), timings))
+            self.total_events += 1
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self.total_events = 0
+
+    def __len__(self):
+        return len(self._events)
+
+    def aggregate(self):
+        """{tahap: {'count', 'p50', 'p95', 'p99', 'max'}} atas event di buffer (detik)."""
+        with self._lock:
+            events = [timings for _, timings in self._events]
+        summary = {}
+        for stage in STAGES:
+            values = sorted(timings[stage] for timings in events if stage in timings)
+            if not values:
+                continue
+            row = {'count': len(values)}
+            for pct in PERCENTILES:
+                row[f"p{pct}"] = percentile(values, pct)
+            row['max'] = values[-1]
+            summary[stage] = row
+        return summary
+
+    def summary_lines(self):
+        """Satu baris teks per tahap untuk menu Statistik / output CLI."""
+        lines = []
+        for stage, row in self.aggregate().items():
+            lines.append(f"{stage}: p50 {row['p50'] * 1e3:.1f} ms, p95 {row['p95'] * 1e3:.1f} ms, "
+                         f"p99 {row['p99'] * 1e3:.1f} ms (n={row['count']})")
+        return lines
+
+    def export_json(self, path):
+        import json
+        with self._lock:
+            events = [{'time': timestamp, **timings} for timestamp, timings in self._events]
+        with open(path, 'w') as f:
+            json.dump({'aggregate': self.aggregate(), 'events': events}, f, indent=2)
+        return path
+
+    def export_csv(self, path):
+        import csv
+        with self._lock:
+            events = list(self._events)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('time',) + STAGES)
+            for timestamp, timings in events:
+                writer.writerow([f"{timestamp:.3f}"] + [
+                    '' if timings.get(stage) is None else f"{timings[stage]:.6f}" for stage in STAGES
+                ])
+        return path
+
+    # --- Profiling opsional ---
+
+    def profile_next(self, events, path):
+        """Memprofil `events` event berikutnya dengan cProfile; hasil ditulis ke `path`."""
+        import cProfile
+        with self._lock:
+            self._profiler = cProfile.Profile()
+            self._profile_remaining = events
+            self._profile_path = path
+
+    @property
+    def profiling(self):
+        return self._profile_remaining > 0
+
+    def profile_start(self):
+        """Mulai memprofil satu event bila profiling aktif; kembalikan token untuk profile_stop."""
+        profiler = self._profiler if self._profile_remaining > 0 else None
+        if profiler is not None:
+            profiler.enable()
+        return profiler
+
+    def profile_stop(self, profiler):
+        if profiler is None:
+            return
+        profiler.disable()
+        with self._lock:
+            self._profile_remaining -= 1
+            done = self._profile_remaining <= 0 and self._profiler is profiler
+            if done:
+                self._profiler = None
+        if done:
+            profiler.dump_stats(self._profile_path)
+            log.info("Profile written to %s", self._profile_path)
+
+    @contextmanager
+    def profiled(self):
+        """Menjalankan blok di bawah cProfile bila profiling sedang aktif."""
+        profiler = self.profile_start()
+        try:
+            yield
+        finally:
+            self.profile_stop(profiler)
@@ -1,29 +1,52 @@
-import pyperclip
 import time
-import re
-import subprocess
+LAUNCH_TIME = time.perf_counter() # Sedini mungkin, untuk mode --startup-timing
+
+import os
 import sys
 import rumps # <-- Import library rumps
 
+from auto_sum_log import configure as configure_logging, get_logger, preview, timed
+from auto_sum_stats import STAGES, StatsCollector
+# Modul lain (clipboard, parser, pipeline, osascript, AppKit observer) baru
+# diimpor saat monitoring pertama kali dimulai, agar ikon muncul secepat mungkin.
+
 # --- Konfigurasi (tetap sama) ---
-CHECK_INTERVAL_SECONDS = 1.0
+CHECK_INTERVAL_SECONDS = 1.0 # Interval dasar; penjadwal adaptif menyesuaikannya
+BURST_INTERVAL_SECONDS = 0.1 # Interval sesaat setelah clipboard berubah
+MAX_IDLE_INTERVAL_SECONDS = 5.0 # Batas atas backoff saat idle
+RESULT_POLL_INTERVAL_SECONDS = 0.05 # Seberapa cepat hasil worker diambil selama ada job berjalan
 WORD_APP_NAME = "Microsoft Word"
-OUTPUT_DECIMAL_SEPARATOR = ','
-OUTPUT_THOUSANDS_SEPARATOR = '.'
+FRONTMOST_APP_TTL_SECONDS = 2.0 # Umur cache aplikasi terdepan bila notifikasi NSWorkspace tidak tersedia
+INPUT_LOCALE = 'id' # Format angka yang disalin: 'id' (1.234,56), 'de', 'us' (1,234.56), 'ch' (1'234.56), 'in' (12,34,567.89)
+OUTPUT_LOCALE = 'id' # Format jumlah yang di-paste (pilihan sama, lihat auto_sum_format.py)
+DEBUG_OUTPUT = False # True: cetak semua angka yang berhasil di-parse
+ACCUMULATOR_ENGINE = 'fixed' # 'fixed' (eksak, default), 'decimal' (eksak) atau 'kahan' (float)
+INCREMENTAL_SUM = True # Seleksi yang diperpanjang: hanya bagian baru yang di-parse ulang
+PARSE_WORKERS = None # Paste sangat besar di-parse paralel; None = satu worker per core, 1 = serial
+RESTORE_CLIPBOARD = False # True: isi clipboard semula dikembalikan setelah jumlah di-paste ke Word
+TABLE_MODE = True # Paste tabel (Excel/Word) dijumlah per kolom; pilih kolom lewat menu "Kolom Tabel"
+CACHE_MAX_ENTRIES = 32 # Cache hasil untuk isi clipboard yang disalin berulang
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+STATS_CAPACITY = 500 # Jumlah event terakhir untuk statistik p50/p95/p99
+PROFILE_EVENTS = 20 # Menu "Profil ... event berikutnya" menjalankan cProfile selama sekian event
+STATS_EXPORT_DIR = "~/Library/Logs/AutoSum" # Tujuan ekspor JSON/CSV dan file .prof
+STARTUP_TIMING = '--startup-timing' in sys.argv or bool(os.environ.get('AUTO_SUM_STARTUP_TIMING'))
+LOG_LEVEL = 'WARNING' # Tenang untuk produksi; 'DEBUG' menampilkan durasi per tahap (atau AUTO_SUM_LOG_LEVEL)
+
+log = get_logger('statusbar')
 
 # --- Fungsi Helper (tetap sama, tidak perlu diubah) ---
 def run_applescript(script):
+    # Lewat sesi osascript persisten (lihat auto_sum_applescript.py), bukan proses baru per panggilan
     if sys.platform != 'darwin': return None
+    import auto_sum_applescript as applescript
     try:
-        process = subprocess.run(
-            ['osascript', '-e', script], capture_output=True, text=True, check=True, timeout=5
-        )
-        return process.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript Error: {e.stderr}")
+        return applescript.run_applescript(script)
+    except applescript.AppleScriptError as e:
+        log.warning("AppleScript Error: %s", e)
         return None
     except Exception as e:
-        print(f"Error running AppleScript: {e}")
+        log.exception("Error running AppleScript: %s", e)
         return None
 
 def get_frontmost_app():
@@ -38,46 +61,26 @@ def get_frontmost_app():
     '''
     return run_applescript(script)
 
-def paste_string_via_applescript(text_to_paste):
-    try:
-        pyperclip.copy(text_to_paste)
-        print(f"Copied '{text_to_paste}' to clipboard for pasting.")
-        time.sleep(0.2)
-        script = '''
-            tell application "System Events"
-                keystroke "v" using command down
-            end tell
-        '''
-        run_applescript(script)
-        print("Sent paste command (Cmd+V).")
-        return True
-    except Exception as e:
-        print(f"Error during paste process: {e}")
-        return False
+def send_paste_keystroke():
+    # Clipboard sudah ditulis dan dikonfirmasi oleh PasteCoordinator (auto_sum_paste.py)
+    script = '''
+        tell application "System Events"
+            keystroke "v" using command down
+        end tell
+    '''
+    run_applescript(script)
+    log.debug("Sent paste command (Cmd+V).")
 
 def show_rumps_notification(title, subtitle, message):
     """Gunakan notifikasi bawaan rumps."""
     try:
         rumps.notification(title=title, subtitle=subtitle, message=message)
     except Exception as e:
-        print(f"Error showing rumps notification: {e}")
-        # Fallback ke print jika notifikasi gagal
-        print(f"NOTIFICATION: {title} - {subtitle} - {message}")
+        log.error("Error showing rumps notification: %s", e)
+        # Fallback ke log jika notifikasi gagal
+        log.warning("NOTIFICATION: %s - %s - %s", title, subtitle, message)
 
 
-def format_number_indonesian(number, decimal_places=0):
-    try:
-        formatted_us = f"{number:,.{max(0, decimal_places)}f}"
-        temp_replace = formatted_us.replace(',', 'TEMP_THOUSANDS')
-        temp_replace = temp_replace.replace('.', OUTPUT_DECIMAL_SEPARATOR)
-        final_formatted = temp_replace.replace('TEMP_THOUSANDS', OUTPUT_THOUSANDS_SEPARATOR)
-        if decimal_places == 0 and final_formatted.endswith(f"{OUTPUT_DECIMAL_SEPARATOR}0"):
-            final_formatted = final_formatted[:-2]
-        return final_formatted
-    except Exception as e:
-        print(f"Error formatting number: {e}")
-        return str(int(round(number)) if isinstance(number, float) else number)
-
 # --- Kelas Aplikasi Status Bar ---
 class AutoSumApp(rumps.App):
     def __init__(self):
@@ -89,20 +92,103 @@ class AutoSumApp(rumps.App):
         self.clipboard_timer = None
         self.previous_clipboard_content = ""
 
+        # Objek monitoring (clipboard, penjadwal, cache, pipeline) dibuat saat
+        # monitoring pertama kali dimulai; lihat setup_monitoring()
+        self.pipeline = None
+
+        # Durasi per event (baca, parse, frontmost, paste, notifikasi) dalam ring buffer
+        self.stats = StatsCollector(STATS_CAPACITY)
+        self.pending_read = (None, 0.0) # (generasi, durasi baca clipboard) job terakhir
+
+        # Total per kolom dari paste tabel terakhir; judul item menu -> (pilihan, ColumnTotal)
+        self.column_items = {}
+
+        self.result_timer = rumps.Timer(self.collect_results, RESULT_POLL_INTERVAL_SECONDS)
+
         # Definisi item menu
         self.menu_start = rumps.MenuItem("Mulai Monitoring", callback=self.start_monitoring)
         self.menu_stop = rumps.MenuItem("Hentikan Monitoring", callback=self.stop_monitoring)
         self.menu_stop.set_callback(self.stop_monitoring) # Pastikan callback terpasang
-        self.menu = [self.menu_start, self.menu_stop]
+        self.menu_cache = rumps.MenuItem("Cache: -") # Info saja, tanpa callback
+        self.menu_columns = rumps.MenuItem("Kolom Tabel")
+        self.menu_stats = rumps.MenuItem("Statistik")
+        self.menu_stats_stages = {stage: rumps.MenuItem(f"{stage}: -") for stage in STAGES}
+        self.menu_profile = rumps.MenuItem(f"Profil {PROFILE_EVENTS} Event Berikutnya",
+                                           callback=self.start_profile)
+        self.menu = [self.menu_start, self.menu_stop, None,
+                     (self.menu_columns, [rumps.MenuItem("Belum ada tabel")]),
+                     self.menu_cache, (self.menu_stats, [
+            *self.menu_stats_stages.values(),
+            None,
+            rumps.MenuItem("Ekspor JSON", callback=self.export_stats_json),
+            rumps.MenuItem("Ekspor CSV", callback=self.export_stats_csv),
+            self.menu_profile,
+            rumps.MenuItem("Reset Statistik", callback=self.reset_stats),
+        ])]
 
         # Nonaktifkan menu "Stop" di awal
         self.menu_stop.set_callback(None) # Hapus callback sementara agar tidak bisa diklik
 
+    def setup_monitoring(self):
+        """Mengimpor dan membuat semua objek monitoring (sekali, saat Mulai pertama)."""
+        from auto_sum_cache import ResultCache
+        from auto_sum_clipboard import ClipboardWatcher, get_default_clipboard
+        from auto_sum_format import get_profile
+        from auto_sum_frontmost import FrontmostAppTracker, start_workspace_observer
+        from auto_sum_paste import PasteCoordinator
+        from auto_sum_pipeline import ClipboardProcessor, SumPipeline
+        from auto_sum_scheduler import AdaptiveScheduler
+
+        # Backend clipboard dengan probe murah (changeCount NSPasteboard bila tersedia)
+        self.clipboard = get_default_clipboard()
+        # Tulis clipboard dikonfirmasi sebelum Cmd+V; token tulisan sendiri dilewati watcher
+        self.paster = PasteCoordinator(self.clipboard, send_paste_keystroke, restore=RESTORE_CLIPBOARD)
+        self.clipboard_watcher = ClipboardWatcher(self.clipboard, is_own=self.paster.is_own_token)
+
+        # Penjadwal polling: burst setelah ada aktivitas, backoff saat idle/error
+        self.scheduler = AdaptiveScheduler(
+            base_interval=CHECK_INTERVAL_SECONDS,
+            burst_interval=BURST_INTERVAL_SECONDS,
+            max_interval=MAX_IDLE_INTERVAL_SECONDS,
+        )
+
+        # Cache aplikasi terdepan; diperbarui lewat notifikasi NSWorkspace bila tersedia,
+        # selain itu query AppleScript dengan TTL pendek
+        self.frontmost_app = FrontmostAppTracker(get_frontmost_app, ttl=FRONTMOST_APP_TTL_SECONDS)
+        if not start_workspace_observer(self.frontmost_app):
+            log.info("NSWorkspace observer unavailable; frontmost app is polled with a TTL.")
+
+        # Cache LRU hasil per isi clipboard (AUTO_SUM_CACHE_BYPASS=1 untuk debug)
+        self.result_cache = ResultCache(max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES)
+        self.menu_cache.title = self.result_cache.summary()
+
+        # Profil lokal: pola parse untuk teks yang disalin, formatter untuk jumlah
+        self.format_number = get_profile(OUTPUT_LOCALE).format
+
+        # Worker latar belakang untuk parse + osascript (lihat auto_sum_pipeline.py)
+        self.pipeline = SumPipeline(ClipboardProcessor(
+            get_front_app=self.frontmost_app.get,
+            paste_text=self.paster.paste,
+            copy_text=self.paster.copy,
+            format_number=self.format_number,
+            target_app_name=WORD_APP_NAME,
+            engine=ACCUMULATOR_ENGINE,
+            collect_numbers=DEBUG_OUTPUT,
+            incremental=INCREMENTAL_SUM,
+            cache=self.result_cache,
+            workers=PARSE_WORKERS,
+            stats=self.stats,
+            table_mode=TABLE_MODE,
+            locale=get_profile(INPUT_LOCALE),
+        ))
+
 
     def start_monitoring(self, sender):
         """Dipanggil saat menu 'Mulai Monitoring' diklik."""
         if not self.monitoring_active:
-            print("Starting monitoring...")
+            log.info("Starting monitoring...")
+            if self.pipeline is None:
+                self.setup_monitoring()
             self.monitoring_active = True
             self.title = "∑•" # Ubah ikon/judul untuk indikasi aktif
 
@@ -110,24 +196,27 @@ class AutoSumApp(rumps.App):
             self.menu_start.set_callback(None) # Nonaktifkan Start
             self.menu_stop.set_callback(self.stop_monitoring) # Aktifkan Stop
 
-            # Baca clipboard awal
+            # Baca clipboard awal (sekaligus baseline untuk probe perubahan)
             try:
-                self.previous_clipboard_content = pyperclip.paste()
+                self.previous_clipboard_content = self.clipboard_watcher.reset()
             except Exception as e:
-                print(f"Warning: Could not read initial clipboard. {e}")
+                log.warning("Could not read initial clipboard. %s", e)
                 self.previous_clipboard_content = ""
 
-            # Buat dan mulai timer untuk check_clipboard
-            self.clipboard_timer = rumps.Timer(self.check_clipboard, CHECK_INTERVAL_SECONDS)
+            self.pipeline.start()
+
+            # Buat dan mulai timer untuk check_clipboard; intervalnya diatur penjadwal adaptif
+            self.scheduler.reset()
+            self.clipboard_timer = rumps.Timer(self.check_clipboard, self.scheduler.interval)
             self.clipboard_timer.start()
-            print("Monitoring started.")
+            log.info("Monitoring started.")
             show_rumps_notification("Auto Sum", "Status", "Monitoring Clipboard Dimulai")
 
 
     def stop_monitoring(self, sender):
         """Dipanggil saat menu 'Hentikan Monitoring' diklik."""
         if self.monitoring_active:
-            print("Stopping monitoring...")
+            log.info("Stopping monitoring...")
             self.monitoring_active = False
             self.title = None # Kembali ke ikon saja
 
@@ -135,11 +224,19 @@ class AutoSumApp(rumps.App):
             if self.clipboard_timer is not None:
                 self.clipboard_timer.stop()
                 self.clipboard_timer = None
+            self.result_timer.stop()
+            self.pipeline.stop(timeout=1.0)
+            self.paster.flush() # Restore clipboard yang masih tertunda
+            log.info("Scheduler stats: %s", self.scheduler.stats())
+            log.info("Paste stats: %s", self.paster.stats())
+            log.info("Frontmost app cache stats: %s", self.frontmost_app.stats())
+            for line in self.stats.summary_lines():
+                log.info("Timing %s", line)
 
             # Update state menu
             self.menu_start.set_callback(self.start_monitoring) # Aktifkan Start
             self.menu_stop.set_callback(None) # Nonaktifkan Stop
-            print("Monitoring stopped.")
+            log.info("Monitoring stopped.")
             show_rumps_notification("Auto Sum", "Status", "Monitoring Clipboard Dihentikan")
 
 
@@ -151,69 +248,168 @@ class AutoSumApp(rumps.App):
 
         current_clipboard_content = None
         try:
-            current_clipboard_content = pyperclip.paste()
+            # Hanya membaca isi penuh clipboard bila probe mendeteksi perubahan
+            read_start = time.perf_counter()
+            current_clipboard_content = self.clipboard_watcher.poll()
+            read_seconds = time.perf_counter() - read_start
         except Exception as e:
-            print(f"Error reading clipboard: {e}. Skipping check.")
-            # Di lingkungan status bar, mungkin lebih baik diam daripada error terus menerus
-            # Pertimbangkan untuk menghentikan monitoring jika error berulang?
+            log.warning("Error reading clipboard: %s. Backing off.", e)
+            # Backoff eksponensial (dengan jitter) bertahan sampai baca berhasil lagi
+            self.reschedule(self.scheduler.record_error())
+            return
+
+        if current_clipboard_content is None or current_clipboard_content == self.previous_clipboard_content:
+            self.reschedule(self.scheduler.record_miss())
+            return
+        self.previous_clipboard_content = current_clipboard_content
+        if self.pipeline.is_own_write(current_clipboard_content):
+            # Jumlah yang baru saja kita salin/paste sendiri, jangan re-trigger
+            self.reschedule(self.scheduler.record_miss())
+            return
+
+        log.info("Clipboard changed (%d chars).", len(current_clipboard_content))
+        self.reschedule(self.scheduler.record_hit()) # Mode burst: cek lebih sering sebentar
+        # Parse, cek aplikasi terdepan dan paste dikerjakan di thread worker;
+        # hasilnya diambil oleh result_timer di thread utama.
+        generation = self.pipeline.submit(current_clipboard_content)
+        self.pending_read = (generation, read_seconds)
+        if not self.result_timer.is_alive():
+            self.result_timer.start()
+
+    def reschedule(self, interval):
+        """Mengganti interval clipboard_timer bila penjadwal adaptif memintanya."""
+        if self.clipboard_timer is None or abs(interval - self.clipboard_timer.interval) < 0.01:
+            return
+        self.clipboard_timer.stop()
+        self.clipboard_timer = rumps.Timer(self.check_clipboard, interval)
+        self.clipboard_timer.start()
+
+    def collect_results(self, sender=None):
+        """Dipanggil result_timer di thread utama: notifikasi & update state dari hasil worker."""
+        for job in self.pipeline.drain():
+            self.handle_result(job)
+        if not self.pipeline.busy:
+            self.result_timer.stop()
+
+    def handle_result(self, job):
+        from auto_sum_pipeline import ACTION_ERROR, ACTION_NONE, ACTION_PASTED, ACTION_PASTE_FAILED
+        result = job.result
+        self.menu_cache.title = self.result_cache.summary()
+        if job.action == ACTION_ERROR:
+            log.error("Error processing clipboard: %s", job.error)
+            return
+        timings = dict(job.timings)
+        if self.pending_read[0] == job.generation:
+            timings['read'] = self.pending_read[1]
+        if job.action == ACTION_NONE:
+            log.info("No valid numbers found.")
+            self.record_stats(timings)
             return
 
-        if current_clipboard_content is not None and current_clipboard_content != self.previous_clipboard_content:
-            print("\nClipboard changed.")
-            original_new_content = current_clipboard_content
-            self.previous_clipboard_content = current_clipboard_content
-
-            # Regex & Logika Penjumlahan (Sama seperti sebelumnya)
-            potential_numbers_str = re.findall(r"[-+]?[\d.,]+", current_clipboard_content)
-            print(f"Found potential numbers: {potential_numbers_str}")
-            total_sum = 0.0
-            valid_numbers = []
-
-            for num_str in potential_numbers_str:
-                cleaned_str = num_str.replace('.', '').replace(',', '.')
-                try:
-                    number = float(cleaned_str)
-                    if any(char.isdigit() for char in num_str):
-                        total_sum += number
-                        valid_numbers.append(number)
-                except ValueError:
-                    pass
-
-            if valid_numbers:
-                rounded_total_sum = round(total_sum)
-                sum_string_formatted = format_number_indonesian(rounded_total_sum, decimal_places=0)
-
-                print(f"Parsed numbers: {valid_numbers}")
-                print(f"Original Sum = {total_sum}")
-                print(f"Rounded Sum = {rounded_total_sum} (Formatted: {sum_string_formatted})")
-
-                front_app = get_frontmost_app()
-                print(f"Frontmost app: '{front_app}'")
-
-                if front_app == WORD_APP_NAME:
-                    print(f"'{WORD_APP_NAME}' active. Attempting paste...")
-                    if paste_string_via_applescript(sum_string_formatted):
-                        print(f"Pasted '{sum_string_formatted}' into Word.")
-                        # Update previous content agar tidak re-trigger dari hasil paste
-                        self.previous_clipboard_content = sum_string_formatted
-                        show_rumps_notification("Auto Sum", f"Pasted to {WORD_APP_NAME}", f"Jumlah = {sum_string_formatted}")
-                    else:
-                        print("Paste failed. Showing notification.")
-                        show_rumps_notification("Auto Sum", "Paste Gagal", f"Jumlah = {sum_string_formatted}")
-                        pyperclip.copy(sum_string_formatted)
-                        self.previous_clipboard_content = sum_string_formatted
+        sum_string_formatted = job.formatted
+        if DEBUG_OUTPUT:
+            log.debug("Parsed numbers: %s", preview(result.numbers))
+        log.info("Count = %s, Min = %s, Max = %s", result.count, result.minimum, result.maximum)
+        log.info("Original Sum = %s", result.total)
+        log.info("Rounded Sum = %s (Formatted: %s)", result.rounded, sum_string_formatted)
+        log.debug("Frontmost app: %r", job.front_app)
+        if job.table is not None:
+            log.info("Table: %d rows, %d columns; pasted column %r",
+                     job.table.rows, len(job.table.columns), job.column.name)
+            self.update_column_menu(job.table, job.column)
+
+        # Worker sudah menaruh jumlah di clipboard; update previous content agar tidak re-trigger
+        self.previous_clipboard_content = sum_string_formatted
+        with timed(log, 'notify', timings):
+            if job.table is None and job.column is not None:
+                # Total kolom yang dipilih dari menu "Kolom Tabel"
+                if job.action == ACTION_PASTED:
+                    show_rumps_notification("Auto Sum", f"Pasted to {WORD_APP_NAME}", f"{job.column.name} = {sum_string_formatted}")
                 else:
-                    print(f"'{WORD_APP_NAME}' not active. Copying sum and notifying.")
-                    pyperclip.copy(sum_string_formatted)
-                    self.previous_clipboard_content = sum_string_formatted
-                    show_rumps_notification("Auto Sum", "Jumlah Dihitung", f"Jumlah = {sum_string_formatted} (Disalin)")
+                    show_rumps_notification("Auto Sum", "Jumlah Kolom Disalin", f"{job.column.name} = {sum_string_formatted}")
+            elif job.action == ACTION_PASTED:
+                log.info("Pasted %r into Word.", sum_string_formatted)
+                show_rumps_notification("Auto Sum", f"Pasted to {WORD_APP_NAME}", f"Jumlah = {sum_string_formatted}")
+            elif job.action == ACTION_PASTE_FAILED:
+                log.warning("Paste failed. Showing notification.")
+                show_rumps_notification("Auto Sum", "Paste Gagal", f"Jumlah = {sum_string_formatted}")
             else:
-                print("No valid numbers found.")
+                log.info("%r not active. Copied sum and notifying.", WORD_APP_NAME)
+                show_rumps_notification("Auto Sum", "Jumlah Dihitung", f"Jumlah = {sum_string_formatted} (Disalin)")
+        self.record_stats(timings)
+
+    # --- Kolom tabel ---
+
+    def update_column_menu(self, table, selected):
+        """Mengisi submenu "Kolom Tabel" dengan total per kolom dari paste tabel terakhir."""
+        self.menu_columns.clear()
+        self.column_items = {}
+        for column in [table.combined, *table.columns]:
+            if not column.result:
+                continue
+            title = f"{column.name}: {self.format_number(column.result.rounded, decimal_places=0)}"
+            if column.skipped:
+                title += f" (dilewati: {column.kind})"
+            item = rumps.MenuItem(title, callback=self.choose_column)
+            item.state = 1 if column is selected else 0
+            # Pilihan diingat per label header (atau indeks) untuk tabel berikutnya
+            choice = None if column.index is None else (column.label or column.index)
+            self.column_items[title] = (choice, column)
+            self.menu_columns.add(item)
+
+    def choose_column(self, sender):
+        """Paste/salin total kolom yang diklik dan jadikan pilihan default."""
+        choice, column = self.column_items[sender.title]
+        self.pipeline.processor.select_column(choice)
+        for item in self.menu_columns.values():
+            item.state = 1 if item is sender else 0
+
+        # Cek aplikasi terdepan dan paste (osascript) dikerjakan worker, bukan thread utama;
+        # notifikasinya muncul lewat handle_result.
+        self.previous_clipboard_content = self.format_number(column.result.rounded, decimal_places=0)
+        self.pipeline.submit_column(column)
+        if not self.result_timer.is_alive():
+            self.result_timer.start()
+
+    # --- Statistik ---
+
+    def record_stats(self, timings):
+        self.stats.add(timings)
+        for stage, row in self.stats.aggregate().items():
+            self.menu_stats_stages[stage].title = (
+                f"{stage}: p50 {row['p50'] * 1e3:.0f} ms · p95 {row['p95'] * 1e3:.0f} ms · "
+                f"p99 {row['p99'] * 1e3:.0f} ms")
+        if not self.stats.profiling:
+            self.menu_profile.title = f"Profil {PROFILE_EVENTS} Event Berikutnya"
+
+    def stats_export_path(self, extension):
+        directory = os.path.expanduser(STATS_EXPORT_DIR)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"auto_sum_stats_{time.strftime('%Y%m%d_%H%M%S')}.{extension}")
+
+    def export_stats_json(self, sender):
+        path = self.stats.export_json(self.stats_export_path('json'))
+        show_rumps_notification("Auto Sum", "Statistik Diekspor", path)
+
+    def export_stats_csv(self, sender):
+        path = self.stats.export_csv(self.stats_export_path('csv'))
+        show_rumps_notification("Auto Sum", "Statistik Diekspor", path)
+
+    def start_profile(self, sender):
+        path = self.stats_export_path('prof')
+        self.stats.profile_next(PROFILE_EVENTS, path)
+        self.menu_profile.title = f"Memprofil {PROFILE_EVENTS} event..."
+        show_rumps_notification("Auto Sum", "Profiling Aktif", f"Hasil: {path}")
+
+    def reset_stats(self, sender):
+        self.stats.reset()
+        for stage, item in self.menu_stats_stages.items():
+            item.title = f"{stage}: -"
 
     @rumps.clicked("Quit") # Menambahkan menu Quit standar
     def quit_app(self, sender):
         """Dipanggil saat menu 'Quit' diklik."""
-        print("Quit clicked.")
+        log.info("Quit clicked.")
         self.stop_monitoring(None) # Pastikan timer berhenti sebelum keluar
         rumps.quit_application()
 
@@ -227,7 +423,21 @@ if __name__ == "__main__":
     # except locale.Error:
     #    print("Warning: Indonesian locale not found, using default.")
 
-    print("Starting Auto Sum Status Bar App...")
+    configure_logging(LOG_LEVEL)
+    log.info("Starting Auto Sum Status Bar App...")
     app = AutoSumApp()
+    if STARTUP_TIMING:
+        # Timer pertama baru jalan setelah run loop aktif, yaitu saat ikon sudah tampil
+        init_done = time.perf_counter()
+
+        def report_startup(timer):
+            timer.stop()
+            icon_visible = time.perf_counter()
+            print(f"Startup: app init {(init_done - LAUNCH_TIME) * 1e3:.1f} ms, "
+                  f"icon visible {(icon_visible - LAUNCH_TIME) * 1e3:.1f} ms after launch")
+            print(f"Modules loaded at launch: {len(sys.modules)}")
+            rumps.quit_application()
+
+        rumps.Timer(report_startup, 0.01).start()
     app.run()
-    print("Application has quit.")
\ No newline at end of file
+    log.info("Application has quit.")
\ No newline at end of file
@@ -0,0 +1,337 @@
+"""
+Penjumlahan per kolom untuk paste tabel (Excel, Numbers, tabel Word).
+
+Tabel yang disalin dari spreadsheet datang sebagai baris (``\\n``/``\\r\\n``)
+berisi sel yang dipisah tab. Penjumlahan biasa meratakan semuanya menjadi
+satu total, sehingga nomor baris, tahun dan kolom ID ikut masuk ke total
+kolom uang. Modul ini men-scan teks sekali, baris demi baris, dan hanya
+menyimpan satu SumScanner per kolom (tidak pernah list 2D sel):
+
+* Sel dihitung sebagai angka hanya bila *seluruh* isinya satu angka format
+  Indonesia (boleh diawali ``Rp`` atau diakhiri ``%``), mis. ``1.234,5``;
+  format lain lewat `locale` (LocaleProfile, lihat auto_sum_format.py).
+* Baris awal tanpa angka (atau yang angkanya hanya deretan minimal dua
+  tahun, mis. ``Produk  2023  2024``) dianggap header dan menjadi label kolom.
+* Kolom yang sebagian besar teks, tanpa header dan berisi nomor urut (1, 2,
+  3, ...) atau tahun, atau ber-header seperti "No"/"ID"/"Tahun" ditandai dan
+  tidak ikut total default ("semua kolom angka").
+* Baris ringkasan yang sudah ada di tabel ("Total", "Jumlah", ...) dilewati
+  agar tidak terhitung dua kali.
+* Jumlah per baris bersifat opsional (``row_sums=True``).
+"""
+import re
+from itertools import islice
+
+from auto_sum_accumulators import DEFAULT_ENGINE, make_accumulator
+from auto_sum_log import get_logger
+from auto_sum_parser import GROUPING_STANDARD, MAX_TOKEN_DIGITS, SumScanner, integer_pattern, parse_token
+
+_CELL_PATTERNS = {}
+
+log = get_logger('table')
+
+
+def cell_pattern(decimal=',', thousands='.', grouping=GROUPING_STANDARD):
+    """Regex satu sel angka utuh: tanda, "Rp" opsional, angka, "%" opsional (di-cache)."""
+    key = (decimal, thousands, grouping)
+    pattern = _CELL_PATTERNS.get(key)
+    if pattern is None:
+        pattern = _CELL_PATTERNS[key] = re.compile(
+            rf"\s*([-+]?)\s*(?:Rp\.?\s*)?({integer_pattern(thousands, grouping)})"
+            rf"(?:{re.escape(decimal)}(\d+))?\s*%?\s*",
+            re.IGNORECASE,
+        )
+    return pattern
+
+
+CELL_PATTERN = cell_pattern()  # Format Indonesia
+_STRIP_DOTS = str.maketrans('', '', '.')
+
+# Jenis kolom; hanya KIND_NUMERIC yang ikut total default
+KIND_NUMERIC = 'numeric'
+KIND_TEXT = 'text'    # Sebagian besar sel bukan angka
+KIND_INDEX = 'index'  # Nomor urut baris: 1, 2, 3, ...
+KIND_YEAR = 'year'    # Semua nilai tahun (1900-2100) tanpa header
+KIND_ID = 'id'        # Header menandakan nomor/kode/tahun
+
+# Label header (huruf kecil) yang menandakan kolom bukan nilai
+ID_LABELS = frozenset(('no', 'no.', 'nomor', 'nomer', '#', 'id', 'kode', 'code',
+                       'nip', 'nik', 'npwp', 'tahun', 'thn', 'year'))
+# Label sel yang menandakan baris ringkasan (total dari baris-baris di atasnya)
+TOTAL_LABELS = frozenset(('total', 'jumlah', 'subtotal', 'sub total', 'grand total',
+                          'total keseluruhan', 'jumlah total', 'sum'))
+MIN_SEQUENCE_ROWS = 3  # Nomor urut baru dikenali setelah sekian baris
+YEAR_RANGE = (1900, 2100)
+ALL_COLUMNS_LABEL = "Semua kolom angka"
+
+
+def iter_lines(text, start=0):
+    """Baris-baris `text` tanpa membangun list (``\\r`` di akhir baris dibuang)."""
+    length = len(text)
+    while start < length:
+        end = text.find('\n', start)
+        if end < 0:
+            end = length
+        line = text[start:end]
+        yield line[:-1] if line.endswith('\r') else line
+        start = end + 1
+
+
+def looks_tabular(text, sample_lines=50):
+    """True bila awal `text` berbentuk grid: minimal 2 baris dan sebagian besar berisi tab."""
+    if '\t' not in text:
+        return False
+    lines = tabbed = 0
+    for line in islice(iter_lines(text), sample_lines):
+        if not line.strip():
+            continue
+        lines += 1
+        if '\t' in line:
+            tabbed += 1
+    return lines >= 2 and tabbed * 2 >= lines
+
+
+def _is_year(number):
+    return YEAR_RANGE[0] <= number <= YEAR_RANGE[1]
+
+
+class _Column(object):
+    """State satu kolom: SumScanner plus penghitung untuk heuristik jenis kolom."""
+
+    __slots__ = ('scanner', 'label', 'text_cells', 'plain_years', 'sequence', 'previous')
+
+    def __init__(self, engine):
+        self.scanner = SumScanner(engine)
+        self.label = ''
+        self.text_cells = 0
+        self.plain_years = 0   # Sel bulat 4 digit tanpa pemisah dalam rentang tahun
+        self.sequence = True   # Semua nilai sejauh ini = nilai sebelumnya + 1
+        self.previous = None
+
+    def add(self, negative, int_part, frac_part, strip):
+        plain = not frac_part and int_part.isdigit()
+        if not int_part.isdigit():
+            int_part = int_part.translate(strip)
+        scanner = self.scanner
+        scanner.accumulator.add(negative, int_part, frac_part)
+        number = parse_token(int_part, frac_part)
+        if negative:
+            number = -number
+        scanner.count += 1
+        if number < scanner.minimum:
+            scanner.minimum = number
+        if number > scanner.maximum:
+            scanner.maximum = number
+
+        if plain and len(int_part) == 4 and _is_year(number):
+            self.plain_years += 1
+        if self.sequence:
+            self.sequence = plain and (self.previous is None or number == self.previous + 1)
+        self.previous = number
+
+    def kind(self, min_numeric_ratio):
+        count = self.scanner.count
+        if not count or count < min_numeric_ratio * (count + self.text_cells):
+            return KIND_TEXT
+        if self.label.strip().lower() in ID_LABELS:
+            return KIND_ID
+        if not self.label and self.plain_years == count:
+            return KIND_YEAR
+        # Header lain ("Qty", "Jumlah") berarti 1, 2, 3 adalah nilai sungguhan
+        if not self.label and self.sequence and count >= MIN_SEQUENCE_ROWS:
+            return KIND_INDEX
+        return KIND_NUMERIC
+
+
+class ColumnTotal(object):
+    """Total satu kolom (atau gabungan semua kolom angka bila `index` None)."""
+
+    __slots__ = ('index', 'label', 'kind', 'result')
+
+    def __init__(self, index, label, kind, result):
+        self.index = index
+        self.label = label
+        self.kind = kind
+        self.result = result  # SumResult
+
+    @property
+    def name(self):
+        if self.index is None:
+            return ALL_COLUMNS_LABEL
+        return self.label or f"Kolom {self.index + 1}"
+
+    @property
+    def skipped(self):
+        return self.kind != KIND_NUMERIC
+
+    def __repr__(self):
+        return f"ColumnTotal({self.name!r}, kind={self.kind!r}, result={self.result!r})"
+
+
+class TableResult(object):
+    """Hasil TableSummer: total per kolom, gabungan kolom angka, dan jumlah per baris."""
+
+    __slots__ = ('columns', 'combined', 'rows', 'header_rows', 'summary_rows', 'row_totals')
+
+    def __init__(self, columns, combined, rows, header_rows, summary_rows=0, row_totals=None):
+        self.columns = columns        # list ColumnTotal, urut kolom
+        self.combined = combined      # ColumnTotal gabungan (index None)
+        self.rows = rows              # Jumlah baris data
+        self.header_rows = header_rows
+        self.summary_rows = summary_rows  # Baris "Total"/"Jumlah" yang dilewati
+        self.row_totals = row_totals  # Total per baris data, bila row_sums=True
+
+    def numeric_columns(self):
+        return [column for column in self.columns if not column.skipped]
+
+    def pick(self, choice=None):
+        """ColumnTotal yang dipilih pengguna, atau gabungan semua kolom angka.
+
+        `choice` boleh indeks kolom (int, dari 0) atau label header. Pilihan
+        yang tidak cocok dengan kolom berisi angka jatuh ke total gabungan.
+        Mengembalikan None bila tidak ada kolom angka sama sekali.
+        """
+        if isinstance(choice, int):
+            if 0 <= choice < len(self.columns) and self.columns[choice].result:
+                return self.columns[choice]
+        elif choice:
+            wanted = choice.strip().lower()
+            for column in self.columns:
+                if column.result and column.label.strip().lower() == wanted:
+                    return column
+        return self.combined if self.combined.result else None
+
+    def __repr__(self):
+        return (f"TableResult(rows={self.rows}, header_rows={self.header_rows}, "
+                f"columns={self.columns!r})")
+
+
+class TableSummer(object):
+    """Penjumlahan tabel (sel dipisah tab) per kolom dalam satu kali scan.
+
+    Baris bisa diberikan satu per satu (``feed_line``) atau sebagai potongan
+    teks sembarang (``feed``, untuk file/stdin); ``result()`` menghasilkan
+    TableResult. Memori sebanding dengan jumlah kolom, bukan jumlah sel,
+    kecuali `row_sums` yang menyimpan satu total per baris.
+
+    `skip_headers` mengaktifkan deteksi header (maks. `max_header_rows`
+    baris awal), `skip_totals` melewati baris ringkasan. Kolom dengan porsi sel angka di bawah `min_numeric_ratio`
+    dianggap kolom teks. `row_columns` membatasi kolom yang ikut jumlah per
+    baris; defaultnya semua kolom kecuali yang ber-header nomor/ID/tahun.
+    `locale` (LocaleProfile) memilih format angka sel; None = format Indonesia.
+    """
+
+    def __init__(self, engine=DEFAULT_ENGINE, skip_headers=True, max_header_rows=3,
+                 skip_totals=True, min_numeric_ratio=0.5, row_sums=False, row_columns=None,
+                 locale=None):
+        self.engine = engine
+        if locale is None:
+            self.pattern, self.strip = CELL_PATTERN, _STRIP_DOTS
+        else:
+            self.pattern = cell_pattern(locale.decimal, locale.parse_thousands, locale.grouping)
+            self.strip = locale.strip_table
+        self.skip_headers = skip_headers
+        self.skip_totals = skip_totals
+        self.max_header_rows = max_header_rows
+        self.min_numeric_ratio = min_numeric_ratio
+        self.row_columns = None if row_columns is None else frozenset(row_columns)
+        self.row_totals = [] if row_sums else None
+        self.columns = []
+        self.rows = 0
+        self.header_rows = 0
+        self.summary_rows = 0
+        self._pending = ''
+
+    def _is_header(self, cells, matches):
+        has_text = False
+        years = 0
+        for cell, match in zip(cells, matches):
+            if match is None:
+                has_text = has_text or bool(cell.strip())
+                continue
+            year = match.group(2)
+            # Panjang dicek sebelum int(): sel ribuan digit tidak boleh sampai ke int()
+            if match.group(1) or match.group(3) or len(year) != 4 or not year.isdigit() \
+                    or not _is_year(int(year)):
+                return False  # Nilai sungguhan, bukan judul kolom seperti "2024"
+            years += 1
+        # Satu tahun di samping teks ("A", "2000") adalah baris data; judul kolom
+        # tahun datang berderet ("Produk", "2023", "2024").
+        return has_text and years != 1
+
+    def feed_line(self, line):
+        if line.endswith('\r'):
+            line = line[:-1]
+        if not line.strip():
+            return
+        cells = line.split('\t')
+        fullmatch = self.pattern.fullmatch
+        matches = [fullmatch(cell) for cell in cells]
+        columns = self.columns
+        while len(columns) < len(cells):
+            columns.append(_Column(self.engine))
+
+        if (self.skip_headers and not self.rows and self.header_rows < self.max_header_rows
+                and self._is_header(cells, matches)):
+            self.header_rows += 1
+            for column, cell in zip(columns, cells):
+                if cell.strip():
+                    column.label = cell.strip()
+            return
+        if self.skip_totals and any(match is None and cell.strip().lower() in TOTAL_LABELS
+                                    for cell, match in zip(cells, matches)):
+            self.summary_rows += 1
+            return
+
+        self.rows += 1
+        row = make_accumulator(self.engine) if self.row_totals is not None else None
+        for index, (cell, match) in enumerate(zip(cells, matches)):
+            column = columns[index]
+            if match is None:
+                if cell.strip():
+                    column.text_cells += 1
+                continue
+            sign, int_part, frac_part = match.groups('')
+            if len(int_part) + len(frac_part) > MAX_TOKEN_DIGITS:
+                log.warning("Skipped a cell longer than %d digits", MAX_TOKEN_DIGITS)
+                continue
+            column.add(sign == '-', int_part, frac_part, self.strip)
+            if row is not None and self._in_row_sum(index):
+                row.add(sign == '-', int_part.translate(self.strip), frac_part)
+        if row is not None:
+            self.row_totals.append(row.total())
+
+    def _in_row_sum(self, index):
+        if self.row_columns is not None:
+            return index in self.row_columns
+        return self.columns[index].label.strip().lower() not in ID_LABELS
+
+    def feed(self, text):
+        """Memproses potongan teks; baris terakhir yang belum lengkap disimpan."""
+        text = self._pending + text
+        end = text.rfind('\n') + 1
+        for line in iter_lines(text[:end]):
+            self.feed_line(line)
+        self._pending = text[end:]
+
+    def result(self):
+        if self._pending:
+            self.feed_line(self._pending)
+            self._pending = ''
+        totals = []
+        combined = SumScanner(self.engine)  # Hanya untuk merge; locale tidak dipakai
+        for index, column in enumerate(self.columns):
+            kind = column.kind(self.min_numeric_ratio)
+            totals.append(ColumnTotal(index, column.label, kind, column.scanner.result()))
+            if kind == KIND_NUMERIC:
+                combined.merge(column.scanner)
+        return TableResult(totals, ColumnTotal(None, '', KIND_NUMERIC, combined.result()),
+                           self.rows, self.header_rows, self.summary_rows, self.row_totals)
+
+
+def sum_table(text, engine=DEFAULT_ENGINE, **options):
+    """Menjumlahkan `text` per kolom; `options` diteruskan ke TableSummer."""
+    summer = TableSummer(engine, **options)
+    for line in iter_lines(text):
+        summer.feed_line(line)
+    return summer.result()
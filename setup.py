@@ -7,8 +7,13 @@ APP_NAME = 'AutoSumApp'
 APP = ['auto_sum_statusbar.py'] # File skrip utama Anda
 DATA_FILES = [] # Tambahkan file data lain jika ada (misal ikon)
 OPTIONS = {
-    'argv_emulation': True, # Memungkinkan drop file ke ikon app (tidak relevan di sini)
-    'packages': ['rumps', 'pyperclip', 're'], # Sebutkan library pihak ketiga
+    # argv_emulation (drop file ke ikon) tidak dipakai dan memperlambat start: dimatikan
+    'packages': ['rumps', 'pyperclip'], # Library pihak ketiga (modul stdlib seperti 're' ikut otomatis)
+    # Modul stdlib yang tidak pernah dipakai aplikasi; tidak dibundel
+    'excludes': ['tkinter', 'unittest', 'doctest', 'pydoc', 'pydoc_data', 'lib2to3', 'distutils',
+                 'setuptools', 'pip', 'ensurepip', 'venv', 'idlelib', 'turtledemo', 'test',
+                 'sqlite3', 'curses', 'xmlrpc', 'ftplib'],
+    'optimize': 2, # Bytecode teroptimasi (-OO): tanpa assert dan docstring
     'iconfile': 'icons8-sigma-32.icns', # (Opsional) Path ke file ikon .icns
     'plist': {
         'CFBundleName': APP_NAME,
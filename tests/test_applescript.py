@@ -0,0 +1,192 @@
+"""Tes protokol dan logika restart ScriptRunner terhadap transport palsu (tanpa osascript)."""
+import json
+import queue
+import sys
+
+import pytest
+
+import auto_sum_applescript as applescript
+from auto_sum_applescript import (AppleScriptError, AppleScriptServerUnavailable,
+                                  AppleScriptTimeout, ProcessTransport, ScriptRunner)
+
+EOF = object()
+
+
+class FakeTransport(object):
+    """Transport di memori; `respond(request)` memberi daftar balasan (dict atau EOF)."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.alive = True
+        self.closed = False
+        self.requests = []
+        self._lines = queue.Queue()
+
+    def write_line(self, line):
+        if not self.alive:
+            raise BrokenPipeError("server exited")
+        request = json.loads(line)
+        self.requests.append(request)
+        for reply in self.respond(request):
+            if reply is EOF:
+                self.alive = False
+                self._lines.put(None)
+            else:
+                self._lines.put(json.dumps(reply))
+
+    def read_line(self, timeout):
+        return self._lines.get(timeout=timeout)
+
+    def close(self):
+        self.alive = False
+        self.closed = True
+
+
+class Factory(object):
+    """transport_factory yang membuat FakeTransport berurutan dari daftar `responders`."""
+
+    def __init__(self, *responders):
+        self.responders = list(responders)
+        self.transports = []
+
+    def __call__(self):
+        respond = self.responders[min(len(self.transports), len(self.responders) - 1)]
+        transport = FakeTransport(respond)
+        self.transports.append(transport)
+        return transport
+
+
+def echo(request):
+    return [{'id': request['id'], 'ok': True, 'result': f" {request['source']} \n"}]
+
+
+def fail(request):
+    return [{'id': request['id'], 'ok': False, 'error': 'syntax error'}]
+
+
+def silent(request):
+    return []
+
+
+def dies(request):
+    return [EOF]
+
+
+def test_reply_is_stripped_and_session_reused():
+    factory = Factory(echo)
+    runner = ScriptRunner(factory)
+    assert runner.run('satu') == 'satu'
+    assert runner.run('dua') == 'dua'
+    assert len(factory.transports) == 1
+    assert [request['id'] for request in factory.transports[0].requests] == [1, 2]
+
+
+def test_error_reply_raises_and_keeps_session():
+    factory = Factory(fail)
+    runner = ScriptRunner(factory)
+    with pytest.raises(AppleScriptError, match='syntax error'):
+        runner.run('rusak')
+    assert not factory.transports[0].closed
+    assert runner.restarts == 0
+
+
+def test_stale_reply_is_skipped():
+    def late_then_echo(request):
+        return [{'id': request['id'] - 1, 'ok': True, 'result': 'lama'}] + echo(request)
+
+    runner = ScriptRunner(Factory(late_then_echo))
+    assert runner.run('baru') == 'baru'
+
+
+def test_timeout_kills_session_and_next_request_restarts():
+    factory = Factory(silent, echo)
+    runner = ScriptRunner(factory)
+    with pytest.raises(AppleScriptTimeout):
+        runner.run('menggantung', timeout=0.05)
+    assert factory.transports[0].closed
+    assert runner.run('lagi') == 'lagi'
+    assert len(factory.transports) == 2
+    assert runner.restarts == 1
+
+
+def test_established_session_that_dies_is_restarted():
+    answered = []
+
+    def echo_once(request):
+        if answered:
+            return [EOF]
+        answered.append(request)
+        return echo(request)
+
+    factory = Factory(echo_once, echo)
+    runner = ScriptRunner(factory)
+    assert runner.run('satu') == 'satu'
+    assert runner.run('dua') == 'dua'  # Dicoba ulang di sesi baru
+    assert len(factory.transports) == 2
+    assert runner.restarts == 1
+
+
+def test_session_that_never_answers_is_unavailable():
+    factory = Factory(dies)
+    runner = ScriptRunner(factory)
+    with pytest.raises(AppleScriptServerUnavailable):
+        runner.run('satu')
+    assert len(factory.transports) == 1  # Tidak ada retry untuk sesi yang belum pernah menjawab
+
+
+def test_restarted_session_that_dies_is_unavailable():
+    answered = []
+
+    def echo_once(request):
+        if answered:
+            return [EOF]
+        answered.append(request)
+        return echo(request)
+
+    factory = Factory(echo_once, dies)
+    runner = ScriptRunner(factory)
+    assert runner.run('satu') == 'satu'
+    with pytest.raises(AppleScriptServerUnavailable):
+        runner.run('dua')
+    assert len(factory.transports) == 2
+
+
+def test_factory_oserror_is_passed_through():
+    def missing():
+        raise FileNotFoundError("osascript")
+
+    with pytest.raises(FileNotFoundError):
+        ScriptRunner(missing).run('satu')
+
+
+def test_run_applescript_latches_one_shot_fallback(monkeypatch):
+    factory = Factory(dies)
+    once = []
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+    monkeypatch.setattr(applescript, '_shared_runner', ScriptRunner(factory))
+    monkeypatch.setattr(applescript, '_one_shot', False)
+    monkeypatch.setattr(applescript, 'run_applescript_once',
+                        lambda source, timeout: once.append(source) or 'sekali')
+    assert applescript.run_applescript('satu') == 'sekali'
+    assert applescript.run_applescript('dua') == 'sekali'
+    assert once == ['satu', 'dua']
+    assert len(factory.transports) == 1  # Server tidak di-spawn ulang setelah gagal
+
+
+ECHO_SERVER = (
+    "import json, sys\n"
+    "for line in sys.stdin:\n"
+    "    request = json.loads(line)\n"
+    "    print(json.dumps({'id': request['id'], 'ok': True, 'result': request['source'].upper()}),"
+    " flush=True)\n"
+)
+
+
+def test_process_transport_with_echo_process():
+    runner = ScriptRunner(lambda: ProcessTransport([sys.executable, '-c', ECHO_SERVER]))
+    try:
+        assert runner.run('halo') == 'HALO'
+        assert runner.run('lagi') == 'LAGI'
+        assert runner.restarts == 0
+    finally:
+        runner.close()
@@ -0,0 +1,223 @@
+"""IncrementalSummer harus memberi hasil yang persis sama dengan scan penuh sum_numbers()."""
+import random
+
+import pytest
+
+import auto_sum_parser
+from auto_sum_format import get_profile
+from auto_sum_parser import IncrementalSummer, StreamingSum, find_safe_boundary, sum_numbers
+
+ENGINES = ('fixed', 'decimal', 'kahan')
+WORDS = ('Rp', 'total', 'jumlah', 'dan', '-', '(', ')', ':', '\t', '\n', '. ', ', ')
+
+
+def random_number(rng):
+    integer = rng.randrange(0, 10 ** rng.randrange(1, 10))
+    text = f"{integer:,}".replace(',', '.')
+    if rng.random() < 0.4:
+        text += ',' + str(rng.randrange(0, 1000)).rjust(rng.randrange(1, 4), '0')
+    if rng.random() < 0.2:
+        text = '-' + text
+    return text
+
+
+def random_text(rng, tokens):
+    parts = []
+    for _ in range(tokens):
+        parts.append(random_number(rng) if rng.random() < 0.6 else rng.choice(WORDS))
+        parts.append(rng.choice((' ', ' ', '\n', '\t', '')))
+    return ''.join(parts)
+
+
+def assert_same(summer, text, engine='fixed', locale=None):
+    got = summer.sum(text)
+    expected = sum_numbers(text, engine=engine, locale=locale)
+    assert (got.count, got.total, got.rounded, got.minimum, got.maximum) == \
+        (expected.count, expected.total, expected.rounded, expected.minimum, expected.maximum)
+    return got
+
+
+def small_summer(engine='fixed', **options):
+    # Interval checkpoint kecil agar teks pendek pun punya banyak checkpoint
+    options.setdefault('min_checkpoint_interval', 16)
+    return IncrementalSummer(engine, **options)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_appended_text(engine):
+    rng = random.Random(1)
+    summer = small_summer(engine)
+    text = ''
+    for _ in range(60):
+        text += random_text(rng, rng.randrange(1, 20))
+        assert_same(summer, text, engine)
+    assert summer.reused_chars > 0
+
+
+def test_append_splits_token_at_old_end():
+    summer = small_summer()
+    assert_same(summer, "biaya 1.234")
+    assert_same(summer, "biaya 1.234.567,5")  # Token lama diperpanjang, bukan token baru
+    assert_same(summer, "biaya 1.234.567,5 dan 12")
+    assert_same(summer, "biaya 1.234.567,5 dan 12.")
+    assert_same(summer, "biaya 1.234.567,5 dan 12.345")
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_edited_suffix(engine):
+    rng = random.Random(2)
+    summer = small_summer(engine)
+    text = random_text(rng, 400)
+    assert_same(summer, text, engine)
+    for _ in range(30):
+        keep = rng.randrange(0, len(text) + 1)
+        text = text[:keep] + random_text(rng, rng.randrange(0, 60))
+        assert_same(summer, text, engine)
+
+
+def test_edit_inside_prefix_uses_earlier_checkpoint():
+    rng = random.Random(3)
+    summer = small_summer()
+    text = random_text(rng, 500)
+    assert_same(summer, text)
+    middle = len(text) // 2
+    edited = text[:middle] + ('8' if text[middle] == '9' else '9') + text[middle + 1:]
+    assert_same(summer, edited)
+    assert 0 < summer.reused_chars <= middle
+
+
+def test_shrunk_text():
+    rng = random.Random(4)
+    summer = small_summer()
+    text = random_text(rng, 500)
+    assert_same(summer, text)
+    while text:
+        text = text[:rng.randrange(0, len(text))]
+        assert_same(summer, text)
+
+
+def test_unrelated_text_after_history():
+    rng = random.Random(5)
+    summer = small_summer()
+    assert_same(summer, random_text(rng, 300))
+    assert_same(summer, random_text(rng, 300))
+    assert_same(summer, '')
+    assert_same(summer, 'tidak ada angka')
+
+
+@pytest.mark.parametrize('max_checkpoints', (5, 8))
+def test_long_text_thins_checkpoints(max_checkpoints):
+    rng = random.Random(6)
+    summer = small_summer(max_checkpoints=max_checkpoints)
+    text = random_text(rng, 2000)
+    assert_same(summer, text)
+    for _ in range(30):
+        previous = text
+        text += random_text(rng, rng.randrange(20, 600))
+        assert_same(summer, text)
+        assert len(summer._checkpoints) <= max_checkpoints
+        # Checkpoint terakhir (batas aman paling akhir) tetap ada setelah dijarangkan
+        assert summer.reused_chars == find_safe_boundary(previous, len(previous))
+
+
+def test_text_over_history_limit_is_not_kept():
+    rng = random.Random(7)
+    summer = small_summer(max_text_chars=1000)
+    text = random_text(rng, 1000)
+    assert len(text) > 1000
+    assert_same(summer, text)
+    assert_same(summer, text + ' 1.000')
+    assert summer.reused_chars == 0
+
+
+def test_long_token_without_safe_boundary():
+    summer = small_summer()
+    text = '1' * 500
+    assert_same(summer, text)
+    assert_same(summer, text + '2' * 500)
+    assert_same(summer, text + '2' * 500 + ' 3')
+
+
+@pytest.mark.parametrize('name', ('us', 'ch', 'in'))
+def test_other_locales(name):
+    locale = get_profile(name)
+    rng = random.Random(8)
+    summer = small_summer(locale=locale)
+    text = ''
+    for _ in range(30):
+        number = rng.randrange(0, 10 ** 9)
+        text += f" {locale.format(number)}{locale.decimal}{rng.randrange(10, 99)} x"
+        assert_same(summer, text, locale=locale)
+    assert_same(summer, text[:len(text) // 2], locale=locale)
+
+
+def stream(text, chunk_bytes, locale=None):
+    summer = StreamingSum(locale=locale)
+    data = text.encode('utf-8')
+    for start in range(0, len(data), chunk_bytes):
+        summer.feed(data[start:start + chunk_bytes])
+    return summer.finish()
+
+
+def same_result(got, expected):
+    return (got.count, got.total, got.minimum, got.maximum) == \
+        (expected.count, expected.total, expected.minimum, expected.maximum)
+
+
+LINELESS = (
+    ','.join(str(i) for i in range(12, 3000)),   # Satu token tidak valid raksasa
+    '-'.join(str(i) for i in range(12, 3000)),   # Banyak token tanpa spasi
+    '1' * 5000 + ',5-3 7',
+    '1.234' * 2000 + ' 5',
+    "'" + '9' * 3000 + '-2',
+    'x' + '1.000' * 1000 + 'x 12.345,6',
+    '12,,' + '3' * 1000,                         # Token valid di awal deretan panjang
+    '1.234,56..' + '9' * 1000,
+    '-7..' + '1,' * 600 + ' 4',
+)
+
+
+@pytest.mark.parametrize('text', LINELESS)
+@pytest.mark.parametrize('chunk_bytes', (1, 7, 1000, 1 << 20))
+def test_streaming_matches_full_scan_with_bounded_carry(monkeypatch, text, chunk_bytes):
+    monkeypatch.setattr(auto_sum_parser, 'CARRY_LIMIT_CHARS', 700)
+    assert same_result(stream(text, chunk_bytes), sum_numbers(text))
+    for name in ('us', 'ch'):
+        locale = get_profile(name)
+        assert same_result(stream(text, chunk_bytes, locale), sum_numbers(text, locale=locale))
+
+
+def test_streaming_random_token_soup(monkeypatch):
+    monkeypatch.setattr(auto_sum_parser, 'CARRY_LIMIT_CHARS', 700)
+    rng = random.Random(9)
+    for _ in range(100):
+        text = ''.join(rng.choice("0123456789.,-+' x\n") if rng.random() < 0.05 else rng.choice('0123456789.,')
+                       for _ in range(rng.randrange(1, 3000)))
+        expected = sum_numbers(text)
+        for chunk_bytes in (3, 500):
+            assert same_result(stream(text, chunk_bytes), expected)
+
+
+
+def test_incremental_large_text_reaches_bulk_path(monkeypatch):
+    import auto_sum_numpy
+    if not auto_sum_numpy.available():
+        pytest.skip("NumPy not installed")
+    monkeypatch.setattr(auto_sum_parser, 'BULK_THRESHOLD_CHARS', 20_000)
+    bulk_chars = []
+    scan_bulk = auto_sum_numpy.scan_bulk
+
+    def counting_scan_bulk(scanner, text, start, end, scan_python):
+        bulk_chars.append(end - start)
+        return scan_bulk(scanner, text, start, end, scan_python)
+
+    monkeypatch.setattr(auto_sum_numpy, 'scan_bulk', counting_scan_bulk)
+    text = random_text(random.Random(5), 30_000)
+    expected = sum_numbers(text)
+    bulk_chars.clear()
+    summer = IncrementalSummer('fixed')
+    assert same_result(summer.sum(text), expected)
+    # Hampir seluruh teks lewat jalur NumPy, bukan potongan kecil di bawah ambang
+    assert sum(bulk_chars) > len(text) * 0.9
+    assert_same(summer, text + ' 7')
+    assert summer.reused_chars > len(text) - 100
@@ -0,0 +1,121 @@
+"""Tes PasteCoordinator dengan MemoryClipboard (tanpa Cocoa/osascript)."""
+import threading
+
+from auto_sum_clipboard import ClipboardWatcher, MemoryClipboard
+from auto_sum_paste import PasteCoordinator
+
+
+def test_paste_confirms_write_then_sends_keystroke():
+    clipboard = MemoryClipboard("1 2 3", write_lag=3)
+    seen = []
+    paster = PasteCoordinator(clipboard, lambda: seen.append(clipboard.read()))
+    assert paster.paste("6")
+    assert seen == ["6"]
+    assert paster.is_own_token(clipboard.probe())
+
+
+def test_is_own_token_does_not_wait_for_keystroke():
+    clipboard = MemoryClipboard("1 2 3")
+    sending = threading.Event()
+    release = threading.Event()
+
+    def slow_send_paste():
+        sending.set()
+        release.wait(5)
+
+    paster = PasteCoordinator(clipboard, slow_send_paste)
+    worker = threading.Thread(target=paster.paste, args=("6",))
+    worker.start()
+    try:
+        assert sending.wait(5)
+        answered = []
+        checker = threading.Thread(target=lambda: answered.append(
+            paster.is_own_token(clipboard.probe())))
+        checker.start()
+        checker.join(1)
+        # Thread utama tidak boleh tertahan selama keystroke dikirim
+        assert answered == [True]
+    finally:
+        release.set()
+        worker.join(5)
+    assert paster.pastes == 1
+
+
+def test_restore_after_paste():
+    clipboard = MemoryClipboard("1 2 3")
+    paster = PasteCoordinator(clipboard, lambda: None, restore=True, restore_delay=0)
+    watcher = ClipboardWatcher(clipboard, is_own=paster.is_own_token)
+    watcher.reset()
+    assert paster.paste("6")
+    assert clipboard.read() == "1 2 3"
+    assert paster.restores == 1
+    assert watcher.poll() is None
+
+
+def test_paste_during_keystroke_keeps_original_for_restore():
+    clipboard = MemoryClipboard("asli")
+    paster = PasteCoordinator(clipboard, lambda: None, restore=True, restore_delay=60)
+    calls = []
+
+    def send_paste():
+        # Paste kedua masuk selagi keystroke pertama dikirim
+        if not calls:
+            calls.append(1)
+            assert paster.paste("20")
+
+    paster.send_paste = send_paste
+    try:
+        assert paster.paste("10")
+    finally:
+        paster.flush()
+    assert clipboard.read() == "asli"
+    assert paster.restores == 1
+
+
+class ContentClipboard(MemoryClipboard):
+    """Seperti PyperclipClipboard: token diturunkan dari isi, bukan change counter."""
+
+    has_change_count = False
+
+    def probe(self):
+        text = self.read()
+        return (len(text), hash(text))
+
+
+def test_content_tokens_do_not_hide_later_copies():
+    clipboard = ContentClipboard("1 2 3")
+    paster = PasteCoordinator(clipboard, lambda: None, restore=True, restore_delay=0)
+    watcher = ClipboardWatcher(clipboard, is_own=paster.is_own_token)
+    watcher.reset()
+    assert paster.paste("6")
+    assert watcher.poll() is None  # Isi asli sudah dikembalikan: tidak ada perubahan
+    clipboard.write("4 5")
+    assert watcher.poll() == "4 5"
+    clipboard.write("1 2 3")
+    assert watcher.poll() == "1 2 3"
+
+
+def test_content_token_suppresses_only_next_change():
+    clipboard = ContentClipboard("1 2 3")
+    paster = PasteCoordinator(clipboard, lambda: None, restore=True, restore_delay=60)
+    watcher = ClipboardWatcher(clipboard, is_own=paster.is_own_token)
+    watcher.reset()
+    assert paster.paste("6")
+    assert watcher.poll() is None  # Jumlah yang kita tulis
+    paster.flush()
+    assert watcher.poll() is None  # Isi asli yang kita kembalikan
+    for text in ("6", "1 2 3", "6"):
+        clipboard.write(text)
+        assert watcher.poll() == text
+
+
+def test_content_token_dropped_when_user_overwrites_first():
+    clipboard = ContentClipboard("1 2 3")
+    paster = PasteCoordinator(clipboard, lambda: None)
+    watcher = ClipboardWatcher(clipboard, is_own=paster.is_own_token)
+    watcher.reset()
+    assert paster.copy("6")
+    clipboard.write("7 8")  # Pengguna menyalin sebelum tulisan kita terlihat
+    assert watcher.poll() == "7 8"
+    clipboard.write("6")
+    assert watcher.poll() == "6"
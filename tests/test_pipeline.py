@@ -0,0 +1,91 @@
+"""Tes SumPipeline: job dijalankan di thread worker, termasuk total kolom dari menu."""
+import threading
+import time
+
+from auto_sum_format import format_number_indonesian
+from auto_sum_pipeline import (ACTION_COPIED, ACTION_PASTED, ClipboardProcessor,
+                               SumPipeline)
+from auto_sum_table import sum_table
+
+TARGET = 'Microsoft Word'
+TABLE = "Nama\tJumlah\tHarga\nA\t10\t1.000\nB\t20\t2.500\nC\t30\t4.000\n"
+
+
+class Recorder(object):
+    """Mencatat thread pemanggil setiap efek samping."""
+
+    def __init__(self, front_app):
+        self.front_app = front_app
+        self.calls = []
+
+    def get_front_app(self):
+        self.calls.append(('front', threading.current_thread().name))
+        return self.front_app
+
+    def paste_text(self, text):
+        self.calls.append(('paste', text, threading.current_thread().name))
+        return True
+
+    def copy_text(self, text):
+        self.calls.append(('copy', text, threading.current_thread().name))
+        return True
+
+
+def make_pipeline(recorder):
+    processor = ClipboardProcessor(recorder.get_front_app, recorder.paste_text,
+                                   recorder.copy_text, format_number_indonesian, TARGET,
+                                   table_mode=True)
+    pipeline = SumPipeline(processor)
+    pipeline.start()
+    return pipeline
+
+
+def wait_for_results(pipeline, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pipeline.busy and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return pipeline.drain()
+
+
+def test_submit_text_copies_sum_on_worker():
+    recorder = Recorder('Finder')
+    pipeline = make_pipeline(recorder)
+    try:
+        pipeline.submit("1.000 dan 2.500")
+        [job] = wait_for_results(pipeline)
+    finally:
+        pipeline.stop(timeout=5)
+    assert job.action == ACTION_COPIED
+    assert job.formatted == '3.500'
+    assert recorder.calls[-1] == ('copy', '3.500', 'auto-sum-worker')
+
+
+def test_submit_column_pastes_on_worker():
+    recorder = Recorder(TARGET)
+    pipeline = make_pipeline(recorder)
+    column = sum_table(TABLE).pick('Harga')
+    try:
+        pipeline.submit_column(column)
+        [job] = wait_for_results(pipeline)
+    finally:
+        pipeline.stop(timeout=5)
+    assert job.action == ACTION_PASTED
+    assert job.table is None and job.column is column
+    assert job.formatted == '7.500'
+    assert pipeline.is_own_write('7.500')
+    # Cek aplikasi terdepan dan paste tidak pernah menyentuh thread pemanggil
+    assert {call[-1] for call in recorder.calls} == {'auto-sum-worker'}
+
+
+def test_submit_column_replaces_pending_text_job():
+    recorder = Recorder('Finder')
+    pipeline = make_pipeline(recorder)
+    column = sum_table(TABLE).pick('Jumlah')
+    try:
+        pipeline.submit("1 2 3")
+        pipeline.submit_column(column)
+        results = wait_for_results(pipeline)
+    finally:
+        pipeline.stop(timeout=5)
+    assert [job.formatted for job in results] == ['60']
+    assert results[0].action == ACTION_COPIED
@@ -0,0 +1,53 @@
+"""Protokol auto_sum_server.py lewat socket Unix sungguhan."""
+import asyncio
+import json
+import os
+import tempfile
+
+import pytest
+
+from auto_sum_format import json_float
+from auto_sum_server import SumServer
+
+
+async def exchange(payload, max_payload=1024):
+    with tempfile.TemporaryDirectory() as directory:
+        server = await SumServer(os.path.join(directory, 'sum.sock'), max_payload=max_payload).start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(server.path)
+            writer.write(payload)
+            writer.write_eof()
+            lines = [json.loads(line) async for line in reader]
+            writer.close()
+            return lines
+        finally:
+            await server.close()
+
+
+def run(payload, **options):
+    return asyncio.run(exchange(payload, **options))
+
+
+def test_line_and_len_requests_answered_in_order():
+    responses = run(b"1.000 dan 2.500\nLEN 7\n3\n4,5\n\n12\n")
+    assert [r['id'] for r in responses] == [1, 2, 3]
+    assert [r['formatted'] for r in responses] == ['3.500', '8', '12']
+
+
+@pytest.mark.parametrize('header', (b"LEN -1\n", b"LEN x\n"))
+def test_invalid_len_header_is_rejected(header):
+    responses = run(header + b"1.000\n")
+    assert responses == [{'id': 1, 'ok': False, 'error': "invalid LEN header"}]
+
+
+def test_oversized_len_is_discarded_and_connection_continues():
+    responses = run(b"LEN 2000\n" + b"1" * 2000 + b"5\n")
+    assert not responses[0]['ok']
+    assert responses[1]['formatted'] == '5'
+
+
+def test_json_float_drops_non_finite_values():
+    assert json_float(float('inf')) is None
+    assert json_float(float('nan')) is None
+    assert json_float(-2.5) == -2.5
+    assert json_float(None) is None
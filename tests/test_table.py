@@ -0,0 +1,87 @@
+"""Tes heuristik TableSummer: header, baris total, nomor urut, tahun dan ID."""
+from auto_sum_table import (KIND_ID, KIND_INDEX, KIND_NUMERIC, KIND_TEXT, KIND_YEAR,
+                            looks_tabular, sum_table)
+
+
+def totals(table):
+    return {column.name: (column.kind, column.result.total if column.result else None)
+            for column in table.columns}
+
+
+def test_text_header_becomes_labels():
+    table = sum_table("Nama\tHarga\tStok\nA\t1.000\t5\nB\t2.500,5\t7\n")
+    assert table.header_rows == 1 and table.rows == 2
+    assert [column.label for column in table.columns] == ['Nama', 'Harga', 'Stok']
+    assert table.pick('harga').result.total == 3500.5
+    assert table.pick().result.total == 3512.5
+
+
+def test_year_header_row():
+    table = sum_table("Produk\t2023\t2024\nA\t10\t20\nB\t1\t2\n")
+    assert table.header_rows == 1
+    assert [column.label for column in table.columns] == ['Produk', '2023', '2024']
+    assert table.pick('2024').result.total == 22
+    assert table.pick().result.total == 33
+
+
+def test_single_year_value_is_data_not_header():
+    table = sum_table("Nama\tHarga\nA\t2000\nB\t1950\nC\t2100\n")
+    assert table.header_rows == 1 and table.rows == 3
+    assert table.pick().result.total == 6050
+
+
+def test_rows_with_one_year_value_are_data():
+    table = sum_table("A\t2000\t5\nB\t1950\t9\nC\t2100\t7\n")
+    assert table.header_rows == 0 and table.rows == 3
+    # Tanpa header, kolom yang isinya tahun semua tetap dianggap kolom tahun
+    assert totals(table)['Kolom 2'] == (KIND_YEAR, 6050)
+    assert table.pick().result.total == 21
+
+
+def test_oversized_header_candidate_cell_does_not_raise():
+    table = sum_table("Nama\t" + "1" * 5000 + "\nA\t5\n")
+    assert table.header_rows == 0
+    assert table.pick().result.total == 5
+
+
+def test_total_row_skipped():
+    table = sum_table("Nama\tHarga\nA\t100\nB\t200\nTotal\t300\n")
+    assert table.summary_rows == 1 and table.rows == 2
+    assert table.pick().result.total == 300
+
+
+def test_index_column_without_header_skipped():
+    table = sum_table("1\tA\t100\n2\tB\t200\n3\tC\t300\n")
+    kinds = [column.kind for column in table.columns]
+    assert kinds == [KIND_INDEX, KIND_TEXT, KIND_NUMERIC]
+    assert table.pick().result.total == 600
+
+
+def test_year_column_without_header_skipped():
+    table = sum_table("2021\t100\n2023\t200\n2022\t300\n")
+    assert [column.kind for column in table.columns] == [KIND_YEAR, KIND_NUMERIC]
+    assert table.pick().result.total == 600
+
+
+def test_id_header_columns_skipped():
+    table = sum_table("No\tKode\tNilai\n5\t1001\t10\n9\t1002\t20\n")
+    assert totals(table) == {'No': (KIND_ID, 14), 'Kode': (KIND_ID, 2003),
+                             'Nilai': (KIND_NUMERIC, 30)}
+    assert table.pick().result.total == 30
+
+
+def test_row_sums_leave_out_id_columns():
+    table = sum_table("ID\tA\tB\n7\t1\t2\n8\t3\t4\n", row_sums=True)
+    assert table.row_totals == [3, 7]
+
+
+def test_looks_tabular():
+    assert looks_tabular("a\t1\nb\t2\n")
+    assert not looks_tabular("1 2 3\n4 5 6\n")
+    assert not looks_tabular("a\t1\n")
+
+
+def test_sequence_under_value_header_is_summed():
+    table = sum_table("Barang\tQty\nA\t1\nB\t2\nC\t3\n")
+    assert totals(table)['Qty'] == (KIND_NUMERIC, 6)
+    assert table.pick().result.total == 6